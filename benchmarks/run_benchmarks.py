@@ -0,0 +1,303 @@
+"""
+Benchmark-Suite für die Rechen-, Lookup- und Zeichenpfade.
+
+Misst:
+    - ElectrochemicalSeries.get_element_data / get_element_names bei 16, 1k und 10k Spezies
+    - Nernst/ΔG skalar (Schleife) vs. Batch (NumPy), ideal und mit Aktivitätskorrektur (Davies)
+    - BatterySimulation-Konstruktion (direkt und über den SimulationCache)
+    - redraw_canvas gegen eine aufzeichnende Ersatz-Canvas (kein Display nötig)
+
+Ergebnisse werden als JSON geschrieben, damit Regressionen zwischen Commits verglichen werden können:
+    python benchmarks/run_benchmarks.py -o bench.json
+    python benchmarks/run_benchmarks.py --quick --only series
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import numpy as np  # noqa: E402
+
+from activity import ActivityModel  # noqa: E402
+from simulation import BatterySimulation, SimulationCache  # noqa: E402
+from utils import ElectrochemicalSeries  # noqa: E402
+
+SERIES_SIZES = (16, 1_000, 10_000)
+BATCH_SIZE = 100_000
+
+
+def measure(func, number: int, repeat: int) -> dict:
+    """Führt `func` number-mal pro Durchlauf aus; Kennzahl ist der schnellste Durchlauf (pro Aufruf)."""
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    per_call = [t / number for t in timings]
+    best = min(per_call)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best_s": best,
+        "mean_s": sum(per_call) / len(per_call),
+        "ops_per_s": 1.0 / best if best > 0 else None,
+    }
+
+
+def make_series(size: int) -> ElectrochemicalSeries:
+    """Eingebaute Tabelle, aufgefüllt mit synthetischen Spezies bis `size` Einträge."""
+    series = ElectrochemicalSeries()
+    rng = np.random.default_rng(size)
+    extra = size - len(series)
+    if extra > 0:
+        potentials = rng.uniform(-3.0, 2.0, extra).round(3)
+        electrons = rng.integers(1, 4, extra)
+        series.add_entries([
+            {"element": f"X{i}", "reaction": f"X{i}{n}+ + {n}e- -> X{i}", "E0": float(e0), "n": int(n),
+             "ion_formula": f"X{i}{n}+", "color": "#C0C0C0"}
+            for i, (e0, n) in enumerate(zip(potentials, electrons))
+        ])
+    return series
+
+
+def bench_series(quick: bool) -> dict:
+    results = {}
+    for size in SERIES_SIZES:
+        series = make_series(size)
+        names = series.get_element_names()
+        probe = names[:: max(1, len(names) // 64)]
+
+        def lookup():
+            for name in probe:
+                series.get_element_data(name)
+
+        number = 200 if quick else 2000
+        lookup_stats = measure(lookup, number, 3 if quick else 5)
+        # Pro einzelner Abfrage normieren
+        for key in ("best_s", "mean_s"):
+            lookup_stats[key] /= len(probe)
+        lookup_stats["ops_per_s"] = 1.0 / lookup_stats["best_s"]
+        results[str(size)] = {
+            "get_element_data": lookup_stats,
+            "get_element_names": measure(series.get_element_names, 20 if quick else 200, 3 if quick else 5),
+        }
+    return results
+
+
+def bench_nernst(quick: bool) -> dict:
+    series = ElectrochemicalSeries()
+    sim = BatterySimulation(series.get_element_data("Cu"), series.get_element_data("Zn"))
+    size = BATCH_SIZE // 10 if quick else BATCH_SIZE
+    rng = np.random.default_rng(0)
+    conc_anode = rng.uniform(1e-4, 5.0, size)
+    conc_cathode = rng.uniform(1e-4, 5.0, size)
+    temperature = rng.uniform(273.15, 373.15, size)
+    scalar_inputs = list(zip(conc_anode.tolist(), conc_cathode.tolist(), temperature.tolist()))
+
+    def scalar():
+        for ca, cc, t in scalar_inputs:
+            log_q = sim.get_log_reaction_quotient(ca, cc, t)
+            e = sim.get_nernst_voltage_from_log_q(log_q, t)
+            -sim.n_overall * 96485 * e
+
+    def batch():
+        sim.get_nernst_voltage_batch(conc_anode, conc_cathode, temperature)
+
+    activity_sim = BatterySimulation(series.get_element_data("Cu"), series.get_element_data("Zn"),
+                                     activity_model=ActivityModel("davies"))
+
+    def batch_activity():
+        activity_sim.get_nernst_voltage_batch(conc_anode, conc_cathode, temperature)
+
+    repeat = 3 if quick else 5
+    scalar_stats = measure(scalar, 1, repeat)
+    batch_stats = measure(batch, 5, repeat)
+    activity_stats = measure(batch_activity, 5, repeat)
+    return {
+        "points": size,
+        "scalar": {**scalar_stats, "points_per_s": size / scalar_stats["best_s"]},
+        "batch": {**batch_stats, "points_per_s": size / batch_stats["best_s"]},
+        "batch_activity_davies": {**activity_stats, "points_per_s": size / activity_stats["best_s"]},
+        "speedup": scalar_stats["best_s"] / batch_stats["best_s"],
+        "activity_slowdown": activity_stats["best_s"] / batch_stats["best_s"],
+    }
+
+
+def bench_construction(quick: bool) -> dict:
+    series = ElectrochemicalSeries()
+    anode, cathode = series.get_element_data("Zn"), series.get_element_data("Cu")
+    cache = SimulationCache(series)
+    number = 2000 if quick else 20000
+    repeat = 3 if quick else 5
+    return {
+        "direct": measure(lambda: BatterySimulation(cathode, anode), number, repeat),
+        "cached": measure(lambda: cache.get("Zn", "Cu"), number, repeat),
+        "cache_info": cache.cache_info()._asdict(),
+    }
+
+
+class RecordingCanvas:
+    """Ersatz für tk.Canvas: zeichnet alle Aufrufe auf, statt zu rendern."""
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.calls: list[tuple] = []
+        self._next_id = 1
+
+    def winfo_width(self) -> int:
+        return self.width
+
+    def winfo_height(self) -> int:
+        return self.height
+
+    def _create(self, kind, *args, **kwargs) -> int:
+        item = self._next_id
+        self._next_id += 1
+        self.calls.append((kind, item, args, kwargs))
+        return item
+
+    def create_rectangle(self, *args, **kwargs) -> int:
+        return self._create("rectangle", *args, **kwargs)
+
+    def create_line(self, *args, **kwargs) -> int:
+        return self._create("line", *args, **kwargs)
+
+    def create_text(self, *args, **kwargs) -> int:
+        return self._create("text", *args, **kwargs)
+
+    def delete(self, *args) -> None:
+        self.calls.append(("delete", args))
+
+    def coords(self, item, *coords) -> None:
+        self.calls.append(("coords", item, coords))
+
+    def itemconfigure(self, item, **options) -> None:
+        self.calls.append(("itemconfigure", item, options))
+
+
+class _Var:
+    """Minimaler Ersatz für tk.StringVar."""
+    def __init__(self, value: str = "") -> None:
+        self.value = value
+
+    def get(self) -> str:
+        return self.value
+
+    def set(self, value: str) -> None:
+        self.value = value
+
+
+def make_headless_app(width: int = 800, height: int = 500):
+    """Baut eine BatteryApp ohne Tk-Fenster, die nur für redraw_canvas ausreicht."""
+    from gui import BatteryApp
+
+    app = BatteryApp.__new__(BatteryApp)
+    app.canvas = RecordingCanvas(width, height)
+    app.canvas_items = {}
+    app._canvas_item_state = {}
+    app.series_data = ElectrochemicalSeries()
+    app.anode_var = _Var("Zn")
+    app.cathode_var = _Var("Cu")
+    app.nernst_var = _Var("E_Nernst: 1.1000 V")
+    app.anode_reaction_var = _Var("Zn -> Zn2+ + 2e-")
+    app.cathode_reaction_var = _Var("Cu2+ + 2e- -> Cu")
+    app.current_conc_anode = 1.0
+    app.current_conc_cathode = 1.0
+    return app
+
+
+def bench_redraw(quick: bool) -> dict:
+    number = 200 if quick else 2000
+    repeat = 3 if quick else 5
+
+    def first_draw():
+        app = make_headless_app()
+        app.redraw_canvas()
+        return app
+
+    app = first_draw()
+    scene_calls = len(app.canvas.calls)
+
+    # Unveränderter Zustand: es sollten keine Canvas-Aufrufe anfallen
+    app.canvas.calls.clear()
+    app.redraw_canvas()
+    unchanged_calls = len(app.canvas.calls)
+
+    sizes = [(800 + (i % 7) * 10, 500 + (i % 5) * 10) for i in range(16)]
+    state = {"i": 0}
+
+    def resize():
+        width, height = sizes[state["i"] % len(sizes)]
+        state["i"] += 1
+        app.canvas.width, app.canvas.height = width, height
+        app.redraw_canvas()
+
+    app.canvas.calls.clear()
+    resize_stats = measure(resize, number, repeat)
+    resize_calls = len(app.canvas.calls) / (number * repeat)
+    app.canvas.calls.clear()
+    return {
+        "build_scene": {**measure(first_draw, max(1, number // 10), repeat), "canvas_calls": scene_calls},
+        "redraw_unchanged": {**measure(app.redraw_canvas, number, repeat), "canvas_calls": unchanged_calls},
+        "redraw_resize": {**resize_stats, "canvas_calls_per_redraw": resize_calls},
+    }
+
+
+BENCHMARKS = {
+    "series": bench_series,
+    "nernst": bench_nernst,
+    "construction": bench_construction,
+    "redraw": bench_redraw,
+}
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(names=None, quick: bool = False) -> dict:
+    results = {}
+    for name in names or BENCHMARKS:
+        start = time.perf_counter()
+        results[name] = BENCHMARKS[name](quick)
+        print(f"{name}: {time.perf_counter() - start:.2f} s", file=sys.stderr)
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark-Suite (Ausgabe als JSON).")
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: stdout)")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Nur ausgewählte Benchmarks")
+    parser.add_argument("--quick", action="store_true", help="Weniger Wiederholungen (schneller, ungenauer)")
+    args = parser.parse_args(argv)
+
+    report = run(args.only, args.quick)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,38 +1,243 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
 import pubchempy as pcp
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from material_cache import MaterialCache
+
+PUBCHEM_BASE_URL = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
+
+MATERIAL_PROPERTIES = [
+    "molecular_formula", "molecular_weight", "canonical_smiles", "inchi", "iupac_name",
+    "xlogp", "exact_mass", "monoisotopic_mass", "tpsa", "complexity", "h_bond_donor_count",
+    "h_bond_acceptor_count", "rotatable_bond_count", "heavy_atom_count", "isotope_atom_count",
+    "atom_stereo_count", "defined_atom_stereo_count", "undefined_atom_stereo_count",
+    "bond_stereo_count", "defined_bond_stereo_count", "undefined_bond_stereo_count",
+    "covalent_unit_count"
+]
+
+# Zuordnung der pubchempy-Attributnamen zu den Property-Namen der PUG-REST-API
+PUG_PROPERTY_NAMES = {
+    "molecular_formula": "MolecularFormula", "molecular_weight": "MolecularWeight",
+    "canonical_smiles": "CanonicalSMILES", "inchi": "InChI", "iupac_name": "IUPACName",
+    "xlogp": "XLogP", "exact_mass": "ExactMass", "monoisotopic_mass": "MonoisotopicMass",
+    "tpsa": "TPSA", "complexity": "Complexity", "h_bond_donor_count": "HBondDonorCount",
+    "h_bond_acceptor_count": "HBondAcceptorCount", "rotatable_bond_count": "RotatableBondCount",
+    "heavy_atom_count": "HeavyAtomCount", "isotope_atom_count": "IsotopeAtomCount",
+    "atom_stereo_count": "AtomStereoCount", "defined_atom_stereo_count": "DefinedAtomStereoCount",
+    "undefined_atom_stereo_count": "UndefinedAtomStereoCount", "bond_stereo_count": "BondStereoCount",
+    "defined_bond_stereo_count": "DefinedBondStereoCount",
+    "undefined_bond_stereo_count": "UndefinedBondStereoCount", "covalent_unit_count": "CovalentUnitCount",
+}
+# Von der REST-API teils als String gelieferte Massen
+_FLOAT_PROPERTIES = ("molecular_weight", "exact_mass", "monoisotopic_mass")
+
 
 class BatteryMaterial:
-    def __init__(self, name):
+    def __init__(self, name, data=None, cache=None, offline=False):
+        """
+        :param name: Name des Materials (PubChem-Suche über den Namen)
+        :param data: Bereits geladene Eigenschaften (z. B. aus dem parallelen Abruf); dann kein eigener Request
+        :param cache: Optionaler `MaterialCache`; Treffer ersetzen den PubChem-Abruf
+        :param offline: Nur aus dem Cache lesen, keine Netzwerkzugriffe
+        """
         self.name = name
-        self.properties = [
-            "molecular_formula", "molecular_weight", "canonical_smiles", "inchi", "iupac_name", 
-            "xlogp", "exact_mass", "monoisotopic_mass", "tpsa", "complexity", "h_bond_donor_count", 
-            "h_bond_acceptor_count", "rotatable_bond_count", "heavy_atom_count", "isotope_atom_count", 
-            "atom_stereo_count", "defined_atom_stereo_count", "undefined_atom_stereo_count", 
-            "bond_stereo_count", "defined_bond_stereo_count", "undefined_bond_stereo_count", 
-            "covalent_unit_count"
-        ]
+        self.properties = list(MATERIAL_PROPERTIES)
         self.data = {}
-        self._get_material_data()
+        if data is None:
+            self._get_material_data(cache, offline)
+        elif data:
+            self._set_data(data)
+
+    def _set_data(self, data):
+        self.data = {prop: data.get(prop) for prop in self.properties}
+        self.data["name"] = self.name
 
-    def _get_material_data(self):
+    def _get_material_data(self, cache=None, offline=False):
+        if cache is not None:
+            cached = cache.get(self.name)
+            if cached is not None:
+                if cached:
+                    self._set_data(cached)
+                else:
+                    print(f"Material {self.name} nicht gefunden.")
+                return
+        if offline:
+            print(f"Material {self.name} nicht im Cache (Offline-Modus).")
+            return
         try:
             compound = pcp.get_compounds(self.name, namespace='name')[0]
             self.data = {prop: getattr(compound, prop, None) for prop in self.properties}
             self.data["name"] = self.name
         except IndexError:
             print(f"Material {self.name} nicht gefunden.")
+        if cache is not None:
+            cache.put(self.name, {prop: self.data.get(prop) for prop in self.properties} if self.data else {})
 
     def get_data(self):
         return self.data
 
 
-def get_battery_material_data(materials):
-    material_objects = [BatteryMaterial(material) for material in materials]
+class PubChemClient:
+    """
+    Schlanker PUG-REST-Client für den parallelen Abruf vieler Materialien.
+
+    - Eine `requests.Session` mit Connection-Pool wird von allen Threads geteilt (Keep-Alive).
+    - Namen werden parallel (begrenzter Thread-Pool) in CIDs aufgelöst, die Eigenschaften
+      anschließend gebündelt per POST für bis zu `batch_size` CIDs gleichzeitig geladen.
+    - Temporäre Fehler (429, 5xx, Verbindungsabbrüche) werden mit exponentiellem Backoff wiederholt.
+
+    `base_url` ist konfigurierbar, z. B. für einen lokalen Test-Server.
+    """
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(self, base_url=PUBCHEM_BASE_URL, max_workers=5, batch_size=100, max_retries=4,
+                 backoff=0.5, timeout=30, session=None):
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _request(self, method, path, data=None):
+        """Führt einen Request mit Retry/Backoff aus; gibt das JSON zurück oder None bei 404 (nicht gefunden)."""
+        url = f"{self.base_url}/{path}"
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.request(method, url, data=data, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+            else:
+                if response.status_code == 404:
+                    return None
+                if response.status_code not in self.RETRY_STATUS:
+                    response.raise_for_status()
+                    return response.json()
+                if attempt == self.max_retries:
+                    response.raise_for_status()
+                retry_after = response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    time.sleep(int(retry_after))
+                    continue
+            # Exponentielles Backoff mit Jitter, damit parallele Threads nicht gleichzeitig wiederholen
+            time.sleep(self.backoff * (2 ** attempt) * (1 + random.random()))
+        return None
+
+    def get_cid(self, name, namespace="name"):
+        """Löst einen Namen (bzw. Bezeichner im gegebenen Namespace) in die erste passende CID auf."""
+        result = self._request("GET", f"compound/{namespace}/{quote(name, safe='')}/cids/JSON")
+        cids = (result or {}).get("IdentifierList", {}).get("CID", [])
+        return cids[0] if cids else None
+
+    def get_properties(self, cids, properties=MATERIAL_PROPERTIES):
+        """Lädt Eigenschaften für viele CIDs gebündelt; gibt {cid: {property: Wert}} zurück."""
+        pug_names = [PUG_PROPERTY_NAMES[prop] for prop in properties]
+        path = f"compound/cid/property/{','.join(pug_names)}/JSON"
+        unique_cids = list(dict.fromkeys(cids))
+        batches = [unique_cids[i:i + self.batch_size] for i in range(0, len(unique_cids), self.batch_size)]
+
+        def fetch_batch(batch):
+            result = self._request("POST", path, data={"cid": ",".join(str(cid) for cid in batch)})
+            return (result or {}).get("PropertyTable", {}).get("Properties", [])
+
+        by_cid = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for rows in executor.map(fetch_batch, batches):
+                for row in rows:
+                    values = {prop: row.get(PUG_PROPERTY_NAMES[prop]) for prop in properties}
+                    for prop in _FLOAT_PROPERTIES:
+                        if isinstance(values.get(prop), str):
+                            try:
+                                values[prop] = float(values[prop])
+                            except ValueError:
+                                pass
+                    by_cid[row["CID"]] = values
+        return by_cid
+
+    def fetch_materials(self, names, namespace="name", properties=MATERIAL_PROPERTIES):
+        """
+        Lädt die Eigenschaften vieler Materialien parallel.
+        Gibt {name: {property: Wert}} zurück; nicht gefundene Materialien erhalten ein leeres Dict,
+        Materialien mit CID, deren Eigenschaften nicht geladen werden konnten (z. B. 404 auf den
+        Batch-POST), None.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            cids = list(executor.map(lambda name: self.get_cid(name, namespace), names))
+        properties_by_cid = self.get_properties([cid for cid in cids if cid is not None], properties)
+        return {name: properties_by_cid.get(cid) if cid is not None else {} for name, cid in zip(names, cids)}
+
+
+def get_battery_material_data(materials, concurrent=False, client=None, max_workers=5, cache=None, offline=False):
+    """
+    Baut einen DataFrame mit den PubChem-Eigenschaften der Materialien.
+
+    :param concurrent: True = paralleler Abruf über `PubChemClient` (gebündelt, mit Retry),
+                       False = sequentiell über pubchempy wie bisher
+    :param client: Optionaler `PubChemClient` (z. B. mit eigener base_url); impliziert concurrent=True
+    :param cache: Optionaler `MaterialCache`; nur fehlende Materialien werden abgerufen und danach gecacht
+                  (außer solchen, deren Eigenschaften nicht geladen werden konnten)
+    :param offline: Nur aus dem Cache lesen (erfordert `cache`), keine Netzwerkzugriffe
+    """
+    materials = list(materials)
+    if offline and cache is None:
+        raise ValueError("Offline-Modus erfordert einen MaterialCache.")
+
+    known = cache.get_many(materials) if cache is not None else {}
+    missing = [material for material in dict.fromkeys(materials) if material not in known]
+
+    if missing and not offline:
+        if concurrent or client is not None:
+            own_client = client is None
+            client = client or PubChemClient(max_workers=max_workers)
+            try:
+                fetched = client.fetch_materials(missing)
+            finally:
+                if own_client:
+                    client.close()
+        else:
+            fetched = {}
+            for material in missing:
+                fetched_material = BatteryMaterial(material)
+                fetched[material] = {prop: fetched_material.data.get(prop) for prop in MATERIAL_PROPERTIES} if fetched_material.data else {}
+        if cache is not None:
+            cache.put_many({material: data for material, data in fetched.items() if data is not None})
+        known.update({material: data or {} for material, data in fetched.items()})
+
+    material_objects = []
+    for material in materials:
+        if material not in known:
+            print(f"Material {material} nicht im Cache (Offline-Modus).")
+        elif not known[material] and (concurrent or client is not None or material not in missing):
+            # Beim sequentiellen Abruf meldet BatteryMaterial selbst "nicht gefunden"
+            print(f"Material {material} nicht gefunden.")
+        material_objects.append(BatteryMaterial(material, data=known.get(material, {})))
     data = [material.get_data() for material in material_objects]
     return pd.DataFrame(data)
 
 if __name__ == "__main__":
     materials = ["Lithium", "Cobalt", "Graphite", "Nickel", "Manganese", "Iron"]
-    df = get_battery_material_data(materials)
+    with MaterialCache() as cache:
+        df = get_battery_material_data(materials, cache=cache)
     print(df)
@@ -0,0 +1,128 @@
+import json
+import sqlite3
+import threading
+import time
+
+# SQLite begrenzt die Anzahl der Parameter pro Statement
+_MAX_SQL_PARAMS = 500
+
+# Gespeicherte Form eines Negativ-Eintrags ("bei PubChem nicht gefunden")
+_NOT_FOUND = json.dumps({})
+
+
+class MaterialCache:
+    """
+    Persistenter SQLite-Cache für PubChem-Eigenschaften von `BatteryMaterial`.
+
+    Schlüssel ist (Name, Namespace); gespeichert wird das Eigenschafts-Dict als JSON.
+    Ein leeres Dict steht für "bei PubChem nicht gefunden" und wird ebenfalls gecacht, aber nur
+    für `negative_ttl` Sekunden, damit ein später angelegtes Material wieder abgefragt wird.
+
+    :param path: Pfad der Datenbankdatei (":memory:" für einen flüchtigen Cache)
+    :param ttl: Gültigkeitsdauer eines Eintrags in Sekunden (None = unbegrenzt)
+    :param negative_ttl: Gültigkeitsdauer eines "nicht gefunden"-Eintrags in Sekunden
+                         (None = wie `ttl`); höchstens `ttl`
+    :param max_entries: Maximale Anzahl Einträge; darüber werden die am längsten
+                        nicht genutzten Einträge verdrängt (None = unbegrenzt)
+    """
+    def __init__(self, path="material_cache.sqlite", ttl=None, max_entries=None, negative_ttl=3600):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS materials (
+                    name TEXT NOT NULL,
+                    namespace TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (name, namespace)
+                )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_materials_last_access ON materials (last_access)")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM materials").fetchone()[0]
+
+    def _min_fetched_at(self, now):
+        return now - self.ttl if self.ttl is not None else float("-inf")
+
+    def _min_negative_fetched_at(self, now):
+        if self.negative_ttl is None:
+            return self._min_fetched_at(now)
+        return max(now - self.negative_ttl, self._min_fetched_at(now))
+
+    def get(self, name, namespace="name"):
+        """Gibt die gecachten Eigenschaften zurück oder None, wenn kein gültiger Eintrag existiert."""
+        return self.get_many([name], namespace).get(name)
+
+    def get_many(self, names, namespace="name"):
+        """Liest mehrere Einträge auf einmal; abgelaufene Einträge zählen als nicht vorhanden."""
+        names = list(dict.fromkeys(names))
+        now = time.time()
+        found = {}
+        with self._lock, self._conn:
+            for start in range(0, len(names), _MAX_SQL_PARAMS):
+                batch = names[start:start + _MAX_SQL_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT name, data FROM materials WHERE namespace = ? AND fetched_at >= ? "
+                    f"AND (data != ? OR fetched_at >= ?) AND name IN ({placeholders})",
+                    [namespace, self._min_fetched_at(now), _NOT_FOUND, self._min_negative_fetched_at(now), *batch],
+                ).fetchall()
+                found.update((name, json.loads(data)) for name, data in rows)
+            if found:
+                self._conn.executemany(
+                    "UPDATE materials SET last_access = ? WHERE name = ? AND namespace = ?",
+                    [(now, name, namespace) for name in found],
+                )
+        return found
+
+    def put(self, name, data, namespace="name"):
+        self.put_many({name: data}, namespace)
+
+    def put_many(self, items, namespace="name"):
+        """Schreibt mehrere Einträge ({Name: Eigenschaften}) in einer Transaktion und verdrängt ggf. alte."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO materials (name, namespace, data, fetched_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                [(name, namespace, json.dumps(data), now, now) for name, data in items.items()],
+            )
+            self._evict(now)
+
+    def _evict(self, now):
+        if self.ttl is not None:
+            self._conn.execute("DELETE FROM materials WHERE fetched_at < ?", (self._min_fetched_at(now),))
+        self._conn.execute("DELETE FROM materials WHERE data = ? AND fetched_at < ?",
+                           (_NOT_FOUND, self._min_negative_fetched_at(now)))
+        if self.max_entries is not None:
+            self._conn.execute(
+                """DELETE FROM materials WHERE rowid IN (
+                       SELECT rowid FROM materials ORDER BY last_access DESC LIMIT -1 OFFSET ?)""",
+                (self.max_entries,),
+            )
+
+    def purge(self):
+        """Entfernt abgelaufene bzw. überzählige Einträge sofort."""
+        with self._lock, self._conn:
+            self._evict(time.time())
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM materials")
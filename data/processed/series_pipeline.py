@@ -0,0 +1,111 @@
+"""
+Pipeline: gescrapte Standardpotentiale -> Schema der Spannungsreihe -> Binär-Snapshot.
+
+Die Zeilen des Scrapers (Strings wie "−3,04") werden in das Schema von
+`ElectrochemicalSeries` (element, reaction, E0, n, ion_formula, color) überführt und
+als memory-mapbarer Snapshot geschrieben, den `ElectrochemicalSeries.from_snapshot` lädt.
+"""
+import os
+import sys
+
+# Module aus src/ (reactions, series_snapshot, utils) importierbar machen
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src"))
+
+from reactions import compile_reaction, split_charge  # noqa: E402
+from series_snapshot import write_series_snapshot  # noqa: E402
+from utils import ElectrochemicalSeries  # noqa: E402
+
+DEFAULT_COLOR = "#C0C0C0"
+_SUPERSCRIPTS = str.maketrans("0123456789+-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻")
+# Unicode-Varianten aus der Wikipedia-Tabelle auf ASCII abbilden (hochgestellte Ladungen bleiben erhalten)
+_TEXT_REPLACEMENTS = str.maketrans({"−": "-", "–": "-", "\xa0": " "})
+
+
+def parse_potential(text: str) -> float:
+    """Wandelt z. B. "−3,04" oder "+0,34" in einen float um."""
+    cleaned = str(text).translate(_TEXT_REPLACEMENTS).replace(",", ".").replace(" ", "").lstrip("+")
+    return float(cleaned)
+
+
+def pretty_ion_formula(base: str, charge: int) -> str:
+    """Setzt die Ladung hochgestellt (Cu, 2 -> Cu²⁺); einfach geladene Ionen bleiben wie in utils.py (Li+)."""
+    if charge == 0:
+        return base
+    sign = "+" if charge > 0 else "-"
+    if abs(charge) == 1:
+        return base + sign
+    return base + f"{abs(charge)}{sign}".translate(_SUPERSCRIPTS)
+
+
+def normalize_row(row: dict, colors: dict[str, str] | None = None) -> dict | None:
+    """
+    Überführt eine gescrapte Zeile in einen Eintrag der Spannungsreihe.
+    Gibt None zurück, wenn die Zeile nicht interpretierbar ist.
+    """
+    colors = colors or {}
+    try:
+        element = str(row["Element"]).strip()
+        oxidized = str(row["oxidierte Form"]).translate(_TEXT_REPLACEMENTS).strip()
+        reduced = str(row["reduzierte Form"]).translate(_TEXT_REPLACEMENTS).strip()
+        E0 = parse_potential(row["E° (V)"])
+        reaction = f"{oxidized} -> {reduced}"
+        half_reaction = compile_reaction(reaction)
+    except (KeyError, ValueError):
+        return None
+    if not element or not half_reaction.oxidized:
+        return None
+    # Die Ladung des Ions wird für ion_formula (Aktivitätsmodell) gebraucht; mehrdeutige Zeilen überspringen
+    ion = split_charge(half_reaction.ion_species)
+    if ion is None:
+        return None
+
+    n = half_reaction.electrons
+    if not n:
+        # Elektronen nicht angegeben: aus der Ladungsdifferenz der Hauptspezies ableiten
+        product = split_charge(half_reaction.product_species)
+        if product is None:
+            return None
+        n = ion[1] * half_reaction.ion_coefficient - product[1] * half_reaction.product_coefficient
+        if n <= 0:
+            return None
+        reaction = f"{oxidized} + {n}e- -> {reduced}"
+    return {
+        "element": element,
+        "reaction": reaction,
+        "E0": E0,
+        "n": int(n),
+        "ion_formula": pretty_ion_formula(*ion),
+        "color": colors.get(element, DEFAULT_COLOR),
+    }
+
+
+def normalize_rows(rows) -> list[dict]:
+    """Normalisiert alle Zeilen; Farben werden aus der eingebauten Tabelle übernommen."""
+    colors = {}
+    for entry in ElectrochemicalSeries().series:
+        colors.setdefault(entry["element"], entry["color"])
+    entries = []
+    for row in rows:
+        entry = normalize_row(row, colors)
+        if entry is None:
+            print(f"Zeile übersprungen (nicht interpretierbar): {row}")
+        else:
+            entries.append(entry)
+    return entries
+
+
+def build_series_snapshot(rows, path: str) -> list[dict]:
+    """Normalisiert gescrapte Zeilen und schreibt sie als Snapshot; gibt die Einträge zurück."""
+    entries = normalize_rows(rows)
+    write_series_snapshot(entries, path)
+    return entries
+
+
+if __name__ == "__main__":
+    from standard_reduction_potential import ElektrochemischeSpannungsreiheScraper
+
+    scraper = ElektrochemischeSpannungsreiheScraper(cache_path="spannungsreihe_cache.json")
+    scraper.scrape()
+    output = sys.argv[1] if len(sys.argv) > 1 else "spannungsreihe.snapshot"
+    entries = build_series_snapshot(scraper.potentiale, output)
+    print(f"{len(entries)} Einträge nach {output} geschrieben.")
@@ -1,36 +1,110 @@
+import json
+import os
+
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 
+CACHE_VERSION = 2 # 2: Hoch-/Tiefstellungen als Unicode (Cu²⁺, MnO₄⁻) statt flach als "Cu2+"/"MnO4-"
+_SUPERSCRIPTS = str.maketrans("0123456789+-−–", "⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻⁻⁻")
+_SUBSCRIPTS = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
+
+def _cell_text(cell):
+    """Text einer Tabellenzelle; <sup>/<sub> bleiben als Unicode erhalten, damit Ladung und Index unterscheidbar sind."""
+    for tag in cell.find_all(["sup", "sub"]):
+        table = _SUPERSCRIPTS if tag.name == "sup" else _SUBSCRIPTS
+        tag.replace_with(tag.get_text().translate(table))
+    return " ".join(cell.get_text().split())
+
+
 class ElektrochemischeSpannungsreiheScraper:
-    def __init__(self, url="https://de.wikipedia.org/wiki/Elektrochemische_Spannungsreihe"):
+    def __init__(self, url="https://de.wikipedia.org/wiki/Elektrochemische_Spannungsreihe", cache_path=None):
+        """
+        :param url: Seite mit der Tabelle der Standardpotentiale
+        :param cache_path: Optionale JSON-Datei für ETag/Last-Modified und die bereits geparsten Zeilen.
+                           Mit Cache wird per Conditional GET geladen; bei 304 entfällt das Parsen.
+        """
         self.url = url
+        self.cache_path = cache_path
         self.html = ""
         self.potentiale = []
-    
+        self.from_cache = False
+        self._etag = None
+        self._last_modified = None
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, encoding="utf-8") as handle:
+                cache = json.load(handle)
+        except (OSError, ValueError):
+            return None # Defekter Cache: wie ohne Cache weiterarbeiten
+        if cache.get("version") != CACHE_VERSION or cache.get("url") != self.url:
+            return None
+        return cache
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        cache = {"version": CACHE_VERSION, "url": self.url, "etag": self._etag,
+                 "last_modified": self._last_modified, "rows": self.potentiale}
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(cache, handle, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+
     def fetch_page(self):
-        """Lädt den HTML-Inhalt der Seite herunter."""
-        response = requests.get(self.url)
+        """
+        Lädt den HTML-Inhalt der Seite herunter. Ist ein Cache vorhanden, wird bedingt geladen
+        (If-None-Match/If-Modified-Since); bei 304 werden die gecachten Zeilen übernommen.
+
+        :return: True, wenn die Daten aus dem Cache stammen (kein Parsen nötig)
+        """
+        cache = self._load_cache()
+        headers = {}
+        if cache:
+            if cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            if cache.get("last_modified"):
+                headers["If-Modified-Since"] = cache["last_modified"]
+
+        response = requests.get(self.url, headers=headers)
+        if response.status_code == 304 and cache:
+            self.html = ""
+            self.potentiale = cache["rows"]
+            self._etag = cache.get("etag")
+            self._last_modified = cache.get("last_modified")
+            self.from_cache = True
+            return True
         if response.status_code != 200:
             raise Exception(f"Fehler beim Laden der Seite: Statuscode {response.status_code}")
         self.html = response.text
-    
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+        self.from_cache = False
+        return False
+
     def parse_table(self):
         """Parst die Tabelle mit Standardpotentialen und speichert die Daten."""
-        soup = BeautifulSoup(self.html, "html.parser")
+        # Nur die Zieltabelle in einen Baum überführen statt des gesamten Dokuments
+        only_table = SoupStrainer("table", attrs={"class": "wikitable sortable"})
+        soup = BeautifulSoup(self.html, "html.parser", parse_only=only_table)
         # Tabelle anhand der CSS-Klasse finden
         table = soup.find("table", {"class": "wikitable sortable"})
         if not table:
             raise Exception("Die Tabelle wurde nicht gefunden.")
         rows = table.find_all("tr")[1:]  # Überspringe den Header
 
+        self.potentiale = []
         for row in rows:
             cols = row.find_all("td")
             if len(cols) >= 5:
                 element = cols[0].get_text(strip=True)
-                oxidierte_form = cols[1].get_text(strip=True)
+                oxidierte_form = _cell_text(cols[1])
                 pfeil = cols[2].get_text(strip=True)
-                reduzierte_form = cols[3].get_text(strip=True)
+                reduzierte_form = _cell_text(cols[3])
                 potential = cols[4].get_text(strip=True)
                 self.potentiale.append({
                     "Element": element,
@@ -39,16 +113,17 @@ class ElektrochemischeSpannungsreiheScraper:
                     "reduzierte Form": reduzierte_form,
                     "E° (V)": potential
                 })
-    
+
     def scrape(self):
         """Führt den gesamten Scraping-Prozess durch und gibt die Daten als Pandas DataFrame zurück."""
-        self.fetch_page()
-        self.parse_table()
+        if not self.fetch_page():
+            self.parse_table()
+            self._save_cache()
         return pd.DataFrame(self.potentiale)
 
 # Beispielhafte Nutzung
 if __name__ == "__main__":
-    scraper = ElektrochemischeSpannungsreiheScraper()
+    scraper = ElektrochemischeSpannungsreiheScraper(cache_path="spannungsreihe_cache.json")
     df = scraper.scrape()
     print(df)
     # Optional: Speichern als CSV
@@ -0,0 +1,170 @@
+# activity.py
+"""
+Aktivitätskoeffizienten für die Nernst-Gleichung (statt reiner Konzentrationen in Q).
+
+Modelle (log10 γ für ein Ion der Ladung z bei Ionenstärke I in mol/L):
+    "debye_huckel"           -A z² √I                          (Grenzgesetz, I ≲ 0.005 M)
+    "extended_debye_huckel"  -A z² √I / (1 + B a √I)           (I ≲ 0.1 M)
+    "davies"                 -A z² (√I / (1 + √I) - 0.3 I)     (I ≲ 0.5 M)
+
+Jede Halbzelle wird als Lösung eines Salzes aus dem Elektrodenion (Ladung z) und einem
+einwertigen Gegenion (Ladung `counter_ion_charge`) betrachtet; damit ist I = k * c mit
+k = |z| (|z| + z_Gegenion) / 2. Ladung, z² und k werden einmal pro Ionenformel bestimmt und
+gecacht, A(T) und B(T) (über die Dielektrizitätskonstante von Wasser) einmal pro Temperatur.
+"""
+import math
+from functools import lru_cache
+from typing import NamedTuple
+
+from reactions import split_charge
+
+_LN10 = math.log(10)
+MODELS = ("debye_huckel", "extended_debye_huckel", "davies")
+
+
+class IonTerms(NamedTuple):
+    """Vorberechnete Größen eines Ions für die Aktivitätskorrektur."""
+    charge: int             # z
+    charge_squared: int     # z²
+    ionic_factor: float     # k in I = k * c
+
+
+@lru_cache(maxsize=None)
+def parse_ion_charge(ion_formula: str) -> int:
+    """
+    Liest die Ladung aus einer Ionenformel, z. B. "Cu²⁺" -> 2, "Li+" -> 1, "Fe^3+" -> 3, "SO₄²⁻" -> -2.
+    Es gelten dieselben eindeutigen Schreibweisen wie in der Pipeline (`reactions.split_charge`);
+    "NO3-" oder "Fe3+" (Index oder Ladung?) werden nicht geraten.
+    """
+    ion = split_charge(str(ion_formula))
+    if ion is None:
+        raise ValueError(f"Ladung der Ionenformel '{ion_formula}' ist mehrdeutig notiert "
+                         f"(eindeutig z. B. 'NO₃⁻', 'Fe³⁺' oder 'Fe^3+').")
+    if not ion[1]:
+        raise ValueError(f"Ladung der Ionenformel '{ion_formula}' nicht bestimmbar.")
+    return ion[1]
+
+
+@lru_cache(maxsize=None)
+def charge_terms(charge: int, counter_ion_charge: int = 1) -> IonTerms:
+    """Ladung, z² und Ionenstärke-Faktor k eines Ions der Ladung z (gecacht pro Ladung und Gegenion)."""
+    magnitude = abs(charge)
+    return IonTerms(charge, charge * charge, magnitude * (magnitude + abs(counter_ion_charge)) / 2)
+
+
+@lru_cache(maxsize=None)
+def ion_terms(ion_formula: str, counter_ion_charge: int = 1) -> IonTerms:
+    """Ladung, z² und Ionenstärke-Faktor k eines Ions (gecacht pro Formel und Gegenion)."""
+    return charge_terms(parse_ion_charge(ion_formula), counter_ion_charge)
+
+
+def water_dielectric_constant(temperature):
+    """Relative Dielektrizitätskonstante von Wasser (Malmberg & Maryott, 0–100 °C); T in K."""
+    t = temperature - 273.15
+    return 87.740 + t * (-0.40008 + t * (9.398e-4 - 1.410e-6 * t))
+
+
+@lru_cache(maxsize=256)
+def debye_huckel_constants(temperature: float) -> tuple[float, float]:
+    """
+    Debye-Hückel-Konstanten (A in (L/mol)^½, B in 1/(Å·(L/mol)^½)) für Wasser (ρ ≈ 1 kg/L).
+    Bei 25 °C: A ≈ 0.511, B ≈ 0.329.
+    """
+    eps_t = water_dielectric_constant(temperature) * temperature
+    sqrt_eps_t = math.sqrt(eps_t)
+    return 1.82483e6 / (eps_t * sqrt_eps_t), 50.2916 / sqrt_eps_t
+
+
+def debye_huckel_constants_batch(temperature):
+    """
+    A(T) und B(T) für skalare oder Array-Temperaturen. Skalare nutzen den Cache von
+    `debye_huckel_constants`; Arrays werden einmal berechnet und können für Anode und
+    Kathode wiederverwendet werden (Parameter `constants` von `log_gamma_batch`).
+    """
+    if isinstance(temperature, (int, float)):
+        return debye_huckel_constants(float(temperature))
+    import numpy as np
+    temperature = np.asarray(temperature, dtype=np.float64)
+    eps_t = water_dielectric_constant(temperature) * temperature
+    sqrt_eps_t = np.sqrt(eps_t)
+    return 1.82483e6 / (eps_t * sqrt_eps_t), 50.2916 / sqrt_eps_t
+
+
+class ActivityModel:
+    """
+    Aktivitätsmodell für `BatterySimulation(activity_model=...)`.
+
+    :param model: "debye_huckel", "extended_debye_huckel" oder "davies"
+    :param ion_size: Ionengrößenparameter a in Å (nur erweitertes Debye-Hückel)
+    :param counter_ion_charge: Ladung des Gegenions der Salzlösung (Standard 1, z. B. NO₃⁻/Cl⁻)
+    """
+    def __init__(self, model: str = "davies", ion_size: float = 4.0, counter_ion_charge: int = 1) -> None:
+        if model not in MODELS:
+            raise ValueError(f"Unbekanntes Aktivitätsmodell '{model}' (erwartet: {', '.join(MODELS)}).")
+        if ion_size <= 0:
+            raise ValueError("Ionengröße muss > 0 sein.")
+        if counter_ion_charge == 0:
+            raise ValueError("Ladung des Gegenions darf nicht 0 sein.")
+        self.model = model
+        self.ion_size = ion_size
+        self.counter_ion_charge = counter_ion_charge
+
+    def __repr__(self) -> str:
+        return (f"ActivityModel(model='{self.model}', ion_size={self.ion_size}, "
+                f"counter_ion_charge={self.counter_ion_charge})")
+
+    def ion_terms(self, ion_formula: str) -> IonTerms:
+        return ion_terms(ion_formula, self.counter_ion_charge)
+
+    def charge_terms(self, charge: int) -> IonTerms:
+        return charge_terms(charge, self.counter_ion_charge)
+
+    def log_gamma(self, terms: IonTerms, concentration: float, temperature: float = 298.15) -> float:
+        """
+        ln γ eines Ions bei gegebener Konzentration (mol/L) und Temperatur (K).
+        Gleiche Ausdrücke und Reihenfolge wie `log_gamma_batch`, damit Skalar- und Array-Pfad
+        bitgleich rechnen.
+        """
+        A, B = debye_huckel_constants(float(temperature))
+        scale = -_LN10 * terms.charge_squared * A
+        ionic_strength = concentration * terms.ionic_factor
+        sqrt_i = math.sqrt(ionic_strength)
+        if self.model == "debye_huckel":
+            return sqrt_i * scale
+        if self.model == "extended_debye_huckel":
+            return sqrt_i / (sqrt_i * (B * self.ion_size) + 1) * scale
+        return (sqrt_i / (sqrt_i + 1) - ionic_strength * 0.3) * scale
+
+    def log_gamma_batch(self, terms: IonTerms, concentration, temperature=298.15, constants=None):
+        """
+        Array-Variante von `log_gamma`; nicht-positive Konzentrationen ergeben NaN.
+        Rechnet mit wenigen, überwiegend In-place-Operationen, damit korrigierte Sweeps nahe am
+        Tempo der idealen Lösung bleiben.
+
+        :param constants: Optional vorab berechnete (A, B) aus `debye_huckel_constants_batch(temperature)`
+        """
+        import numpy as np
+        concentration = np.asarray(concentration, dtype=np.float64)
+        A, B = constants if constants is not None else debye_huckel_constants_batch(temperature)
+        if np.ndim(A):
+            concentration, A, B = np.broadcast_arrays(concentration, A, B)
+        scale = -_LN10 * terms.charge_squared * A
+        shape = concentration.shape
+
+        with np.errstate(invalid="ignore"):
+            # atleast_1d: In-place-Operationen brauchen echte Arrays (auch für skalare Eingaben)
+            ionic_strength = np.multiply(np.atleast_1d(concentration), terms.ionic_factor)
+            sqrt_i = np.sqrt(ionic_strength)
+            if self.model == "debye_huckel":
+                result = sqrt_i
+            elif self.model == "extended_debye_huckel":
+                denominator = np.multiply(sqrt_i, B * self.ion_size, out=ionic_strength)
+                denominator += 1
+                result = np.divide(sqrt_i, denominator, out=sqrt_i)
+            else:
+                denominator = sqrt_i + 1
+                result = np.divide(sqrt_i, denominator, out=sqrt_i)
+                ionic_strength *= 0.3
+                result -= ionic_strength
+            result *= np.reshape(scale, shape) if np.ndim(scale) else scale
+        return result.reshape(shape)
@@ -0,0 +1,197 @@
+# cli.py
+"""
+Kommandozeilen-/Batch-Einstieg ohne GUI.
+
+Liest Zell-Jobs als JSONL oder CSV (Datei oder stdin) und schreibt pro Job eine Ergebniszeile
+als JSONL nach stdout. Nutzt nur simulation.py und utils.py; tkinter, pandas, pubchempy und
+NumPy werden nicht importiert, damit der Start in Shell-Pipelines schnell bleibt.
+
+Beispiel:
+    echo '{"anode": "Zn", "cathode": "Cu", "c_anode": 0.1}' | python cli.py
+    python cli.py jobs.csv > results.jsonl
+
+Felder je Job: anode, cathode (Pflicht), c_anode, c_cathode (mol/L, Standard 1.0),
+temperature (K, Standard 298.15).
+
+Mit `--store VERZEICHNIS` werden erfolgreiche Ergebnisse zusätzlich an einen `ResultStore`
+angehängt (importiert dann NumPy).
+"""
+import contextlib
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+
+from simulation import BatterySimulation, SimulationCache, F
+from utils import ElectrochemicalSeries, load_default_series
+
+DEFAULT_CONCENTRATION = 1.0
+DEFAULT_TEMPERATURE = 298.15
+
+
+def _detect_format(first_line: str, path: str | None) -> str:
+    if path:
+        lowered = path.lower()
+        if lowered.endswith(".csv"):
+            return "csv"
+        if lowered.endswith((".jsonl", ".json", ".ndjson")):
+            return "jsonl"
+    return "jsonl" if first_line.lstrip().startswith("{") else "csv"
+
+
+def read_jobs(stream, fmt: str | None = None, path: str | None = None):
+    """
+    Liefert die Jobs eines Streams (JSONL: eine Zeile pro Job, CSV: mit Kopfzeile).
+    CSV-Zeilen kommen als Dicts, JSONL-Zeilen ungeparst als Strings: sie werden erst in
+    `CellCalculator.calculate` geparst, damit eine defekte Zeile nur ihren eigenen Job betrifft.
+    """
+    lines = iter(stream)
+    first_line = ""
+    for first_line in lines:
+        if first_line.strip():
+            break
+    else:
+        return
+    lines = itertools.chain([first_line], lines)
+
+    if (fmt or _detect_format(first_line, path)) == "csv":
+        yield from csv.DictReader(lines)
+    else:
+        for line in lines:
+            if line.strip():
+                yield line
+
+
+class CellCalculator:
+    """Berechnet Ergebnisse für einzelne Jobs; Simulationen werden pro Elektrodenpaar wiederverwendet."""
+    def __init__(self, series: ElectrochemicalSeries | None = None, cache_size: int = 1024,
+                 activity_model=None) -> None:
+        self.series = series or load_default_series()
+        self.simulations = SimulationCache(self.series, maxsize=cache_size, activity_model=activity_model)
+
+    def _get_simulation(self, anode: str, cathode: str) -> BatterySimulation:
+        # Warnungen der Simulation (print, nur beim Bauen) dürfen die JSONL-Ausgabe auf stdout nicht stören
+        with contextlib.redirect_stdout(sys.stderr):
+            return self.simulations.get(anode, cathode)
+
+    def calculate(self, job: dict | str) -> dict:
+        """
+        Gibt die Eingaben plus Ergebnisse zurück; Fehler werden als Feld 'error' gemeldet statt geworfen.
+
+        :param job: Job als Dict oder als JSONL-Zeile (String)
+        """
+        result = dict.fromkeys(("anode", "cathode", "c_anode", "c_cathode", "temperature"))
+        try:
+            job = _parse_job(job)
+            # Eingaben wie gelesen zurückgeben; nicht endliche Zahlen (JSON NaN, 1e400) als Text, damit die Zeile gültiges JSON bleibt
+            result.update((key, _echo(job.get(key))) for key in result)
+            if not result["anode"] or not result["cathode"]:
+                raise ValueError("Felder 'anode' und 'cathode' sind erforderlich.")
+            conc_anode = _to_float(job.get("c_anode"), DEFAULT_CONCENTRATION)
+            conc_cathode = _to_float(job.get("c_cathode"), DEFAULT_CONCENTRATION)
+            temperature = _to_float(job.get("temperature"), DEFAULT_TEMPERATURE)
+            result.update(c_anode=conc_anode, c_cathode=conc_cathode, temperature=temperature)
+
+            sim = self._get_simulation(result["anode"], result["cathode"])
+            log_q = sim.get_log_reaction_quotient(conc_anode, conc_cathode, temperature)
+            E_nernst = sim.get_nernst_voltage_from_log_q(log_q, temperature)
+            values = dict(
+                n=sim.n_overall,
+                log_q=log_q,
+                E0_cell=sim.get_standard_cell_voltage(),
+                E0_cell_T=sim.get_standard_cell_voltage(temperature),
+                E_nernst=E_nernst,
+                delta_G0=sim.get_delta_G0(),
+                delta_G=-sim.n_overall * F * E_nernst,
+            )
+            if not all(math.isfinite(value) for value in values.values()):
+                # z. B. extreme Temperaturen: E⁰(T) läuft über; NaN/Infinity wären kein gültiges JSON
+                raise ValueError("Ergebnis ist nicht endlich (Eingaben außerhalb des gültigen Bereichs).")
+            result.update(values)
+        except (ValueError, TypeError) as e:
+            result["error"] = str(e)
+        return result
+
+
+def _parse_job(job: dict | str) -> dict:
+    """Parst eine JSONL-Zeile und prüft, dass der Job ein Objekt ist."""
+    if isinstance(job, str):
+        try:
+            job = json.loads(job)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Ungültige JSON-Zeile: {e.msg} (Spalte {e.colno}).") from None
+    if not isinstance(job, dict):
+        raise ValueError(f"Job muss ein JSON-Objekt sein, nicht {type(job).__name__}.")
+    return job
+
+
+def _echo(value):
+    return str(value) if isinstance(value, float) and not math.isfinite(value) else value
+
+
+def _to_float(value, default: float) -> float:
+    """Zahl aus JSON/CSV (auch mit Dezimalkomma); "nan", "inf" oder 1e400 ergeben einen ValueError."""
+    if value is None or value == "":
+        return default
+    number = float(str(value).replace(",", "."))
+    if not math.isfinite(number):
+        raise ValueError(f"Wert '{value}' ist keine endliche Zahl.")
+    return number
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Berechnet Zellspannungen für Jobs aus JSONL/CSV (ohne GUI).")
+    parser.add_argument("jobs", nargs="?", default="-", help="Job-Datei (JSONL oder CSV); '-' oder leer = stdin")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="Eingabeformat (Standard: automatisch)")
+    parser.add_argument("--activity-model", choices=("debye_huckel", "extended_debye_huckel", "davies"),
+                        help="Aktivitäten statt Konzentrationen in Q verwenden (Standard: ideale Lösung)")
+    parser.add_argument("--store", metavar="VERZEICHNIS",
+                        help="Ergebnisse zusätzlich an einen Ergebnisspeicher (result_store.py) anhängen")
+    args = parser.parse_args(argv)
+
+    activity_model = None
+    if args.activity_model:
+        from activity import ActivityModel
+        activity_model = ActivityModel(args.activity_model)
+    calculator = CellCalculator(activity_model=activity_model)
+    store = None
+    if args.store:
+        from result_store import ResultStore # Lazy: NumPy nur laden, wenn gespeichert wird
+        store = ResultStore(args.store)
+    out = sys.stdout
+    errors = 0
+    stream = sys.stdin if args.jobs == "-" else open(args.jobs, encoding="utf-8", newline="")
+    try:
+        path = None if args.jobs == "-" else args.jobs
+        for job in read_jobs(stream, args.format, path):
+            result = calculator.calculate(job)
+            errors += "error" in result
+            if store is not None and "error" not in result:
+                # Der Speicher hält E⁰ und ΔG⁰ bei der Temperatur der Zeile
+                # Eindeutige Bezeichnung der Halbreaktion, damit z. B. Fe²⁺/Fe und Fe³⁺/Fe²⁺ unterscheidbar bleiben
+                store.append(calculator.series.get_element_label(result["anode"]),
+                             calculator.series.get_element_label(result["cathode"]), result["c_anode"], result["c_cathode"],
+                             result["temperature"], result["log_q"], result["E0_cell_T"], result["E_nernst"],
+                             -result["n"] * F * result["E0_cell_T"])
+            out.write(json.dumps(result, ensure_ascii=False, allow_nan=False))
+            out.write("\n")
+    except BrokenPipeError:
+        # z. B. bei "| head": Ausgabe wurde geschlossen, kein Fehler. stdout auf devnull umlenken,
+        # damit das Leeren der Puffer beim Beenden nicht erneut scheitert
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if store is not None:
+            store.close()
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+# discharge.py
+from collections.abc import Callable, Iterable, Iterator
+from typing import NamedTuple
+
+import numpy as np
+
+from simulation import BatterySimulation, F
+
+
+class DischargeChunk(NamedTuple):
+    """Ein Block der Entladekurve; alle Arrays haben dieselbe Länge."""
+    time: np.ndarray          # s
+    voltage: np.ndarray       # Klemmenspannung in V
+    current: np.ndarray       # A (positiv = Entladung)
+    conc_anode: np.ndarray    # mol/L
+    conc_cathode: np.ndarray  # mol/L
+    charge: np.ndarray        # bisher geflossene Ladung in C
+
+
+DISCHARGE_COLUMNS = DischargeChunk._fields
+
+
+class DischargeSimulator:
+    """
+    Zeitbereichs-Simulation der Entladung einer galvanischen Zelle auf Basis von `BatterySimulation`.
+
+    Die Ionenkonzentrationen werden pro Zeitschritt nach dem Faradayschen Gesetz fortgeschrieben:
+    pro Mol Elektronen entstehen an der Anode f_A/n und werden an der Kathode f_K/n Mol Ionen verbraucht
+    (f = Exponent des Ions in Q, n = n_overall). Die Leerlaufspannung folgt aus der Nernst-Gleichung.
+    """
+    def __init__(self, simulation: BatterySimulation, volume_anode: float, volume_cathode: float,
+                 conc_anode: float, conc_cathode: float, temperature: float = 298.15,
+                 internal_resistance: float = 0.0) -> None:
+        """
+        :param simulation: Elektrodenpaar
+        :param volume_anode: Elektrolytvolumen der Anodenhalbzelle in L
+        :param volume_cathode: Elektrolytvolumen der Kathodenhalbzelle in L
+        :param conc_anode: Anfangskonzentration des Anoden-Ions in mol/L
+        :param conc_cathode: Anfangskonzentration des Kathoden-Ions in mol/L
+        :param temperature: Temperatur in Kelvin
+        :param internal_resistance: Innenwiderstand in Ohm
+        """
+        if volume_anode <= 0 or volume_cathode <= 0:
+            raise ValueError("Elektrolytvolumina müssen > 0 sein.")
+        if conc_anode <= 0 or conc_cathode <= 0:
+            raise ValueError("Konzentrationen müssen > 0 sein.")
+        if temperature <= 0:
+            raise ValueError("Temperatur muss positiv sein (in Kelvin).")
+        if internal_resistance < 0:
+            raise ValueError("Innenwiderstand darf nicht negativ sein.")
+
+        self.simulation = simulation
+        self.volume_anode = volume_anode
+        self.volume_cathode = volume_cathode
+        self.conc_anode = conc_anode
+        self.conc_cathode = conc_cathode
+        self.temperature = temperature
+        self.internal_resistance = internal_resistance
+
+        # Mol Ionen pro Coulomb (Vorzeichen: Anode +, Kathode -) und daraus Konzentrationsänderung pro C
+        self._dconc_anode_per_C = simulation.factor_anode_ion / (simulation.n_overall * F * volume_anode)
+        self._dconc_cathode_per_C = -simulation.factor_cathode_ion / (simulation.n_overall * F * volume_cathode)
+
+    def open_circuit_voltage(self, conc_anode: float, conc_cathode: float) -> float:
+        """Leerlaufspannung (Nernst) für die gegebenen Konzentrationen."""
+        log_q = self.simulation.get_log_reaction_quotient(conc_anode, conc_cathode, self.temperature)
+        return self.simulation.get_nernst_voltage_from_log_q(log_q, self.temperature)
+
+    def run(self, current: float | Callable[[float], float] | None = None, load_resistance: float | None = None,
+            t_end: float = 3600.0, cutoff_voltage: float = 0.0, min_concentration: float = 1e-9,
+            dt_initial: float = 1.0, dt_min: float = 1e-3, dt_max: float = 600.0,
+            max_voltage_step: float = 1e-3, max_relative_conc_step: float = 0.01,
+            chunk_size: int = 4096) -> Iterator[DischargeChunk]:
+        """
+        Simuliert die Entladung und liefert die Trajektorie blockweise (Generator).
+
+        Der Speicherbedarf ist unabhängig von der Schrittzahl: pro Block werden höchstens
+        `chunk_size` Punkte gehalten. Die Schrittweite passt sich an, sodass sich Spannung und
+        Konzentrationen pro Schritt höchstens um `max_voltage_step` bzw. `max_relative_conc_step`
+        ändern; in flachen Bereichen wächst sie bis `dt_max`.
+
+        :param current: Konstanter Strom in A oder Funktion t -> I(t) (Lastprofil)
+        :param load_resistance: Alternativ: ohmscher Lastwiderstand in Ohm
+        :param t_end: Maximale Simulationsdauer in s
+        :param cutoff_voltage: Abbruch, sobald die Klemmenspannung darunter fällt
+        :param min_concentration: Abbruch, sobald ein verbrauchtes Ion diese Konzentration erreicht
+        """
+        if (current is None) == (load_resistance is None):
+            raise ValueError("Genau eines von 'current' oder 'load_resistance' muss angegeben werden.")
+        if load_resistance is not None and load_resistance + self.internal_resistance <= 0:
+            raise ValueError("Lastwiderstand muss > 0 sein.")
+        if not 0 < dt_min <= dt_max:
+            raise ValueError("Es muss 0 < dt_min <= dt_max gelten.")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size muss > 0 sein.")
+
+        if load_resistance is not None:
+            total_resistance = load_resistance + self.internal_resistance
+            current_at = lambda t, e_ocv: e_ocv / total_resistance
+        elif callable(current):
+            current_at = lambda t, e_ocv: current(t)
+        else:
+            current_at = lambda t, e_ocv: current
+
+        t = 0.0
+        charge = 0.0
+        c_anode = self.conc_anode
+        c_cathode = self.conc_cathode
+        dt = min(max(dt_initial, dt_min), dt_max)
+        e_ocv = self.open_circuit_voltage(c_anode, c_cathode)
+        i_cell = current_at(t, e_ocv)
+        voltage = e_ocv - i_cell * self.internal_resistance
+        buffer = _ChunkBuffer(chunk_size)
+        if buffer.append(t, voltage, i_cell, c_anode, c_cathode, charge):
+            yield buffer.flush()
+
+        while t < t_end and voltage >= cutoff_voltage:
+            # Schrittweite: Konzentrationsänderung begrenzen (relativ und bis zur Erschöpfung)
+            rate_anode = self._dconc_anode_per_C * i_cell      # mol/(L·s)
+            rate_cathode = self._dconc_cathode_per_C * i_cell
+            dt_limit = dt_max
+            dt_depletion = float("inf")
+            for conc, rate in ((c_anode, rate_anode), (c_cathode, rate_cathode)):
+                if rate != 0:
+                    dt_limit = min(dt_limit, max_relative_conc_step * conc / abs(rate))
+                if rate < 0:
+                    dt_depletion = min(dt_depletion, (conc - min_concentration) / -rate)
+            step = min(max(min(dt, dt_limit), dt_min), t_end - t)
+            depleted = step >= dt_depletion
+            if depleted:
+                step = dt_depletion
+            if step <= 0:
+                break
+
+            dq = i_cell * step
+            c_anode_next = c_anode + self._dconc_anode_per_C * dq
+            c_cathode_next = c_cathode + self._dconc_cathode_per_C * dq
+            e_next = self.open_circuit_voltage(c_anode_next, c_cathode_next)
+
+            # Schritt verwerfen und mit halber Schrittweite wiederholen, falls die Spannung zu stark springt
+            delta_e = abs(e_next - e_ocv)
+            if delta_e > max_voltage_step and step > dt_min and not depleted:
+                dt = max(step / 2, dt_min)
+                continue
+
+            t += step
+            charge += dq
+            c_anode, c_cathode, e_ocv = c_anode_next, c_cathode_next, e_next
+            i_cell = current_at(t, e_ocv)
+            voltage = e_ocv - i_cell * self.internal_resistance
+            if buffer.append(t, voltage, i_cell, c_anode, c_cathode, charge):
+                yield buffer.flush()
+            if depleted:
+                break
+
+            # Nächste Schrittweite aus der aktuellen Spannungsänderung abschätzen (max. Verdopplung)
+            dt = 2 * step if delta_e == 0 else min(2 * step, step * max_voltage_step / delta_e)
+            dt = min(max(dt, dt_min), dt_max)
+
+        if len(buffer):
+            yield buffer.flush()
+
+
+class _ChunkBuffer:
+    """Vorallokierter Puffer fester Größe für einen Block der Entladekurve."""
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._columns = np.empty((len(DISCHARGE_COLUMNS), size), dtype=np.float64)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, *values: float) -> bool:
+        """Hängt einen Punkt an; gibt True zurück, wenn der Puffer voll ist."""
+        self._columns[:, self._count] = values
+        self._count += 1
+        return self._count == self._size
+
+    def flush(self) -> DischargeChunk:
+        chunk = DischargeChunk(*self._columns[:, :self._count].copy())
+        self._count = 0
+        return chunk
+
+
+def write_discharge_csv(chunks: Iterable[DischargeChunk], path: str) -> int:
+    """
+    Schreibt die Blöcke einer Entladung nacheinander als CSV, ohne die Trajektorie
+    im Speicher zu sammeln. Gibt die Anzahl der geschriebenen Zeilen zurück.
+    """
+    rows = 0
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(",".join(DISCHARGE_COLUMNS) + "\n")
+        for chunk in chunks:
+            np.savetxt(handle, np.column_stack(chunk), delimiter=",", fmt="%.10g")
+            rows += len(chunk.time)
+    return rows
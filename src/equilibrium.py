@@ -0,0 +1,163 @@
+# equilibrium.py
+"""
+Gleichgewichtszusammensetzung galvanischer Zellen (E = 0) aus Anfangskonzentrationen und Volumina.
+
+Zellreaktion (n = n_overall, f = Exponent des Ions in Q wie in `BatterySimulation`):
+    ... + f_K Kathoden-Ion  ->  f_A Anoden-Ion + ...,     Q = c_A^f_A / c_K^f_K
+Im Gleichgewicht gilt ln Q = ln K = n F E⁰ / (R T). Mit der Reaktionslaufzahl ξ (mol) ist
+    c_A = (N_A0 + f_A ξ) / V_A,   c_K = (N_K0 - f_K ξ) / V_K.
+
+Gelöst wird im Log-Raum der Spezies, die verbraucht wird (Kathoden-Ion, wenn ln Q0 < ln K,
+sonst läuft die Reaktion rückwärts und das Anoden-Ion wird verbraucht). Deren Gleichgewichts-
+konzentration kann bei großem K beliebig klein werden (z. B. < 1e-37 mol/L für Zn/Cu), bleibt als
+Logarithmus aber gut darstellbar. Die Gleichung ist in dieser Variablen streng monoton; alle
+Paare werden gemeinsam per Bisektion auf Arrays gelöst (keine Python-Schleife über Paare).
+"""
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from reactions import compile_reaction
+from screening import compute_cell_matrix
+from simulation import F, R
+from utils import ElectrochemicalSeries
+
+
+class EquilibriumResult(NamedTuple):
+    """Ergebnis von `solve_equilibrium` (gleiche Form wie die gebroadcasteten Eingaben)."""
+    log_conc_anode: np.ndarray    # ln c_A im Gleichgewicht
+    log_conc_cathode: np.ndarray  # ln c_K im Gleichgewicht
+    conc_anode: np.ndarray        # c_A in mol/L (kann auf 0 unterlaufen, der Logarithmus nicht)
+    conc_cathode: np.ndarray      # c_K in mol/L
+    extent: np.ndarray            # Reaktionslaufzahl ξ in mol (negativ = Rückreaktion)
+    valid: np.ndarray             # bool-Maske; ungültige Einträge sind in den anderen Arrays NaN
+
+
+def solve_equilibrium(log_K, factor_anode_ion, factor_cathode_ion, conc_anode, conc_cathode,
+                      volume_anode=1.0, volume_cathode=1.0, xtol: float = 1e-12) -> EquilibriumResult:
+    """
+    Löst die Massenbilanz für beliebig viele Zellen gleichzeitig (alle Argumente broadcastbar).
+    Für ein einzelnes Paar: `solve_equilibrium(n F E⁰ / (R T), sim.factor_anode_ion,
+    sim.factor_cathode_ion, c_A, c_K)`.
+
+    :param log_K: ln K = n F E⁰_cell / (R T)
+    :param factor_anode_ion: f_A (Exponent des Anoden-Ions in Q)
+    :param factor_cathode_ion: f_K (Exponent des Kathoden-Ions in Q)
+    :param conc_anode: Anfangskonzentration des Anoden-Ions in mol/L (>= 0)
+    :param conc_cathode: Anfangskonzentration des Kathoden-Ions in mol/L (>= 0)
+    :param volume_anode: Elektrolytvolumen der Anodenhalbzelle in L (> 0)
+    :param volume_cathode: Elektrolytvolumen der Kathodenhalbzelle in L (> 0)
+    :param xtol: Absolute Toleranz im Logarithmus der verbrauchten Spezies
+    """
+    log_K, f_a, f_k, c_a0, c_k0, v_a, v_k = np.broadcast_arrays(*(
+        np.asarray(value, dtype=np.float64)
+        for value in (log_K, factor_anode_ion, factor_cathode_ion, conc_anode, conc_cathode,
+                      volume_anode, volume_cathode)
+    ))
+    valid = (np.isfinite(log_K) & (f_a > 0) & (f_k > 0) & (c_a0 >= 0) & (c_k0 >= 0)
+             & ((c_a0 > 0) | (c_k0 > 0)) & (v_a > 0) & (v_k > 0))
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        log_c_a0, log_c_k0 = np.log(c_a0), np.log(c_k0)
+        log_q0 = f_a * log_c_a0 - f_k * log_c_k0
+        # Vorwärts: Kathoden-Ion wird verbraucht (d = K, p = A); sonst umgekehrt mit -ln K
+        forward = log_q0 < log_K
+        f_d, f_p = np.where(forward, f_k, f_a), np.where(forward, f_a, f_k)
+        c_d0, c_p0 = np.where(forward, c_k0, c_a0), np.where(forward, c_a0, c_k0)
+        log_k_dir = np.where(forward, log_K, -log_K)
+        # Zunahme von c_p je mol/L Abnahme von c_d
+        transfer = (f_p / f_d) * np.where(forward, v_k / v_a, v_a / v_k)
+        c_p_max = c_p0 + transfer * c_d0
+
+        def residual(log_c_d):
+            # f_p ln c_p - f_d ln c_d - ln K_dir; streng fallend in ln c_d
+            return f_p * np.log(c_p0 + transfer * (c_d0 - np.exp(log_c_d))) - f_d * log_c_d - log_k_dir
+
+        upper = np.log(c_d0)
+        # Bei lower ist c_d < e^-11 c_d0, damit c_p >= c_p_max (1 - e^-11) und residual(lower) > 0
+        lower = np.minimum(upper - 1.0, (f_p * np.log(c_p_max) - log_k_dir) / f_d) - 10.0
+        lower = np.where(valid, lower, 0.0)
+        upper = np.where(valid, upper, 1.0)
+
+        width = float(np.max(upper - lower, initial=0.0))
+        iterations = max(0, math.ceil(math.log2(width / xtol))) if width > xtol else 0
+        for _ in range(iterations):
+            middle = 0.5 * (lower + upper)
+            positive = residual(middle) > 0
+            lower = np.where(positive, middle, lower)
+            upper = np.where(positive, upper, middle)
+        log_c_d = 0.5 * (lower + upper)
+
+        c_d = np.exp(log_c_d)
+        log_c_p = np.log(c_p0 + transfer * (c_d0 - c_d))
+        log_c_a = np.where(valid, np.where(forward, log_c_p, log_c_d), np.nan)
+        log_c_k = np.where(valid, np.where(forward, log_c_d, log_c_p), np.nan)
+        extent = np.where(forward, (c_k0 - np.exp(log_c_k)) * v_k / f_k, (np.exp(log_c_a) - c_a0) * v_a / f_a)
+
+    return EquilibriumResult(log_c_a, log_c_k, np.exp(log_c_a), np.exp(log_c_k),
+                             np.where(valid, extent, np.nan), valid)
+
+
+class EquilibriumMatrix:
+    """
+    Gleichgewichtszusammensetzung aller geordneten Elektrodenpaare einer Spannungsreihe.
+    Zeile i = Anode, Spalte j = Kathode (wie `CellMatrix`); die Diagonale ist ungültig.
+    """
+    def __init__(self, elements: tuple[str, ...], log_K: np.ndarray, result: EquilibriumResult) -> None:
+        self.elements = elements
+        self.log_K = log_K    # ln K je Paar
+        self.result = result  # EquilibriumResult mit Arrays der Form (n, n)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def get_pair(self, anode: str, cathode: str) -> dict:
+        """Gleichgewichtswerte eines Paares als Dict."""
+        try:
+            a, c = self.elements.index(anode), self.elements.index(cathode)
+        except ValueError as exc:
+            raise ValueError(f"Element nicht in der Spannungsreihe: {exc}") from None
+        return {
+            "anode": anode,
+            "cathode": cathode,
+            "log_K": float(self.log_K[a, c]),
+            **{field: float(values[a, c]) if field != "valid" else bool(values[a, c])
+               for field, values in self.result._asdict().items()},
+        }
+
+
+def _ion_coefficients(series: ElectrochemicalSeries) -> np.ndarray:
+    """Ionen-Koeffizient je Spezies (einmal pro Spezies, nicht pro Paar); 1, wenn nicht parsebar."""
+    coefficients = []
+    for entry in series.series:
+        try:
+            coefficients.append(compile_reaction(entry.get("reaction", "")).ion_coefficient)
+        except ValueError:
+            coefficients.append(1)
+    return np.array(coefficients, dtype=np.float64)
+
+
+def compute_equilibrium_matrix(series: ElectrochemicalSeries, conc_anode=1.0, conc_cathode=1.0,
+                               volume_anode=1.0, volume_cathode=1.0,
+                               temperature: float = 298.15) -> EquilibriumMatrix:
+    """
+    Gleichgewicht für alle geordneten Paare in einem vektorisierten Durchlauf.
+    Konzentrationen und Volumina dürfen Skalare oder (n, n)-Arrays sein.
+
+    :param temperature: Temperatur in K (E⁰(T) aus den Temperaturkoeffizienten der Reihe)
+    """
+    if temperature <= 0:
+        raise ValueError("Temperatur muss > 0 K sein.")
+    matrix = compute_cell_matrix(series, None if temperature == 298.15 else temperature)
+    electrons = series.columns.n.astype(np.float64)
+    coefficients = _ion_coefficients(series)
+    # f = (n / n_Halbzelle) * Ionen-Koeffizient, wie BatterySimulation.factor_*_ion
+    factor_anode_ion = matrix.n_overall / electrons[:, np.newaxis] * coefficients[:, np.newaxis]
+    factor_cathode_ion = matrix.n_overall / electrons[np.newaxis, :] * coefficients[np.newaxis, :]
+
+    log_K = matrix.n_overall * F * matrix.E0_cell / (R * temperature)
+    np.fill_diagonal(log_K, np.nan)  # Anode == Kathode: keine Zelle
+    result = solve_equilibrium(log_K, factor_anode_ion, factor_cathode_ion, conc_anode, conc_cathode,
+                               volume_anode, volume_cathode)
+    return EquilibriumMatrix(matrix.elements, log_K, result)
@@ -3,13 +3,24 @@ from tkinter import ttk
 from tkinter import messagebox
 
 try:
-    from utils import ElectrochemicalSeries
-    from simulation import BatterySimulation, ElectrochemicalElement, R, F
+    from utils import ElectrochemicalSeries, load_default_series
+    from simulation import BatterySimulation, ElectrochemicalElement, SimulationCache, R, F
+    from reactions import compile_reaction
+    from worker import ComputationWorker
+    import instrumentation
 except ImportError as e:
      messagebox.showerror("Import Fehler", f"Konnte Module nicht laden: {e}\nStellen Sie sicher, dass utils.py und simulation.py im selben Ordner wie gui.py sind.")
      import sys
      sys.exit(1)
-import math 
+import math
+import os
+
+# Optionale JSON-Datei, in die beim Schließen die Messwerte der Instrumentierung geschrieben werden
+INSTRUMENTATION_FILE_ENV_VAR = "BATTERY_INSTRUMENTATION_FILE"
+# Optionales Verzeichnis eines Ergebnisspeichers (result_store.py), an den jede Berechnung angehängt wird
+RESULT_STORE_ENV_VAR = "BATTERY_RESULT_STORE"
+# Verzögerung, nach der angehängte Ergebnisse geschrieben werden (fasst schnelle Eingabefolgen zu einem Segment zusammen)
+RESULT_STORE_FLUSH_MS = 1000
 
 class BatteryApp:
     def __init__(self, root):
@@ -32,7 +43,7 @@ class BatteryApp:
 
 
         try:
-             self.series_data = ElectrochemicalSeries()
+             self.series_data = load_default_series()
              self.element_names = self.series_data.get_element_names()
         except NameError:
              messagebox.showerror("Fehler", "Klasse 'ElectrochemicalSeries' nicht in utils.py gefunden.")
@@ -43,6 +54,17 @@ class BatteryApp:
 
 
         self.current_simulation: BatterySimulation | None = None
+        # Simulationen pro Elektrodenpaar wiederverwenden; Konzentration/Temperatur ändern nur die Rechnung
+        self.simulation_cache = SimulationCache(self.series_data)
+        # Simulationen laufen im Hintergrund; Ergebnisse kommen per after() zurück
+        self.worker = ComputationWorker(self.root)
+        self.result_store = None
+        self._store_flush_id = None
+        store_path = os.environ.get(RESULT_STORE_ENV_VAR)
+        if store_path:
+            from result_store import ResultStore # Lazy: NumPy nur laden, wenn gespeichert wird
+            self.result_store = ResultStore(store_path)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.anode_var = tk.StringVar()
         self.cathode_var = tk.StringVar()
@@ -72,6 +94,8 @@ class BatteryApp:
         self.create_visualization_frame(main_area_frame)
         self.create_formula_frame(main_area_frame)
         self.create_output_frame()
+        if instrumentation.is_enabled():
+            self.create_status_line()
 
         if "Zn" in self.element_names and "Cu" in self.element_names:
             self.anode_var.set("Zn")
@@ -87,6 +111,31 @@ class BatteryApp:
                   self.calculate_and_update()
 
 
+    def on_close(self):
+        """Beendet den Worker-Thread und schließt das Fenster."""
+        self.worker.shutdown()
+        if self.result_store is not None:
+            if self._store_flush_id is not None:
+                self.root.after_cancel(self._store_flush_id)
+                self._store_flush_id = None
+            self.result_store.close()
+        dump_path = os.environ.get(INSTRUMENTATION_FILE_ENV_VAR)
+        if dump_path and instrumentation.is_enabled():
+            instrumentation.dump_json(dump_path)
+        self.root.destroy()
+
+    def create_status_line(self):
+        """Statuszeile mit Aufrufzahlen und Latenzen je Stufe (nur bei aktiver Instrumentierung)."""
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(self.root, textvariable=self.status_var, font=('Calibri', 9), foreground="grey").grid(
+            row=3, column=0, padx=10, pady=(0, 5), sticky="w")
+        self.update_status_line()
+
+    def update_status_line(self):
+        self.status_var.set(instrumentation.status_line(
+            ("gui.parse_inputs", "worker.simulation_setup", "worker.nernst", "gui.redraw_canvas")))
+        self.root.after(1000, self.update_status_line)
+
     def create_input_frame(self):
         """Erstellt den Frame für die Eingabeelemente."""
         input_frame = ttk.LabelFrame(self.root, text="Eingabe", padding=10)
@@ -135,7 +184,10 @@ class BatteryApp:
 
         self.canvas = tk.Canvas(vis_frame, bg="white", highlightthickness=0)
         self.canvas.grid(row=0, column=0, sticky="nsew", pady=5, padx=5)
-        self.canvas.bind("<Configure>", self.redraw_canvas)
+        self.canvas_items: dict[str, int] = {} # Item-IDs der einmal aufgebauten Szene
+        self._canvas_item_state: dict[str, tuple] = {} # Zuletzt gesetzte Koordinaten/Optionen je Item
+        self._redraw_pending = None # after()-ID eines angeforderten Neuzeichnens
+        self.canvas.bind("<Configure>", self.schedule_redraw)
 
     def calculate_dynamic_fill_y(self, concentration: float, reference_y: float, min_y: float, max_y: float) -> float:
         """Berechnet die Y-Koordinate des Füllstands basierend auf der Konzentration."""
@@ -162,15 +214,88 @@ class BatteryApp:
 
         return max(min_y, min(fill_y, max_y))
 
+    def schedule_redraw(self, event=None):
+         """Fasst schnell aufeinanderfolgende <Configure>-Events zu einem Neuzeichnen pro Frame zusammen."""
+         if self._redraw_pending is None:
+             self._redraw_pending = self.root.after(16, self._run_scheduled_redraw) # ~60 Hz
+
+    def _run_scheduled_redraw(self):
+         self._redraw_pending = None
+         self.redraw_canvas()
+
+    def build_canvas_scene(self):
+         """Legt alle Canvas-Items einmalig an; redraw_canvas verschiebt bzw. ändert sie danach nur noch."""
+         c = self.canvas
+         c.delete("all")
+         self._canvas_item_state.clear()
+         items = {}
+         # Reihenfolge der Erzeugung = Zeichenreihenfolge (Stapelung)
+         # 1. Bechergläser
+         items["anode_beaker"] = c.create_rectangle(0, 0, 0, 0, outline="grey", width=1)
+         items["cathode_beaker"] = c.create_rectangle(0, 0, 0, 0, outline="grey", width=1)
+         # 2. Elektroden (Farben werden in redraw_canvas gesetzt)
+         items["anode_electrode"] = c.create_rectangle(0, 0, 0, 0, outline="black", width=1.5, tags="anode_electrode")
+         items["cathode_electrode"] = c.create_rectangle(0, 0, 0, 0, outline="black", width=1.5, tags="cathode_electrode")
+         # 3. Elektrolyt (Dynamisch)
+         items["anode_electrolyte"] = c.create_rectangle(0, 0, 0, 0, fill="#ADD8E6", outline="", tags="anode_electrolyte")
+         items["cathode_electrolyte"] = c.create_rectangle(0, 0, 0, 0, fill="#ADD8E6", outline="", tags="cathode_electrolyte")
+         # 4. Voltmeter (Symbol und externe Textanzeige)
+         items["vm_box"] = c.create_rectangle(0, 0, 0, 0, outline="black", fill="white", width=1.5)
+         items["vm_symbol"] = c.create_text(0, 0, text="V", font=("Calibri", 11, "bold")) # Nur 'V'
+         items["vm_value"] = c.create_text(0, 0, text="", font=("Calibri", 10, "bold"), anchor="w")
+         # 5. Drähte und Elektronenfluss (Pfeil auf dem Draht zur Kathode)
+         for name in ("wire_anode_up", "wire_anode_vm", "wire_vm_left", "wire_vm_right"):
+             items[name] = c.create_line(0, 0, 0, 0, width=1.5)
+         items["wire_vm_cathode"] = c.create_line(0, 0, 0, 0, width=1.5, arrow=tk.LAST, arrowshape=(8,10,3), fill="blue")
+         items["wire_cathode_down"] = c.create_line(0, 0, 0, 0, width=1.5)
+         # 6. Salzbrücke
+         items["sb_top"] = c.create_line(0, 0, 0, 0, width=18, fill="lightgrey", capstyle=tk.ROUND)
+         items["sb_anode"] = c.create_line(0, 0, 0, 0, width=18, fill="lightgrey")
+         items["sb_cathode"] = c.create_line(0, 0, 0, 0, width=18, fill="lightgrey")
+         items["sb_label"] = c.create_text(0, 0, text="Salzbrücke", font=("Calibri", 9))
+         # 7. Beschriftungen
+         for side, title, reaction_label in (("anode", "Anode (-)", "Oxidation:"), ("cathode", "Kathode (+)", "Reduktion:")):
+             items[f"{side}_title"] = c.create_text(0, 0, text=title, font=("Calibri", 11, "bold"), anchor="n")
+             items[f"{side}_name"] = c.create_text(0, 0, text="", font=("Calibri", 10), anchor="n")
+             items[f"{side}_reaction_label"] = c.create_text(0, 0, text=reaction_label, font=("Calibri", 10, "bold"), anchor="n")
+             items[f"{side}_reaction"] = c.create_text(0, 0, text="", font=("Calibri", 9), anchor="n")
+         # Hinweis für zu kleine Fenster
+         items["too_small"] = c.create_text(0, 0, text="Fenster vergrößern...", font=("Calibri", 10), state="hidden")
+         self.canvas_items = items
+
+    def _update_canvas_item(self, name: str, coords: tuple, **options):
+         """Setzt Koordinaten/Optionen eines Items nur, wenn sie sich gegenüber dem letzten Aufruf geändert haben."""
+         item = self.canvas_items[name]
+         state = (coords, options)
+         previous = self._canvas_item_state.get(name)
+         if previous == state:
+             return
+         if previous is None or previous[0] != coords:
+             self.canvas.coords(item, *coords)
+         if previous is None or previous[1] != options:
+             changed = options if previous is None else {k: v for k, v in options.items() if previous[1].get(k) != v}
+             if changed:
+                 self.canvas.itemconfigure(item, **changed)
+         self._canvas_item_state[name] = state
+
     def redraw_canvas(self, event=None):
-         """Zeichnet den Inhalt der Canvas neu, passt sich an die Größe an."""
-         self.canvas.delete("all")
+         """Aktualisiert die Szene auf der Canvas (Größe, Füllstände, Spannung, Farben)."""
+         if not self.canvas_items:
+             self.build_canvas_scene()
          width = self.canvas.winfo_width()
          height = self.canvas.winfo_height()
 
          if width < 150 or height < 150:
-             self.canvas.create_text(width/2, height/2, text="Fenster vergrößern...", font=("Calibri", 10))
+             for name, item in self.canvas_items.items():
+                 previous = self._canvas_item_state.get(name)
+                 if name == "too_small" or (previous is not None and previous[1].get("state") == "hidden"):
+                     continue
+                 self.canvas.itemconfigure(item, state="hidden")
+                 self._canvas_item_state[name] = (None if previous is None else previous[0],
+                                                  {**(previous[1] if previous else {}), "state": "hidden"})
+             self._update_canvas_item("too_small", (width/2, height/2), state="normal")
              return
+         self._update_canvas_item("too_small", (width/2, height/2), state="hidden")
 
          electrode_width = max(30, width * 0.07)
          electrode_height = max(60, height * 0.35)
@@ -225,43 +350,42 @@ class BatteryApp:
          except Exception as e: # Fange andere mögliche Fehler ab
              print(f"Unerwarteter Fehler beim Holen der Farbe: {e}")
 
-
-         # --- Zeichnen ---
+         update = self._update_canvas_item
+         # --- Aktualisieren ---
          # 1. Bechergläser
-         self.canvas.create_rectangle(anode_beaker_x, beaker_y_top, anode_beaker_x + beaker_width, beaker_y_bottom, outline="grey", width=1)
-         self.canvas.create_rectangle(cathode_beaker_x, beaker_y_top, cathode_beaker_x + beaker_width, beaker_y_bottom, outline="grey", width=1)
+         update("anode_beaker", (anode_beaker_x, beaker_y_top, anode_beaker_x + beaker_width, beaker_y_bottom), state="normal")
+         update("cathode_beaker", (cathode_beaker_x, beaker_y_top, cathode_beaker_x + beaker_width, beaker_y_bottom), state="normal")
 
          # 2. Elektroden (mit Farben aus Daten)
-         self.canvas.create_rectangle(anode_x, electrode_y_top, anode_x + electrode_width, electrode_y_bottom, fill=anode_color, outline="black", width=1.5, tags="anode_electrode")
-         self.canvas.create_rectangle(cathode_x, electrode_y_top, cathode_x + electrode_width, electrode_y_bottom, fill=cathode_color, outline="black", width=1.5, tags="cathode_electrode")
+         update("anode_electrode", (anode_x, electrode_y_top, anode_x + electrode_width, electrode_y_bottom), fill=anode_color, state="normal")
+         update("cathode_electrode", (cathode_x, electrode_y_top, cathode_x + electrode_width, electrode_y_bottom), fill=cathode_color, state="normal")
 
-         # 3. Elektrolyt (Dynamisch)
-         if anode_fill_y_actual < beaker_y_bottom -1:
-            self.canvas.create_rectangle(anode_beaker_x + 1, anode_fill_y_actual, anode_beaker_x + beaker_width - 1, beaker_y_bottom -1 , fill="#ADD8E6", outline="", tags="anode_electrolyte")
-         if cathode_fill_y_actual < beaker_y_bottom - 1:
-             self.canvas.create_rectangle(cathode_beaker_x + 1, cathode_fill_y_actual, cathode_beaker_x + beaker_width -1, beaker_y_bottom -1 , fill="#ADD8E6", outline="", tags="cathode_electrolyte")
+         # 3. Elektrolyt (Dynamisch, ausgeblendet bei leerem Becher)
+         update("anode_electrolyte", (anode_beaker_x + 1, anode_fill_y_actual, anode_beaker_x + beaker_width - 1, beaker_y_bottom - 1),
+                state="normal" if anode_fill_y_actual < beaker_y_bottom - 1 else "hidden")
+         update("cathode_electrolyte", (cathode_beaker_x + 1, cathode_fill_y_actual, cathode_beaker_x + beaker_width - 1, beaker_y_bottom - 1),
+                state="normal" if cathode_fill_y_actual < beaker_y_bottom - 1 else "hidden")
 
          # 4. Voltmeter (Symbol und externe Textanzeige)
-         self.canvas.create_rectangle(voltmeter_x - vm_width/2, voltmeter_y - vm_height/2, voltmeter_x + vm_width/2, voltmeter_y + vm_height/2, outline="black", fill="white", width=1.5)
-         self.canvas.create_text(voltmeter_x, voltmeter_y, text="V", font=("Calibri", 11, "bold")) # Nur 'V'
+         update("vm_box", (voltmeter_x - vm_width/2, voltmeter_y - vm_height/2, voltmeter_x + vm_width/2, voltmeter_y + vm_height/2), state="normal")
+         update("vm_symbol", (voltmeter_x, voltmeter_y), state="normal")
          # Spannungswert rechts vom Symbol
          vm_text = self.nernst_var.get().replace("E_Nernst: ", "").strip()
          if vm_text == "---": vm_text = "? V"
-         self.canvas.create_text(voltmeter_x + vm_width/2 + 5, voltmeter_y, text=vm_text, font=("Calibri", 10, "bold"), anchor="w")
+         update("vm_value", (voltmeter_x + vm_width/2 + 5, voltmeter_y), text=vm_text, state="normal")
 
-         # 5. Drähte und Elektronenfluss (Pfeil bleibt, Text entfernt)
+         # 5. Drähte und Elektronenfluss
          anode_wire_x = anode_x + electrode_width / 2
          cathode_wire_x = cathode_x + electrode_width / 2
          wire_y_electrode = electrode_y_top - 5
-         self.canvas.create_line(anode_wire_x, wire_y_electrode, anode_wire_x, wire_y_level, width=1.5)
-         self.canvas.create_line(anode_wire_x, wire_y_level, voltmeter_x - vm_width/2, wire_y_level, width=1.5)
-         self.canvas.create_line(voltmeter_x - vm_width/2, wire_y_level, voltmeter_x - vm_width/2, voltmeter_y + vm_height/2, width=1.5)
-         self.canvas.create_line(voltmeter_x + vm_width/2, voltmeter_y + vm_height/2, voltmeter_x + vm_width/2, wire_y_level, width=1.5)
-         self.canvas.create_line(voltmeter_x + vm_width/2, wire_y_level, cathode_wire_x, wire_y_level, width=1.5, arrow=tk.LAST, arrowshape=(8,10,3), fill="blue") # Pfeil bleibt
-         self.canvas.create_line(cathode_wire_x, wire_y_level, cathode_wire_x, wire_y_electrode, width=1.5)
-         # Label "e- Fluss ->" wurde entfernt
-
-         # 6. Salzbrücke (ohne Ionenfluss-Beschriftung/Pfeile)
+         update("wire_anode_up", (anode_wire_x, wire_y_electrode, anode_wire_x, wire_y_level), state="normal")
+         update("wire_anode_vm", (anode_wire_x, wire_y_level, voltmeter_x - vm_width/2, wire_y_level), state="normal")
+         update("wire_vm_left", (voltmeter_x - vm_width/2, wire_y_level, voltmeter_x - vm_width/2, voltmeter_y + vm_height/2), state="normal")
+         update("wire_vm_right", (voltmeter_x + vm_width/2, voltmeter_y + vm_height/2, voltmeter_x + vm_width/2, wire_y_level), state="normal")
+         update("wire_vm_cathode", (voltmeter_x + vm_width/2, wire_y_level, cathode_wire_x, wire_y_level), state="normal")
+         update("wire_cathode_down", (cathode_wire_x, wire_y_level, cathode_wire_x, wire_y_electrode), state="normal")
+
+         # 6. Salzbrücke
          sb_width = 18
          sb_y1 = beaker_y_top + max(12, height * 0.04)
          sb_center_y = sb_y1
@@ -269,26 +393,22 @@ class BatteryApp:
          sb_x2_center = cathode_beaker_x + beaker_width * 0.2
          sb_anode_end_y = max(sb_y1 + 5, anode_fill_y_actual + 5)
          sb_cathode_end_y = max(sb_y1 + 5, cathode_fill_y_actual + 5)
-         self.canvas.create_line(sb_x1_center, sb_center_y, sb_x2_center, sb_center_y, width=sb_width, fill="lightgrey", capstyle=tk.ROUND)
-         self.canvas.create_line(sb_x1_center, sb_center_y, sb_x1_center, sb_anode_end_y, width=sb_width, fill="lightgrey")
-         self.canvas.create_line(sb_x2_center, sb_center_y, sb_x2_center, sb_cathode_end_y, width=sb_width, fill="lightgrey")
-         self.canvas.create_text((sb_x1_center + sb_x2_center) / 2, sb_center_y - sb_width/2 - 5, text="Salzbrücke", font=("Calibri", 9))
-         # Pfeile und Labels für Kationen/Anionen wurden entfernt
+         update("sb_top", (sb_x1_center, sb_center_y, sb_x2_center, sb_center_y), state="normal")
+         update("sb_anode", (sb_x1_center, sb_center_y, sb_x1_center, sb_anode_end_y), state="normal")
+         update("sb_cathode", (sb_x2_center, sb_center_y, sb_x2_center, sb_cathode_end_y), state="normal")
+         update("sb_label", ((sb_x1_center + sb_x2_center) / 2, sb_center_y - sb_width/2 - 5), state="normal")
 
-         # 7. Beschriftungen (ohne Ionenanzeige im Becher)
+         # 7. Beschriftungen
          base_y_labels = beaker_y_bottom + 12
          line_height = 16
-         # Anode Info
-         self.canvas.create_text(anode_beaker_x + beaker_width / 2, base_y_labels, text="Anode (-)", font=("Calibri", 11, "bold"), anchor="n")
-         self.canvas.create_text(anode_beaker_x + beaker_width / 2, base_y_labels + line_height, text=self.anode_var.get(), font=("Calibri", 10), anchor="n")
-         self.canvas.create_text(anode_beaker_x + beaker_width / 2, base_y_labels + 2.5*line_height, text="Oxidation:", font=("Calibri", 10, "bold"), anchor="n")
-         self.canvas.create_text(anode_beaker_x + beaker_width / 2, base_y_labels + 3.5*line_height, text=self.anode_reaction_var.get(), font=("Calibri", 9), width=beaker_width*1.1, anchor="n")
-         # Kathode Info
-         self.canvas.create_text(cathode_beaker_x + beaker_width / 2, base_y_labels, text="Kathode (+)", font=("Calibri", 11, "bold"), anchor="n")
-         self.canvas.create_text(cathode_beaker_x + beaker_width / 2, base_y_labels + line_height, text=self.cathode_var.get(), font=("Calibri", 10), anchor="n")
-         self.canvas.create_text(cathode_beaker_x + beaker_width / 2, base_y_labels + 2.5*line_height, text="Reduktion:", font=("Calibri", 10, "bold"), anchor="n")
-         self.canvas.create_text(cathode_beaker_x + beaker_width / 2, base_y_labels + 3.5*line_height, text=self.cathode_reaction_var.get(), font=("Calibri", 9), width=beaker_width*1.1, anchor="n")
-         # Ionenanzeigen neben Elektroden wurden entfernt
+         for side, beaker_x, element_name, reaction in (
+                 ("anode", anode_beaker_x, anode_name, self.anode_reaction_var.get()),
+                 ("cathode", cathode_beaker_x, cathode_name, self.cathode_reaction_var.get())):
+             center_x = beaker_x + beaker_width / 2
+             update(f"{side}_title", (center_x, base_y_labels), state="normal")
+             update(f"{side}_name", (center_x, base_y_labels + line_height), text=element_name, state="normal")
+             update(f"{side}_reaction_label", (center_x, base_y_labels + 2.5*line_height), state="normal")
+             update(f"{side}_reaction", (center_x, base_y_labels + 3.5*line_height), text=reaction, width=beaker_width*1.1, state="normal")
 
     def create_formula_frame(self, parent_frame):
           """Erstellt den Frame zur Anzeige der relevanten Formeln."""
@@ -299,7 +419,7 @@ class BatteryApp:
 
           formulas = [
               "Standard-Zellspannung:",
-              " E⁰_cell = E⁰(Kathode) - E⁰(Anode)",
+              " E⁰_cell(T) = E⁰(Kathode) - E⁰(Anode)",
               "", "Reaktionsquotient:",
               self.q_formula_label, # Widget einfügen
               "", "Nernst-Gleichung (bei T):",
@@ -308,7 +428,7 @@ class BatteryApp:
               f"  F = {F} C/mol",
               "  n = übertragene e⁻ (Gesamt)",
               "  T = Temperatur in Kelvin",
-              "", "Gibbs-Energie (Standard):",
+              "", "Gibbs-Energie (Standard, bei T):",
               " ΔG⁰ = -n F E⁰_cell"
           ]
 
@@ -341,7 +461,7 @@ class BatteryApp:
         fnt_bold = ('Calibri', 11, 'bold')
         fnt_normal = ('Calibri', 11)
 
-        ttk.Label(output_frame, text="Standard-Spannung (E⁰):", font=fnt_bold).grid(row=0, column=0, padx=5, pady=4, sticky="w")
+        ttk.Label(output_frame, text="Standard-Spannung E⁰(T):", font=fnt_bold).grid(row=0, column=0, padx=5, pady=4, sticky="w")
         ttk.Label(output_frame, textvariable=self.voltage_var, font=fnt_normal).grid(row=0, column=1, padx=5, pady=4, sticky="w")
 
         ttk.Label(output_frame, text="Nernst-Spannung (E_cell):", font=fnt_bold).grid(row=1, column=0, padx=5, pady=4, sticky="w")
@@ -350,7 +470,7 @@ class BatteryApp:
         ttk.Label(output_frame, text="Reaktionsquotient (Q):", font=fnt_bold).grid(row=0, column=2, padx=15, pady=4, sticky="w")
         ttk.Label(output_frame, textvariable=self.q_display_var, font=fnt_normal).grid(row=0, column=3, padx=5, pady=4, sticky="w")
 
-        ttk.Label(output_frame, text="Standard-Gibbs-Energie (ΔG⁰):", font=fnt_bold).grid(row=1, column=2, padx=15, pady=4, sticky="w")
+        ttk.Label(output_frame, text="Standard-Gibbs-Energie ΔG⁰(T):", font=fnt_bold).grid(row=1, column=2, padx=15, pady=4, sticky="w")
         ttk.Label(output_frame, textvariable=self.delta_g_var, font=fnt_normal).grid(row=1, column=3, padx=5, pady=4, sticky="w")
 
     def update_concentration_labels(self):
@@ -368,9 +488,9 @@ class BatteryApp:
             # Hole Ionenformel nur, wenn ein Name ausgewählt ist
             if ano_name:
                 # --- HINWEIS: Prüfe 'ion_formula' und 'color' in utils.py! ---
-                ano_ion = self.series_data.get_element_data(ano_name).get("ion_formula", "[?]")
+                ano_ion = self._get_ion_label(self.series_data.get_element_data(ano_name))
             if cat_name:
-                cat_ion = self.series_data.get_element_data(cat_name).get("ion_formula", "[?]")
+                cat_ion = self._get_ion_label(self.series_data.get_element_data(cat_name))
         except ValueError:
             # Wird ausgelöst, wenn get_element_data das Element nicht findet
             print(f"Warnung: Element nicht gefunden bei Label-Update ({ano_name} / {cat_name})")
@@ -389,13 +509,23 @@ class BatteryApp:
         self.anode_ion_label_var.set(ano_ion)
         self.cathode_ion_label_var.set(cat_ion)
 
+    @staticmethod
+    def _get_ion_label(element_data: dict) -> str:
+        """Ionenformel aus den Daten, sonst das Ion aus der kompilierten Halbreaktion."""
+        if element_data.get("ion_formula"):
+            return element_data["ion_formula"]
+        try:
+            return compile_reaction(element_data.get("reaction", "")).ion_species
+        except ValueError:
+            return "[?]"
+
     def handle_selection_change(self, event=None):
         """Wird aufgerufen, wenn Anode oder Kathode geändert wird."""
         self.update_concentration_labels()
         self.calculate_and_update()
 
     def calculate_and_update(self, event=None):
-        """Holt Eingaben, führt Simulation durch und aktualisiert die GUI."""
+        """Holt und validiert die Eingaben und startet die Simulation im Hintergrund-Thread."""
         # Stellt sicher, dass series_data initialisiert wurde
         if not hasattr(self, 'series_data'):
              messagebox.showerror("Fehler", "series_data nicht initialisiert. Start fehlgeschlagen.")
@@ -411,100 +541,139 @@ class BatteryApp:
             except Exception: pass
             return
 
-
+        instrumentation.count("gui.calculate_requests")
         try:
-            # Eingaben validieren
-            conc_anode_val = float(self.conc_anode_var.get().replace(',', '.'))
-            conc_cathode_val = float(self.conc_cathode_var.get().replace(',', '.'))
-            temp_val = float(self.temp_var.get().replace(',', '.'))
-
-            if conc_anode_val <= 0 or conc_cathode_val <= 0: raise ValueError("Konzentrationen müssen > 0 sein.")
-            if temp_val <= 0: raise ValueError("Temperatur muss > 0 K sein.")
-
-            # Valide Konzentrationen für Visualisierung speichern
-            self.current_conc_anode = conc_anode_val
-            self.current_conc_cathode = conc_cathode_val
-
-            # Elementdaten holen
-            anode_data = self.series_data.get_element_data(anode_name)
-            cathode_data = self.series_data.get_element_data(cathode_name)
-
-            # Simulation initialisieren
-            try:
-                 # Stellt sicher, dass BatterySimulation in simulation.py vorhanden ist
-                 self.current_simulation = BatterySimulation(cathode_element_data=cathode_data, anode_element_data=anode_data)
-            except NameError:
-                  messagebox.showerror("Fehler", "Klasse 'BatterySimulation' nicht in simulation.py gefunden.")
-                  self.reset_outputs(clear_selection=False); self.redraw_canvas(); return
-            except ValueError as sim_error: # Fehler innerhalb der Simulation (z.B. ungültiges n)
-                 messagebox.showerror("Simulationsfehler", f"Fehler beim Initialisieren:\n{sim_error}")
-                 self.reset_outputs(clear_selection=False); self.redraw_canvas(); return
-            except AttributeError as data_error: # Fehler, wenn Datenstruktur unerwartet (z.B. 'potential' fehlt)
-                 messagebox.showerror("Datenfehler", f"Fehler beim Zugriff auf Elementdaten:\n{data_error}\nPrüfen Sie utils.py.")
-                 self.reset_outputs(clear_selection=False); self.redraw_canvas(); return
-            except Exception as e: # Andere Fehler bei Initialisierung
-                 messagebox.showerror("Simulationsfehler", f"Unerwarteter Fehler bei Simulationsstart:\n{e}")
-                 self.reset_outputs(clear_selection=False); self.redraw_canvas(); return
-
-            sim = self.current_simulation
-            # Optional: Warnung bei Elektrolyse-Setup
-            if sim.anode.potential > sim.cathode.potential: pass
-
-            # Stöchiometrie und Q berechnen
-            factor_anode_ion, factor_cathode_ion = sim.get_stoichiometric_factors()
-            try:
-                 term_anode = conc_anode_val ** factor_anode_ion
-                 term_cathode = conc_cathode_val ** factor_cathode_ion
-                 if term_cathode == 0: raise ZeroDivisionError("c(Kathode) ist 0.")
-                 q_calculated = term_anode / term_cathode
-                 if q_calculated <= 0: raise ValueError("Q <= 0.")
-            except ZeroDivisionError as e: raise ValueError(f"Q-Berechnungsfehler: {e}") from e
-            except OverflowError: raise ValueError("Overflow bei Q-Berechnung.") from None
-            except ValueError as e: raise ValueError(f"Q-Berechnungsfehler: {e}") from e
-            except Exception as e: raise ValueError(f"Allg. Fehler bei Q-Berechnung: {e}") from e
-
-            # Elektrochemische Werte berechnen
-            E0_cell = sim.get_standard_cell_voltage()
-            delta_G0 = sim.get_delta_G0()
-            E_nernst = sim.get_nernst_voltage(reaction_quotient=q_calculated, temperature=temp_val)
-
-            # GUI-Variablen aktualisieren
-            self.voltage_var.set(f"{E0_cell:.3f} V")
-            self.delta_g_var.set(f"{delta_G0 / 1000:.2f} kJ/mol")
-            self.nernst_var.set(f"{E_nernst:.3f} V") # Spannung mit Einheit für redraw_canvas
-            self.q_display_var.set(f"{q_calculated:.3e}")
-            self.anode_reaction_var.set(sim.get_anode_reaction())
-            self.cathode_reaction_var.set(sim.get_cathode_reaction())
-
-            # Q-Formel aktualisieren (mit Fallback)
-            # --- HINWEIS: Prüfe 'ion_formula' in utils.py für korrekte Anzeige! ---
-            ano_ion_f = sim.anode.ion_formula if hasattr(sim.anode, 'ion_formula') else "?"
-            cat_ion_f = sim.cathode.ion_formula if hasattr(sim.cathode, 'ion_formula') else "?"
-            fac_a = factor_anode_ion if isinstance(factor_anode_ion, int) else "?"
-            fac_c = factor_cathode_ion if isinstance(factor_cathode_ion, int) else "?"
-            if ano_ion_f != "?" and cat_ion_f != "?":
-                 q_formel_str = f" Q = [{ano_ion_f}]^{fac_a} / [{cat_ion_f}]^{fac_c}"
-            else:
-                 q_formel_str = f" Q = [Prod.]^{fac_a} / [Reakt.]^{fac_c}" # Fallback
-            # Stelle sicher, dass das Label existiert, bevor config aufgerufen wird
-            if hasattr(self, 'q_formula_label') and self.q_formula_label:
-                self.q_formula_label.config(text=q_formel_str)
-            else:
-                print("Warnung: q_formula_label nicht gefunden zum Konfigurieren.")
-
-
-            # Canvas neu zeichnen
-            self.redraw_canvas()
-
-        except ValueError as e: # Fängt Validierungs- und Berechnungsfehler
+            with instrumentation.stage("gui.parse_inputs"):
+                # Eingaben validieren
+                conc_anode_val = float(self.conc_anode_var.get().replace(',', '.'))
+                conc_cathode_val = float(self.conc_cathode_var.get().replace(',', '.'))
+                temp_val = float(self.temp_var.get().replace(',', '.'))
+
+                if conc_anode_val <= 0 or conc_cathode_val <= 0: raise ValueError("Konzentrationen müssen > 0 sein.")
+                if temp_val <= 0: raise ValueError("Temperatur muss > 0 K sein.")
+
+                # Elemente prüfen (die Simulation selbst kommt im Worker aus dem Cache)
+                self.series_data.get_element_index(anode_name)
+                self.series_data.get_element_index(cathode_name)
+        except ValueError as e: # Fängt Validierungsfehler
             messagebox.showerror("Eingabe-/Berechnungsfehler", f"Fehler: {e}")
             self.reset_outputs(clear_selection=False); self.redraw_canvas()
-        except Exception as e: # Fängt alle anderen Fehler ab
-            import traceback
-            print("------ UNERWARTETER FEHLER ------"); traceback.print_exc(); print("-------------------------------")
-            messagebox.showerror("Allgemeiner Fehler", f"Unerwarteter Fehler:\n{type(e).__name__}: {e}\nDetails siehe Konsole.")
-            self.reset_outputs(clear_selection=False); self.redraw_canvas()
+            return
 
+        # Gleiche Eingaben (z. B. <Return> gefolgt von <FocusOut>) werden vom Worker zusammengefasst
+        key = (anode_name, cathode_name, conc_anode_val, conc_cathode_val, temp_val)
+        with instrumentation.stage("gui.submit"):
+            self.worker.submit(
+                key,
+                lambda: self.compute_results(self.simulation_cache, anode_name, cathode_name,
+                                             conc_anode_val, conc_cathode_val, temp_val),
+                self.apply_results,
+                self.handle_calculation_error,
+            )
+
+    @staticmethod
+    def compute_results(simulation_cache: SimulationCache, anode_name: str, cathode_name: str,
+                        conc_anode_val: float, conc_cathode_val: float, temp_val: float) -> dict:
+        """
+        Führt die Simulation aus (läuft im Worker-Thread, greift daher nicht auf Tk zu)
+        und gibt alle anzuzeigenden Werte zurück.
+        """
+        with instrumentation.stage("worker.simulation_setup"):
+            sim = simulation_cache.get(anode_name, cathode_name)
+
+        with instrumentation.stage("worker.nernst"):
+            # Stöchiometrie und Q berechnen (im Log-Raum, kein Über-/Unterlauf bei extremen Werten)
+            factor_anode_ion, factor_cathode_ion = sim.get_stoichiometric_factors()
+            log_q = sim.get_log_reaction_quotient(conc_anode_val, conc_cathode_val, temp_val)
+
+            return {
+                "simulation": sim,
+                # Eindeutige Bezeichnungen der Halbreaktionen (für den Ergebnisspeicher)
+                "anode_label": simulation_cache.series.get_element_label(anode_name),
+                "cathode_label": simulation_cache.series.get_element_label(cathode_name),
+                "conc_anode": conc_anode_val,
+                "conc_cathode": conc_cathode_val,
+                "temperature": temp_val,
+                "factor_anode_ion": factor_anode_ion,
+                "factor_cathode_ion": factor_cathode_ion,
+                "log_q": log_q,
+                # E⁰ und ΔG⁰ bei der gewählten Temperatur (wie E_Nernst, CLI und Zellmatrix)
+                "E0_cell": sim.get_standard_cell_voltage(temp_val),
+                "delta_G0": sim.get_delta_G0(temp_val),
+                "E_nernst": sim.get_nernst_voltage_from_log_q(log_q, temperature=temp_val),
+            }
+
+    def flush_result_store(self):
+        """Schreibt die seit dem letzten Aufruf angehängten Ergebnisse als Segment (läuft im Tk-Thread)."""
+        self._store_flush_id = None
+        if self.result_store is not None:
+            self.result_store.flush()
+
+    def apply_results(self, results: dict):
+        """Überträgt die Ergebnisse aus dem Worker in die GUI (läuft im Tk-Thread)."""
+        sim = results["simulation"]
+        self.current_simulation = sim
+        # Valide Konzentrationen für Visualisierung speichern
+        self.current_conc_anode = results["conc_anode"]
+        self.current_conc_cathode = results["conc_cathode"]
+        factor_anode_ion = results["factor_anode_ion"]
+        factor_cathode_ion = results["factor_cathode_ion"]
+
+        # GUI-Variablen aktualisieren
+        self.voltage_var.set(f"{results['E0_cell']:.3f} V")
+        self.delta_g_var.set(f"{results['delta_G0'] / 1000:.2f} kJ/mol")
+        self.nernst_var.set(f"{results['E_nernst']:.3f} V") # Spannung mit Einheit für redraw_canvas
+        self.q_display_var.set(self.format_log_quantity(results["log_q"]))
+        self.anode_reaction_var.set(sim.get_anode_reaction())
+        self.cathode_reaction_var.set(sim.get_cathode_reaction())
+        if self.result_store is not None:
+            self.result_store.append(results["anode_label"], results["cathode_label"], results["conc_anode"],
+                                     results["conc_cathode"], results["temperature"], results["log_q"],
+                                     results["E0_cell"], results["E_nernst"], results["delta_G0"])
+            # Kurz danach schreiben, damit andere Leser (und ein Absturz) die Zeile nicht verlieren
+            if self._store_flush_id is None:
+                self._store_flush_id = self.root.after(RESULT_STORE_FLUSH_MS, self.flush_result_store)
+
+        # Q-Formel aktualisieren (mit Fallback)
+        # --- HINWEIS: Prüfe 'ion_formula' in utils.py für korrekte Anzeige! ---
+        ano_ion_f = sim.anode.ion_formula if hasattr(sim.anode, 'ion_formula') else "?"
+        cat_ion_f = sim.cathode.ion_formula if hasattr(sim.cathode, 'ion_formula') else "?"
+        fac_a = factor_anode_ion if isinstance(factor_anode_ion, int) else "?"
+        fac_c = factor_cathode_ion if isinstance(factor_cathode_ion, int) else "?"
+        if ano_ion_f != "?" and cat_ion_f != "?":
+             q_formel_str = f" Q = [{ano_ion_f}]^{fac_a} / [{cat_ion_f}]^{fac_c}"
+        else:
+             q_formel_str = f" Q = [Prod.]^{fac_a} / [Reakt.]^{fac_c}" # Fallback
+        # Stelle sicher, dass das Label existiert, bevor config aufgerufen wird
+        if hasattr(self, 'q_formula_label') and self.q_formula_label:
+            self.q_formula_label.config(text=q_formel_str)
+        else:
+            print("Warnung: q_formula_label nicht gefunden zum Konfigurieren.")
+
+        # Canvas neu zeichnen
+        self.redraw_canvas()
+
+    def handle_calculation_error(self, error: Exception):
+        """Zeigt Fehler aus dem Worker an (läuft im Tk-Thread)."""
+        if isinstance(error, ValueError): # Fehler innerhalb der Simulation (z.B. ungültiges n)
+            messagebox.showerror("Simulationsfehler", f"Fehler: {error}")
+        elif isinstance(error, (AttributeError, KeyError)): # Datenstruktur unerwartet (z.B. 'potential' fehlt)
+            messagebox.showerror("Datenfehler", f"Fehler beim Zugriff auf Elementdaten:\n{error}\nPrüfen Sie utils.py.")
+        else: # Fängt alle anderen Fehler ab
+            import traceback
+            print("------ UNERWARTETER FEHLER ------"); traceback.print_exception(error); print("-------------------------------")
+            messagebox.showerror("Allgemeiner Fehler", f"Unerwarteter Fehler:\n{type(error).__name__}: {error}\nDetails siehe Konsole.")
+        self.reset_outputs(clear_selection=False); self.redraw_canvas()
+
+    @staticmethod
+    def format_log_quantity(log_value: float) -> str:
+        """Formatiert exp(log_value) wissenschaftlich, ohne den Wert selbst zu bilden (z. B. Q = 1e-900)."""
+        log10_value = log_value / math.log(10)
+        exponent = math.floor(log10_value)
+        mantissa = 10 ** (log10_value - exponent)
+        if mantissa >= 9.9995: # Rundung auf 3 Nachkommastellen ergäbe 10.000
+            mantissa /= 10; exponent += 1
+        return f"{mantissa:.3f}e{exponent:+03d}"
 
     def reset_outputs(self, clear_selection=True):
          """Setzt die Ausgabefelder und Schema-Infos zurück."""
@@ -526,8 +695,11 @@ class BatteryApp:
          if hasattr(self, 'q_formula_label') and self.q_formula_label:
              self.q_formula_label.config(text=" Q = [Prod.] / [Reakt.]")
 
-         # Reset Simulationsobjekt
+         # Reset Simulationsobjekt; angezeigte Werte entsprechen keiner Eingabe mehr,
+         # ein noch laufendes Ergebnis darf sie nicht wieder überschreiben
          self.current_simulation = None
+         if hasattr(self, 'worker'):
+             self.worker.cancel()
 
          # Optional: Auswahl zurücksetzen
          if clear_selection:
@@ -536,6 +708,10 @@ class BatteryApp:
               self.update_concentration_labels() # Aktualisiert c(...) Labels
 
 
+# Zeitmessung der Apply-/Zeichenpfade (nur aktiv, wenn die Instrumentierung eingeschaltet ist)
+instrumentation.instrument_methods(BatteryApp, ("apply_results", "redraw_canvas"), prefix="gui")
+
+
 # --- Hauptprogramm ---
 if __name__ == "__main__":
     root = tk.Tk()
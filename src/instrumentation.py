@@ -0,0 +1,211 @@
+# instrumentation.py
+"""
+Leichtgewichtige Instrumentierung der heißen Pfade (Timer, Zähler, Latenz-Histogramme).
+
+Standardmäßig deaktiviert; eingeschaltet über `enable()` oder die Umgebungsvariable
+BATTERY_INSTRUMENTATION=1. Im deaktivierten Zustand kostet:
+    - `stage(name)`: ein Funktionsaufruf, der einen gemeinsamen No-op-Kontextmanager zurückgibt
+    - `count(name)`: ein Funktionsaufruf mit einer Flag-Abfrage
+    - per `instrument_methods` registrierte Methoden: nichts, da die Wrapper erst bei
+      `enable()` in die Klasse eingesetzt und bei `disable()` wieder entfernt werden
+
+Zeiten werden in logarithmischen Buckets (Zweierpotenzen in Nanosekunden) gezählt;
+`snapshot()`/`dump_json()` liefern je Stufe Aufrufzahl, Summe, Min/Max, Quantile und Histogramm.
+"""
+import functools
+import json
+import os
+import threading
+import time
+
+ENV_VAR = "BATTERY_INSTRUMENTATION"
+
+_enabled = False
+_lock = threading.Lock()
+_timers: dict[str, "LatencyHistogram"] = {}
+_counters: dict[str, int] = {}
+# Registrierte Methoden: (Klasse, Methodenname, Stufenname) -> Originalfunktion
+_registered: dict[tuple[type, str, str], object] = {}
+
+
+class LatencyHistogram:
+    """Histogramm mit Bucket i = Dauern in [2^(i-1), 2^i) ns; dazu Anzahl, Summe, Min und Max."""
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.buckets: dict[int, int] = {}
+
+    def add(self, duration_ns: int) -> None:
+        self.count += 1
+        self.total_ns += duration_ns
+        if self.min_ns is None or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        bucket = duration_ns.bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """Obergrenze (in s) des Buckets, in dem das q-Quantil liegt."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(2 ** bucket, self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_s": self.total_ns / 1e9,
+            "mean_s": self.total_ns / self.count / 1e9 if self.count else 0.0,
+            "min_s": (self.min_ns or 0) / 1e9,
+            "max_s": self.max_ns / 1e9,
+            "p50_s": self.quantile(0.5),
+            "p90_s": self.quantile(0.9),
+            "p99_s": self.quantile(0.99),
+            "histogram": [{"le_s": 2 ** bucket / 1e9, "count": self.buckets[bucket]}
+                          for bucket in sorted(self.buckets)],
+        }
+
+
+def record(name: str, duration_ns: int) -> None:
+    """Trägt eine gemessene Dauer ein (thread-sicher, z. B. aus dem GUI-Worker)."""
+    with _lock:
+        histogram = _timers.get(name)
+        if histogram is None:
+            histogram = _timers[name] = LatencyHistogram()
+        histogram.add(duration_ns)
+
+
+class _Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str):
+    """Kontextmanager, der die Dauer des Blocks unter `name` erfasst (No-op, wenn deaktiviert)."""
+    return _Stage(name) if _enabled else _NULL_STAGE
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Erhöht einen Zähler (No-op, wenn deaktiviert)."""
+    if _enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + amount
+
+
+def _make_wrapper(func, name: str):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(name, time.perf_counter_ns() - start)
+    wrapper.__instrumented__ = func
+    return wrapper
+
+
+def instrument_methods(cls: type, names, prefix: str) -> None:
+    """
+    Registriert Methoden einer Klasse für die Zeitmessung unter "<prefix>.<methode>".
+    Die Wrapper sind nur bei aktivierter Instrumentierung eingesetzt.
+    """
+    for method_name in names:
+        original = cls.__dict__[method_name]
+        key = (cls, method_name, f"{prefix}.{method_name}")
+        _registered[key] = original
+        if _enabled:
+            setattr(cls, method_name, _make_wrapper(original, key[2]))
+
+
+def _install(active: bool) -> None:
+    for (cls, method_name, stage_name), original in _registered.items():
+        setattr(cls, method_name, _make_wrapper(original, stage_name) if active else original)
+
+
+def enable() -> None:
+    global _enabled
+    if not _enabled:
+        _enabled = True
+        _install(True)
+
+
+def disable() -> None:
+    global _enabled
+    if _enabled:
+        _enabled = False
+        _install(False)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """Verwirft alle bisher gesammelten Messwerte."""
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+
+def snapshot() -> dict:
+    """Aktueller Stand aller Stufen und Zähler als JSON-fähiges Dict."""
+    with _lock:
+        return {
+            "enabled": _enabled,
+            "stages": {name: histogram.to_dict() for name, histogram in sorted(_timers.items())},
+            "counters": dict(sorted(_counters.items())),
+        }
+
+
+def dump_json(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(snapshot(), handle, indent=2)
+
+
+def status_line(stages=None) -> str:
+    """Kurzzusammenfassung (Anzahl und p50 je Stufe), z. B. für eine Statuszeile in der GUI."""
+    with _lock:
+        names = stages or sorted(_timers)
+        parts = []
+        for name in names:
+            histogram = _timers.get(name)
+            if histogram is not None:
+                parts.append(f"{name}: {histogram.count}× p50 {histogram.quantile(0.5) * 1e6:.0f} µs")
+    return " | ".join(parts) if parts else "Keine Messwerte"
+
+
+if os.environ.get(ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on"):
+    enable()
@@ -0,0 +1,245 @@
+# pack.py
+"""
+Batteriepack aus vielen gleichartigen galvanischen Zellen in Serien-/Parallelschaltung (sSpP).
+
+Der Zustand aller Zellen liegt in zusammenhängenden Arrays der Form (n_series, n_parallel)
+(Structure-of-Arrays): Konzentrationen, Temperaturen, Innenwiderstände und Volumina. Eine
+Auswertung des ganzen Packs ist eine Handvoll NumPy-Operationen, unabhängig von der Zellzahl:
+
+    E_i        = E⁰(T_i) - (R T_i / nF) * ln Q_i                  (Nernst, je Zelle)
+    Gruppe g:  G_g = Σ 1/R_i,  E_g = Σ (E_i / R_i) / G_g,  R_g = 1 / G_g  (Thévenin der Parallelgruppe)
+    Pack:      V = Σ E_g - I * Σ R_g,  Zellstrom I_i = (E_i - V_g) / R_i
+
+Ungleiche Zellen (Streuung) führen so automatisch zu ungleicher Stromaufteilung und
+Ausgleichsströmen innerhalb einer Parallelgruppe. Unter Last werden die Konzentrationen je Zelle
+nach dem Faradayschen Gesetz mit festem Zeitschritt fortgeschrieben (wie `DischargeSimulator`,
+Strom positiv = Entladung). Die Temperaturen gelten als konstant; E⁰(T_i) und R T_i / nF werden
+einmal berechnet (nach Änderungen `set_temperature` verwenden).
+"""
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
+
+import numpy as np
+
+from simulation import BatterySimulation, F, R
+
+
+class PackState(NamedTuple):
+    """Momentaufnahme des Packs bei einem Packstrom."""
+    voltage: float                      # Klemmenspannung des Packs in V
+    current: float                      # Packstrom in A (positiv = Entladung)
+    open_circuit_voltage: float         # Leerlaufspannung des Packs in V
+    cell_open_circuit_voltage: np.ndarray  # Nernst-Spannung je Zelle in V, Form (n_series, n_parallel)
+    cell_current: np.ndarray            # Strom je Zelle in A, Form (n_series, n_parallel)
+
+
+class PackChunk(NamedTuple):
+    """Ein Block der Pack-Entladekurve; alle Arrays haben dieselbe Länge."""
+    time: np.ndarray              # s
+    voltage: np.ndarray           # Klemmenspannung des Packs in V
+    current: np.ndarray           # Packstrom in A
+    charge: np.ndarray            # bisher geflossene Ladung in C
+    min_cell_current: np.ndarray  # kleinster Zellstrom in A (Streuung/Ausgleichsströme)
+    max_cell_current: np.ndarray  # größter Zellstrom in A
+
+
+PACK_COLUMNS = PackChunk._fields
+
+
+class BatteryPack:
+    """
+    Pack aus `n_series` in Reihe geschalteten Gruppen mit je `n_parallel` parallelen Zellen
+    desselben Elektrodenpaares.
+
+    Alle Zellgrößen dürfen Skalare oder auf (n_series, n_parallel) broadcastbare Arrays sein;
+    sie werden als eigene, zusammenhängende float64-Arrays gespeichert.
+    """
+    def __init__(self, simulation: BatterySimulation, n_series: int, n_parallel: int = 1,
+                 conc_anode=1.0, conc_cathode=1.0, temperature=298.15, internal_resistance=0.01,
+                 volume_anode=1.0, volume_cathode=1.0) -> None:
+        """
+        :param simulation: Elektrodenpaar (gemeinsam für alle Zellen, inkl. Aktivitätsmodell)
+        :param n_series: Anzahl der in Reihe geschalteten Gruppen
+        :param n_parallel: Zellen je Parallelgruppe
+        :param conc_anode: Konzentration des Anoden-Ions in mol/L
+        :param conc_cathode: Konzentration des Kathoden-Ions in mol/L
+        :param temperature: Temperatur in K
+        :param internal_resistance: Innenwiderstand in Ohm (> 0 bei n_parallel > 1)
+        :param volume_anode: Elektrolytvolumen der Anodenhalbzelle in L
+        :param volume_cathode: Elektrolytvolumen der Kathodenhalbzelle in L
+        """
+        if n_series < 1 or n_parallel < 1:
+            raise ValueError("n_series und n_parallel müssen >= 1 sein.")
+        self.simulation = simulation
+        self.shape = (int(n_series), int(n_parallel))
+
+        self.conc_anode = self._cell_array(conc_anode)
+        self.conc_cathode = self._cell_array(conc_cathode)
+        self.internal_resistance = self._cell_array(internal_resistance)
+        self.volume_anode = self._cell_array(volume_anode)
+        self.volume_cathode = self._cell_array(volume_cathode)
+        if np.any(self.conc_anode <= 0) or np.any(self.conc_cathode <= 0):
+            raise ValueError("Konzentrationen müssen > 0 sein.")
+        if np.any(self.volume_anode <= 0) or np.any(self.volume_cathode <= 0):
+            raise ValueError("Elektrolytvolumina müssen > 0 sein.")
+        if np.any(self.internal_resistance < 0):
+            raise ValueError("Innenwiderstand darf nicht negativ sein.")
+        if n_parallel > 1 and np.any(self.internal_resistance == 0):
+            raise ValueError("Parallel geschaltete Zellen benötigen einen Innenwiderstand > 0.")
+
+        # Konzentrationsänderung je Coulomb Zellladung (Anode +, Kathode -), wie DischargeSimulator
+        charge_per_mol = simulation.n_overall * F
+        self._dconc_anode_per_C = simulation.factor_anode_ion / (charge_per_mol * self.volume_anode)
+        self._dconc_cathode_per_C = -simulation.factor_cathode_ion / (charge_per_mol * self.volume_cathode)
+        with np.errstate(divide="ignore"):
+            self._conductance = 1.0 / self.internal_resistance
+        self.set_temperature(temperature)
+
+    def _cell_array(self, value) -> np.ndarray:
+        try:
+            return np.array(np.broadcast_to(np.asarray(value, dtype=np.float64), self.shape))
+        except ValueError:
+            raise ValueError(f"Zellgröße mit Form {np.shape(value)} passt nicht zu {self.shape}.") from None
+
+    @classmethod
+    def with_variation(cls, simulation: BatterySimulation, n_series: int, n_parallel: int = 1,
+                       conc_anode: float = 1.0, conc_cathode: float = 1.0, temperature: float = 298.15,
+                       internal_resistance: float = 0.01, volume_anode: float = 1.0, volume_cathode: float = 1.0,
+                       rel_sigma_conc: float = 0.0, rel_sigma_resistance: float = 0.0,
+                       rel_sigma_volume: float = 0.0, sigma_temperature: float = 0.0,
+                       seed: int | None = None) -> "BatteryPack":
+        """
+        Pack mit Zell-zu-Zell-Streuung um die Nennwerte.
+        Relative Streuungen wirken multiplikativ (log-normal, bleibt positiv), die Temperatur additiv (K).
+        Das Volumen streut gemeinsam für beide Halbzellen (Kapazitätsstreuung).
+        """
+        rng = np.random.default_rng(seed)
+        shape = (n_series, n_parallel)
+
+        def spread(nominal: float, rel_sigma: float) -> np.ndarray:
+            if rel_sigma <= 0:
+                return np.full(shape, nominal)
+            return nominal * np.exp(rng.normal(0.0, rel_sigma, shape))
+
+        volume_factor = spread(1.0, rel_sigma_volume)
+        temperatures = temperature + (rng.normal(0.0, sigma_temperature, shape) if sigma_temperature > 0 else 0.0)
+        return cls(simulation, n_series, n_parallel,
+                   conc_anode=spread(conc_anode, rel_sigma_conc),
+                   conc_cathode=spread(conc_cathode, rel_sigma_conc),
+                   temperature=temperatures,
+                   internal_resistance=spread(internal_resistance, rel_sigma_resistance),
+                   volume_anode=volume_anode * volume_factor,
+                   volume_cathode=volume_cathode * volume_factor)
+
+    @property
+    def n_cells(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    def set_temperature(self, temperature) -> None:
+        """Setzt die Zelltemperaturen (K) und berechnet E⁰(T) und R T / nF je Zelle neu."""
+        temperature = self._cell_array(temperature)
+        if np.any(temperature <= 0):
+            raise ValueError("Temperatur muss positiv sein (in Kelvin).")
+        self.temperature = temperature
+        self._e0_cell = np.broadcast_to(self.simulation.get_standard_cell_voltage_batch(temperature), self.shape)
+        self._thermal_voltage = R * temperature / (self.simulation.n_overall * F)
+
+    def cell_open_circuit_voltage(self) -> np.ndarray:
+        """Nernst-Spannung aller Zellen in einer vektorisierten Auswertung."""
+        log_q = self.simulation.get_log_reaction_quotient_batch(self.conc_anode, self.conc_cathode, self.temperature)
+        return self._e0_cell - self._thermal_voltage * log_q
+
+    def evaluate(self, current: float | None = None, load_resistance: float | None = None) -> PackState:
+        """
+        Klemmenspannung und Stromaufteilung bei gegebenem Packstrom oder ohmscher Last.
+        Ohne Angabe wird der Leerlauf (I = 0) ausgewertet.
+        """
+        if current is not None and load_resistance is not None:
+            raise ValueError("Nur eines von 'current' oder 'load_resistance' angeben.")
+        cell_ocv = self.cell_open_circuit_voltage()
+        if self.shape[1] == 1:
+            group_ocv = cell_ocv[:, 0]
+            group_resistance = self.internal_resistance[:, 0]
+        else:
+            weighted = cell_ocv * self._conductance
+            group_conductance = self._conductance.sum(axis=1)
+            group_ocv = weighted.sum(axis=1) / group_conductance
+            group_resistance = 1.0 / group_conductance
+        pack_ocv = float(group_ocv.sum())
+        pack_resistance = float(group_resistance.sum())
+
+        if load_resistance is not None:
+            if load_resistance + pack_resistance <= 0:
+                raise ValueError("Lastwiderstand muss > 0 sein.")
+            current = pack_ocv / (load_resistance + pack_resistance)
+        current = 0.0 if current is None else float(current)
+
+        if self.shape[1] == 1:
+            cell_current = np.full(self.shape, current)
+        else:
+            group_voltage = group_ocv - current * group_resistance
+            cell_current = (cell_ocv - group_voltage[:, np.newaxis]) * self._conductance
+        return PackState(pack_ocv - current * pack_resistance, current, pack_ocv, cell_ocv, cell_current)
+
+    def step(self, dt: float, current: float | None = None, load_resistance: float | None = None,
+             min_concentration: float = 1e-9) -> tuple[PackState, bool]:
+        """
+        Wertet den Pack aus und schreibt die Konzentrationen um `dt` Sekunden fort (explizit, in-place).
+
+        :return: (Zustand zu Beginn des Schritts, erschöpft). Würde eine Konzentration unter
+                 `min_concentration` fallen, bleibt der Zustand unverändert und `erschöpft` ist True.
+        """
+        if dt <= 0:
+            raise ValueError("Zeitschritt muss > 0 sein.")
+        state = self.evaluate(current, load_resistance)
+        return state, not self._advance(state.cell_current, dt, min_concentration)
+
+    def _advance(self, cell_current: np.ndarray, dt: float, min_concentration: float) -> bool:
+        """Faraday-Schritt für alle Zellen; False (ohne Änderung), wenn eine Zelle erschöpft wäre."""
+        charge = cell_current * dt
+        conc_anode = self.conc_anode + self._dconc_anode_per_C * charge
+        conc_cathode = self.conc_cathode + self._dconc_cathode_per_C * charge
+        if conc_anode.min() < min_concentration or conc_cathode.min() < min_concentration:
+            return False
+        self.conc_anode, self.conc_cathode = conc_anode, conc_cathode
+        return True
+
+    def run(self, current: float | Callable[[float], float] | None = None, load_resistance: float | None = None,
+            dt: float = 1.0, t_end: float = 3600.0, cutoff_voltage: float = 0.0,
+            min_concentration: float = 1e-9, chunk_size: int = 4096) -> Iterator[PackChunk]:
+        """
+        Simuliert die Entladung mit festem Zeitschritt und liefert die Kurve blockweise (Generator).
+        Abbruch bei `t_end`, Unterschreiten von `cutoff_voltage` oder Erschöpfung einer Zelle.
+
+        :param current: Konstanter Packstrom in A oder Funktion t -> I(t)
+        :param load_resistance: Alternativ: ohmscher Lastwiderstand in Ohm
+        """
+        if (current is None) == (load_resistance is None):
+            raise ValueError("Genau eines von 'current' oder 'load_resistance' muss angegeben werden.")
+        if dt <= 0:
+            raise ValueError("Zeitschritt muss > 0 sein.")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size muss > 0 sein.")
+
+        buffer = np.empty((len(PACK_COLUMNS), chunk_size), dtype=np.float64)
+        count = 0
+        t = 0.0
+        charge = 0.0
+        while True:
+            i_pack = current(t) if callable(current) else current
+            state = self.evaluate(i_pack, load_resistance)
+            buffer[:, count] = (t, state.voltage, state.current, charge,
+                                state.cell_current.min(), state.cell_current.max())
+            count += 1
+            if count == chunk_size:
+                yield PackChunk(*buffer.copy())
+                count = 0
+            if state.voltage < cutoff_voltage or t >= t_end:
+                break
+            step = min(dt, t_end - t)
+            if not self._advance(state.cell_current, step, min_concentration):
+                break
+            t += step
+            charge += state.current * step
+        if count:
+            yield PackChunk(*buffer[:, :count].copy())
@@ -0,0 +1,125 @@
+# reactions.py
+import re
+from functools import lru_cache
+
+# Erlaubte Reaktionspfeile (Daten aus utils.py nutzen "->", gescrapte Daten teils Unicode)
+_ARROW_PATTERN = re.compile(r"\s*(?:<->|->|→|⇌|⇄|=)\s*")
+# Terme werden an " + " getrennt; das "+" einer Ionenladung (z. B. "H+") steht ohne Leerzeichen davor
+_TERM_SPLIT_PATTERN = re.compile(r"\s+\+\s*")
+_TERM_PATTERN = re.compile(r"^(\d+(?:\.\d+)?)?\s*(\S.*)$")
+_ELECTRON_SPECIES = ("e-", "e⁻")
+_FROM_SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻", "0123456789+-")
+# Nur eindeutige Ladungsschreibweisen (in dieser Reihenfolge geprüft):
+#   hochgestellt ("Cu²⁺", "MnO₄⁻"), mit ^ oder Leerzeichen ("Fe^3+", "Fe^{3+}", "Fe 3+"),
+#   Vorzeichen direkt nach einem Nicht-Ziffer-Zeichen ("Li+", "Cl-", "MnO₄-") als Ladung ±1.
+# "NO3-" oder "Cu2+" sind mehrdeutig (Index oder Ladung?) und werden nicht geraten.
+_CHARGE_PATTERNS = (
+    re.compile(r"^(.+?)([⁰¹²³⁴⁵⁶⁷⁸⁹]*)([⁺⁻])$"),
+    re.compile(r"^(.+?)([⁰¹²³⁴⁵⁶⁷⁸⁹]+)([+-])$"),
+    re.compile(r"^(.+?)(?:\^\{?|\s+)(\d*)([+-])\}?$"),
+    re.compile(r"^(.*[^\d\s])()([+-])$"),
+)
+
+
+class HalfReaction:
+    """
+    Einmal geparste (kompilierte) Halbreaktion in Reduktionsrichtung: Ox + n e- -> Red.
+    Hält Spezies und Koeffizienten als Tupel, damit im Rechenpfad keine String-Arbeit anfällt.
+    """
+    __slots__ = ("reaction", "oxidized", "reduced", "electrons",
+                 "ion_species", "ion_coefficient", "product_species", "product_coefficient",
+                 "oxidation")
+
+    def __init__(self, reaction: str, oxidized: tuple, reduced: tuple, electrons: int | float) -> None:
+        self.reaction = reaction
+        self.oxidized = oxidized    # ((Spezies, Koeffizient), ...) ohne Elektronen
+        self.reduced = reduced      # ((Spezies, Koeffizient), ...)
+        self.electrons = electrons  # Anzahl der Elektronen laut Reaktionsgleichung (0, falls nicht angegeben)
+        # Das gelöste Ion ist die erste Spezies der oxidierten Seite (z. B. "Cu2+" oder "H+" in "2H+")
+        self.ion_species, self.ion_coefficient = oxidized[0] if oxidized else ("?", 1)
+        self.product_species, self.product_coefficient = reduced[0] if reduced else ("?", 1)
+        self.oxidation = self._format_oxidation()
+
+    def ion_charge(self) -> int | None:
+        """
+        Ladung des gelösten Ions: explizit notiert (siehe `split_charge`) oder, bei einer einfachen
+        Halbreaktion Ion + n e- -> Produkt, aus der Ladungsbilanz ("Cu2+ + 2e- -> Cu" -> 2).
+        None, wenn die Ladung so nicht eindeutig bestimmbar ist.
+        """
+        ion = split_charge(self.ion_species)
+        if ion is not None:
+            return ion[1] or None
+        if len(self.oxidized) != 1 or len(self.reduced) != 1 or not self.electrons:
+            return None
+        product = split_charge(self.product_species)
+        if product is None:
+            return None
+        charge = (self.electrons + product[1] * self.product_coefficient) / self.ion_coefficient
+        return int(charge) if charge and float(charge).is_integer() else None
+
+    def _format_oxidation(self) -> str:
+        oxidized = " + ".join(_format_term(species, coeff) for species, coeff in self.oxidized)
+        reduced = " + ".join(_format_term(species, coeff) for species, coeff in self.reduced)
+        return f"{reduced} -> {oxidized} + {_format_term('e-', self.electrons)}"
+
+    def __repr__(self) -> str:
+        return (f"HalfReaction(reaction='{self.reaction}', oxidized={self.oxidized}, "
+                f"reduced={self.reduced}, electrons={self.electrons})")
+
+
+def _format_term(species: str, coefficient: int | float) -> str:
+    return species if coefficient == 1 else f"{coefficient}{species}"
+
+
+def split_charge(species: str) -> tuple[str, int] | None:
+    """
+    Trennt eine Spezies in Formel und Ladung, z. B. "Fe^3+" -> ("Fe", 3), "MnO₄⁻" -> ("MnO₄", -1),
+    "Cu" -> ("Cu", 0). Gibt None zurück, wenn die Ladung mehrdeutig notiert ist ("NO3-").
+    """
+    species = species.strip()
+    for pattern in _CHARGE_PATTERNS:
+        match = pattern.match(species)
+        if match:
+            base, digits, sign = match.groups()
+            number = int(digits.translate(_FROM_SUPERSCRIPTS)) if digits else 1
+            return base, number if sign in "+⁺" else -number
+    if species.endswith(("+", "-")):
+        return None
+    return species, 0
+
+
+def _parse_side(side: str) -> tuple[tuple[tuple[str, int | float], ...], int | float]:
+    """Zerlegt eine Seite der Reaktion in Spezies mit Koeffizienten und die Elektronenanzahl."""
+    terms = []
+    electrons = 0
+    for term in _TERM_SPLIT_PATTERN.split(side.strip()):
+        match = _TERM_PATTERN.match(term.strip())
+        if not match:
+            raise ValueError(f"Ungültiger Term '{term}' in Reaktionsgleichung.")
+        coeff_str, species = match.groups()
+        if coeff_str is None:
+            coefficient = 1
+        elif "." in coeff_str:
+            coefficient = float(coeff_str)
+        else:
+            coefficient = int(coeff_str)
+        if species in _ELECTRON_SPECIES:
+            electrons += coefficient
+        else:
+            terms.append((species, coefficient))
+    return tuple(terms), electrons
+
+
+@lru_cache(maxsize=None)
+def compile_reaction(reaction: str) -> HalfReaction:
+    """
+    Parst eine Halbreaktion der Form "2H+ + 2e- -> H2" genau einmal (Ergebnis wird pro String gecacht).
+
+    :raises ValueError: Wenn die Reaktion keinen Pfeil bzw. keine zwei Seiten hat.
+    """
+    sides = _ARROW_PATTERN.split(reaction.strip())
+    if len(sides) != 2 or not sides[0] or not sides[1]:
+        raise ValueError(f"Reaktion '{reaction}' konnte nicht geparst werden.")
+    oxidized, electrons = _parse_side(sides[0])
+    reduced, _ = _parse_side(sides[1])
+    return HalfReaction(reaction, oxidized, reduced, electrons)
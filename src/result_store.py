@@ -0,0 +1,373 @@
+# result_store.py
+"""
+Append-only Ergebnisspeicher für berechnete Zellpunkte (GUI, CLI, Sweeps).
+
+Aufbau eines Speicherverzeichnisses:
+    names.json               Wörterbuch der Elementnamen; Anode/Kathode werden als int32-Codes gespeichert
+    seg_000000/              Segment: eine .npy-Datei je Spalte plus index.json
+        anode.npy, ..., timestamp.npy
+        index.json           {"rows": n, "min": {...}, "max": {...}} je Spalte
+
+    .lock                    Sperrdatei der Schreiber
+
+Segmente sind unveränderlich: neue Zeilen werden gepuffert und beim `flush()` (bzw. alle
+`segment_size` Zeilen) als neues Segment geschrieben, zuerst in ein temporäres Verzeichnis und
+dann atomar umbenannt. Gelesen wird per `np.load(..., mmap_mode="r")`, also nur die Seiten, die
+eine Abfrage tatsächlich berührt. Anhand des Min/Max-Index überspringt `query` Segmente, die
+einen Filter (Wertebereich oder Elementname) nicht erfüllen können, ohne sie zu öffnen.
+
+Mehrere Schreiber (z. B. GUI und `cli.py --store`) dürfen dasselbe Verzeichnis gleichzeitig nutzen:
+`flush` hält eine exklusive Sperre auf `.lock` und liest Wörterbuch und Segmentliste darin neu ein,
+bevor es Namen ergänzt und die nächste Segmentnummer vergibt. Gepufferte Zeilen tragen bis dahin
+nur lokale Namenscodes. Leser brauchen keine Sperre; `query` lädt neue Segmente und Namen nach.
+"""
+import json
+import os
+import shutil
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+RESULT_COLUMNS = ("anode", "cathode", "conc_anode", "conc_cathode", "temperature",
+                  "log_reaction_quotient", "E0_cell", "nernst_voltage", "delta_G0", "timestamp")
+NAME_COLUMNS = ("anode", "cathode")
+STORE_VERSION = 1
+_NAMES_FILE = "names.json"
+_INDEX_FILE = "index.json"
+_LOCK_FILE = ".lock"
+
+
+def _column_dtype(column: str):
+    return np.int32 if column in NAME_COLUMNS else np.float64
+
+
+class SegmentInfo(NamedTuple):
+    """Metadaten eines geschriebenen Segments."""
+    path: str
+    rows: int
+    minimum: dict  # Spalte -> kleinster Wert (None, wenn nur NaN)
+    maximum: dict  # Spalte -> größter Wert
+
+
+class _StoreLock:
+    """
+    Exklusive, prozessübergreifende Sperre auf eine Datei (fcntl bzw. msvcrt).
+    Das Betriebssystem gibt sie auch frei, wenn ein Schreiber abstürzt.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._handle = None
+
+    def __enter__(self) -> "_StoreLock":
+        self._handle = open(self.path, "a+b")
+        try:
+            if os.name == "nt":
+                import msvcrt
+                self._handle.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(self._handle.fileno(), msvcrt.LK_LOCK, 1) # versucht es ~10 s lang
+                        break
+                    except OSError:
+                        continue
+            else:
+                import fcntl
+                fcntl.flock(self._handle.fileno(), fcntl.LOCK_EX)
+        except BaseException:
+            self._handle.close()
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        try:
+            if os.name == "nt":
+                import msvcrt
+                self._handle.seek(0)
+                msvcrt.locking(self._handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._handle.close()
+            self._handle = None
+        return False
+
+
+class ResultStore:
+    """
+    Spaltenorientierter, nur anhängender Speicher mit Segmenten aus .npy-Dateien.
+
+    Spalten (`RESULT_COLUMNS`): anode, cathode (Namen), conc_anode, conc_cathode (mol/L),
+    temperature (K), log_reaction_quotient (ln Q), E0_cell (V), delta_G0 (J/mol) und nernst_voltage (V),
+    alle bei der Temperatur der Zeile (E⁰(T), ΔG⁰(T) = -nF E⁰(T)), timestamp (Unix-Zeit in s).
+    Mehrere Schreiber und Leser (auch in verschiedenen Prozessen) sind möglich, siehe Modulbeschreibung.
+    """
+    def __init__(self, path: str, segment_size: int = 1_000_000) -> None:
+        if segment_size <= 0:
+            raise ValueError("segment_size muss > 0 sein.")
+        self.path = path
+        self.segment_size = segment_size
+        os.makedirs(path, exist_ok=True)
+        # Gespeichertes Wörterbuch (Stand der letzten `refresh`) und geschriebene Segmente
+        self.names: list[str] = []
+        self._codes: dict[str, int] = {}
+        self.segments: list[SegmentInfo] = []
+        self.refresh()
+        # Lokales Wörterbuch der gepufferten Zeilen; beim flush auf gespeicherte Codes abgebildet
+        self._pending_names: list[str] = []
+        self._pending_codes: dict[str, int] = {}
+        self._pending_rows: list[tuple] = []
+        self._pending_batches: list[dict[str, np.ndarray]] = []
+        self._pending_count = 0
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        self.close()
+        return False
+
+    def __len__(self) -> int:
+        """Anzahl aller Zeilen (geschrieben und noch gepuffert)."""
+        return sum(segment.rows for segment in self.segments) + self._pending_count
+
+    # ------------------------------------------------------------------ Schreiben
+
+    def _code(self, name: str) -> int:
+        """Lokaler Code eines Namens in den gepufferten Zeilen."""
+        code = self._pending_codes.get(name)
+        if code is None:
+            code = self._pending_codes[name] = len(self._pending_names)
+            self._pending_names.append(name)
+        return code
+
+    def append(self, anode: str, cathode: str, conc_anode: float, conc_cathode: float, temperature: float,
+               log_reaction_quotient: float, E0_cell: float, nernst_voltage: float, delta_G0: float,
+               timestamp: float | None = None) -> None:
+        """Hängt eine einzelne Zeile an (gepuffert, z. B. pro GUI-/CLI-Berechnung)."""
+        self._pending_rows.append((
+            self._code(anode), self._code(cathode), conc_anode, conc_cathode, temperature,
+            log_reaction_quotient, E0_cell, nernst_voltage, delta_G0,
+            time.time() if timestamp is None else timestamp,
+        ))
+        self._pending_count += 1
+        if self._pending_count >= self.segment_size:
+            self.flush()
+
+    def append_batch(self, anode, cathode, conc_anode, conc_cathode, temperature, log_reaction_quotient,
+                     E0_cell, nernst_voltage, delta_G0, timestamp=None) -> None:
+        """
+        Hängt viele Zeilen auf einmal an. Alle Werte werden gegeneinander gebroadcastet;
+        Namen dürfen einzelne Strings oder Sequenzen von Strings sein.
+        """
+        columns = {
+            "conc_anode": conc_anode, "conc_cathode": conc_cathode, "temperature": temperature,
+            "log_reaction_quotient": log_reaction_quotient, "E0_cell": E0_cell,
+            "nernst_voltage": nernst_voltage, "delta_G0": delta_G0,
+            "timestamp": time.time() if timestamp is None else timestamp,
+        }
+        for column, names in (("anode", anode), ("cathode", cathode)):
+            if isinstance(names, str):
+                columns[column] = self._code(names)
+            else:
+                # Wörterbuch-Codierung je eindeutigem Namen, nicht je Zeile
+                unique, inverse = np.unique(np.asarray(names, dtype=object).astype(str), return_inverse=True)
+                codes = np.array([self._code(name) for name in unique.tolist()], dtype=np.int32)
+                columns[column] = codes[inverse]
+        arrays = np.broadcast_arrays(*(np.asarray(columns[column], dtype=_column_dtype(column))
+                                       for column in RESULT_COLUMNS))
+        batch = {column: np.ravel(values) for column, values in zip(RESULT_COLUMNS, arrays)}
+        self._collect_rows()  # Einzelzeilen davor behalten ihre Reihenfolge
+        self._pending_batches.append(batch)
+        self._pending_count += len(batch["timestamp"])
+        if self._pending_count >= self.segment_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Schreibt alle gepufferten Zeilen als neue Segment(e) mit höchstens `segment_size` Zeilen.
+        Unter der Sperre des Verzeichnisses werden zuerst Wörterbuch und Segmentliste anderer
+        Schreiber nachgeladen und die lokalen Namenscodes auf die gespeicherten abgebildet.
+        """
+        if not self._pending_count:
+            return
+        self._collect_rows()
+        merged = {column: np.concatenate([batch[column] for batch in self._pending_batches])
+                  for column in RESULT_COLUMNS}
+
+        with _StoreLock(os.path.join(self.path, _LOCK_FILE)):
+            self.refresh()
+            known = len(self.names)
+            remap = np.array([self._stored_code(name) for name in self._pending_names], dtype=np.int32)
+            for column in NAME_COLUMNS:
+                merged[column] = remap[merged[column]]
+            # Wörterbuch vor den Segmenten sichern, damit kein Segment unbekannte Codes enthält
+            if len(self.names) > known:
+                self._write_names()
+            total = len(merged["timestamp"])
+            for start in range(0, total, self.segment_size):
+                self._write_segment({column: values[start:start + self.segment_size]
+                                     for column, values in merged.items()})
+
+        self._pending_batches = []
+        self._pending_count = 0
+        self._pending_names = []
+        self._pending_codes = {}
+
+    def _stored_code(self, name: str) -> int:
+        """Code eines Namens im gespeicherten Wörterbuch; neue Namen werden angehängt (nur unter der Sperre)."""
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def close(self) -> None:
+        self.flush()
+
+    def _collect_rows(self) -> None:
+        """Fasst gepufferte Einzelzeilen zu einem Block zusammen (in Einfügereihenfolge)."""
+        if self._pending_rows:
+            rows = list(zip(*self._pending_rows))
+            self._pending_batches.append({column: np.array(values, dtype=_column_dtype(column))
+                                          for column, values in zip(RESULT_COLUMNS, rows)})
+            self._pending_rows = []
+
+    def _write_names(self) -> None:
+        target = os.path.join(self.path, _NAMES_FILE)
+        tmp_path = target + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"version": STORE_VERSION, "names": self.names}, handle, ensure_ascii=False)
+        os.replace(tmp_path, target)
+
+    def _write_segment(self, columns: dict[str, np.ndarray]) -> None:
+        # Nur unter der Sperre aufrufen: die Nummer folgt auf das zuletzt (von irgendwem) geschriebene Segment
+        number = int(os.path.basename(self.segments[-1].path)[4:]) + 1 if self.segments else 0
+        segment_path = os.path.join(self.path, f"seg_{number:06d}")
+        tmp_path = segment_path + ".tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True) # Rest eines abgebrochenen Schreibvorgangs
+        os.makedirs(tmp_path)
+
+        minimum, maximum = {}, {}
+        for column, values in columns.items():
+            np.save(os.path.join(tmp_path, f"{column}.npy"), np.ascontiguousarray(values))
+            finite = values[~np.isnan(values)] if values.dtype.kind == "f" else values
+            minimum[column] = finite.min().item() if finite.size else None
+            maximum[column] = finite.max().item() if finite.size else None
+        rows = len(columns["timestamp"])
+        with open(os.path.join(tmp_path, _INDEX_FILE), "w", encoding="utf-8") as handle:
+            json.dump({"version": STORE_VERSION, "rows": rows, "min": minimum, "max": maximum}, handle)
+        os.replace(tmp_path, segment_path)
+        self.segments.append(SegmentInfo(segment_path, rows, minimum, maximum))
+
+    # ------------------------------------------------------------------ Lesen
+
+    def refresh(self) -> None:
+        """
+        Lädt Segmente und Wörterbuch nach, die andere Schreiber inzwischen ergänzt haben.
+        Segmente zuerst: das Wörterbuch wird vor jedem Segment geschrieben und enthält daher alle Codes.
+        """
+        self.segments = self._load_segments()
+        self.names = self._load_names()
+        self._codes = {name: code for code, name in enumerate(self.names)}
+
+    def _load_names(self) -> list[str]:
+        try:
+            with open(os.path.join(self.path, _NAMES_FILE), encoding="utf-8") as handle:
+                return list(json.load(handle)["names"])
+        except FileNotFoundError:
+            return []
+
+    def _load_segments(self) -> list[SegmentInfo]:
+        """Alle fertigen Segmente; bereits bekannte werden nicht erneut eingelesen (Segmente sind unveränderlich)."""
+        known = {segment.path: segment for segment in self.segments}
+        segments = []
+        for entry in sorted(os.listdir(self.path)):
+            # Nicht fertig geschriebene Segmente (".tmp") werden ignoriert
+            if not entry.startswith("seg_") or entry.endswith(".tmp"):
+                continue
+            segment_path = os.path.join(self.path, entry)
+            if segment_path in known:
+                segments.append(known[segment_path])
+                continue
+            with open(os.path.join(segment_path, _INDEX_FILE), encoding="utf-8") as handle:
+                index = json.load(handle)
+            if index.get("version") != STORE_VERSION:
+                raise ValueError(f"Segment '{segment_path}' hat eine nicht unterstützte Version.")
+            segments.append(SegmentInfo(segment_path, index["rows"], index["min"], index["max"]))
+        return segments
+
+    def read_segment(self, segment: SegmentInfo, columns=None) -> dict[str, np.ndarray]:
+        """Spalten eines Segments als Memory-Maps (schreibgeschützt)."""
+        return {column: np.load(os.path.join(segment.path, f"{column}.npy"), mmap_mode="r")
+                for column in (columns or RESULT_COLUMNS)}
+
+    def query(self, columns=None, anode: str | None = None, cathode: str | None = None,
+              decode_names: bool = True, **ranges) -> dict[str, np.ndarray]:
+        """
+        Liest alle Zeilen, die den Filtern genügen, aus den geschriebenen Segmenten.
+
+        :param columns: Zurückzugebende Spalten (Standard: alle)
+        :param anode: Nur Zeilen mit dieser Anode
+        :param cathode: Nur Zeilen mit dieser Kathode
+        :param decode_names: Namensspalten als Strings statt als Codes zurückgeben
+        :param ranges: Spalte=(min, max), inklusive; None als offene Grenze,
+                       z. B. temperature=(290, 310), nernst_voltage=(1.0, None)
+        """
+        columns = tuple(columns or RESULT_COLUMNS)
+        for column in (*columns, *ranges):
+            if column not in RESULT_COLUMNS:
+                raise ValueError(f"Unbekannte Spalte '{column}' (erwartet: {', '.join(RESULT_COLUMNS)}).")
+        self.refresh()
+        bounds = dict(ranges)
+        for column, name in (("anode", anode), ("cathode", cathode)):
+            if name is not None:
+                code = self._codes.get(name)
+                if code is None:  # Name nie gespeichert: kein Segment kann passen
+                    return self._empty_result(columns, decode_names)
+                bounds[column] = (code, code)
+
+        parts = {column: [] for column in columns}
+        for segment in self.segments:
+            if not self._may_match(segment, bounds):
+                continue
+            data = self.read_segment(segment, set(columns) | set(bounds))
+            mask = None
+            for column, (low, high) in bounds.items():
+                values = data[column]
+                condition = np.ones(segment.rows, dtype=bool)
+                if low is not None:
+                    condition &= values >= low
+                if high is not None:
+                    condition &= values <= high
+                mask = condition if mask is None else mask & condition
+            for column in columns:
+                parts[column].append(np.array(data[column] if mask is None else data[column][mask]))
+
+        if not any(parts[column] for column in columns):
+            return self._empty_result(columns, decode_names)
+        result = {column: np.concatenate(values) for column, values in parts.items()}
+        return self._decode(result) if decode_names else result
+
+    @staticmethod
+    def _may_match(segment: SegmentInfo, bounds: dict) -> bool:
+        """Prüft anhand des Min/Max-Index, ob das Segment Treffer enthalten kann."""
+        for column, (low, high) in bounds.items():
+            minimum, maximum = segment.minimum.get(column), segment.maximum.get(column)
+            if minimum is None:  # Nur NaN: kein Vergleich kann wahr sein
+                return False
+            if (low is not None and maximum < low) or (high is not None and minimum > high):
+                return False
+        return True
+
+    def _decode(self, result: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        names = np.array(self.names, dtype=object)
+        for column in NAME_COLUMNS:
+            if column in result:
+                result[column] = names[result[column]]
+        return result
+
+    def _empty_result(self, columns, decode_names: bool) -> dict[str, np.ndarray]:
+        result = {column: np.empty(0, dtype=_column_dtype(column)) for column in columns}
+        return self._decode(result) if decode_names else result
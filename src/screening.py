@@ -0,0 +1,239 @@
+# screening.py
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+
+from simulation import F
+from temperature import e0_table_lookup
+from utils import ElectrochemicalSeries
+
+
+class CellMatrix:
+    """
+    Kenngrößen aller geordneten Elektrodenpaare einer Spannungsreihe.
+    Zeile i = Anode (Oxidation), Spalte j = Kathode (Reduktion); die Diagonale ist ungültig.
+    `elements` enthält die eindeutigen Bezeichnungen aus `ElectrochemicalSeries.get_element_names`.
+    """
+    def __init__(self, elements: tuple[str, ...], E0_cell: np.ndarray, n_overall: np.ndarray, delta_G0: np.ndarray) -> None:
+        self.elements = elements
+        self.E0_cell = E0_cell      # E⁰(Kathode) - E⁰(Anode) in V
+        self.n_overall = n_overall  # kgV der Elektronenanzahlen
+        self.delta_G0 = delta_G0    # -n * F * E⁰_cell in J/mol
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def top_couples(self, k: int = 10, by: str = "voltage") -> list[dict]:
+        """
+        Gibt die k besten Paare zurück, absteigend sortiert.
+
+        Nur die k Kandidaten werden sortiert; die Vorauswahl erfolgt per `np.argpartition`
+        in O(n²) statt einer vollständigen Sortierung aller Paare.
+
+        :param k: Anzahl der Paare
+        :param by: "voltage" (größtes E⁰_cell) oder "delta_G" (größtes |ΔG⁰|)
+        """
+        if by == "voltage":
+            score = self.E0_cell
+        elif by == "delta_G":
+            score = np.abs(self.delta_G0)
+        else:
+            raise ValueError(f"Unbekanntes Sortierkriterium '{by}' (erwartet 'voltage' oder 'delta_G').")
+
+        size = len(self.elements)
+        flat = score.ravel().copy()
+        flat[::size + 1] = -np.inf  # Diagonale (Anode == Kathode) ausschließen
+        k = max(0, min(k, size * size - size))
+        if k == 0:
+            return []
+
+        candidates = np.argpartition(flat, -k)[-k:]
+        candidates = candidates[np.argsort(flat[candidates], kind="stable")[::-1]]
+        anode_rows, cathode_rows = np.divmod(candidates, size)
+
+        return [
+            {
+                "anode": self.elements[a],
+                "cathode": self.elements[c],
+                "E0_cell": float(self.E0_cell[a, c]),
+                "n": int(self.n_overall[a, c]),
+                "delta_G0": float(self.delta_G0[a, c]),
+            }
+            for a, c in zip(anode_rows.tolist(), cathode_rows.tolist())
+        ]
+
+
+def compute_cell_matrix(series: ElectrochemicalSeries, temperature: float | None = None) -> CellMatrix:
+    """
+    Berechnet E⁰_cell, n (kgV) und ΔG⁰ für alle geordneten Paare in einem vektorisierten Durchlauf.
+    Entspricht elementweise (bitgleich) `BatterySimulation.get_standard_cell_voltage(temperature)`
+    bzw. `get_delta_G0(temperature)`.
+
+    :param temperature: Optional Temperatur in K; dann gilt E⁰_cell(T) aus denselben Tabellen wie in
+                        der Simulation (siehe temperature.py), sonst die Werte bei 25 °C
+    """
+    columns = series.columns
+    if np.any(columns.n <= 0):
+        raise ValueError("Elektronenanzahl in der Spannungsreihe ungültig (<= 0).")
+
+    def pairwise(values: np.ndarray) -> np.ndarray:  # Kathode (Spalte) - Anode (Zeile)
+        return values[np.newaxis, :] - values[:, np.newaxis]
+
+    E0_cell = pairwise(columns.E0)
+    if temperature is not None:
+        E0_cell = e0_table_lookup(E0_cell, pairwise(columns.dE0_dT), pairwise(columns.d2E0_dT2), temperature)
+    n_overall = np.lcm(columns.n[:, np.newaxis], columns.n[np.newaxis, :])
+    delta_G0 = -n_overall * F * E0_cell
+    return CellMatrix(columns.labels, E0_cell, n_overall, delta_G0)
+
+
+# 1 mAh = 3.6 C; F / (3.6 * M[g/mol]) ergibt mAh/g, mAh/g * V ergibt Wh/kg
+_MAH_PER_COULOMB = 1 / 3.6
+SPECIFIC_ENERGY_COLUMNS = ("anode", "cathode", "E0_cell", "n", "capacity_anode", "capacity_cathode",
+                           "capacity", "specific_energy")
+
+
+def molar_masses_from_materials(materials: Iterable, names: Mapping[str, str] | None = None) -> dict[str, float]:
+    """
+    Molare Massen (g/mol) je Element der Spannungsreihe aus PubChem-Daten.
+
+    :param materials: `BatteryMaterial`-Objekte, Dicts mit "name"/"molecular_weight" oder ein
+                      DataFrame aus `get_battery_material_data`
+    :param names: Zuordnung Element der Spannungsreihe -> Materialname (z. B. {"Zn": "Zinc"});
+                  ohne Eintrag wird das Element selbst als Materialname erwartet
+    """
+    if hasattr(materials, "to_dict"):  # DataFrame
+        materials = materials.to_dict("records")
+    by_material = {}
+    for material in materials:
+        data = material.get_data() if hasattr(material, "get_data") else material
+        weight = data.get("molecular_weight") if data else None
+        if weight is None or data.get("name") is None:
+            continue
+        try:
+            by_material[data["name"]] = float(weight)
+        except (TypeError, ValueError):
+            continue  # PubChem liefert Massen teils als String; unlesbare Werte überspringen
+    if names is None:
+        return by_material
+    material_to_element = {material: element for element, material in names.items()}
+    return {material_to_element.get(material, material): weight for material, weight in by_material.items()}
+
+
+class SpecificEnergyTable:
+    """
+    Theoretische spezifische Kapazität und Energie von Elektrodenpaaren als Spalten (1D-Arrays).
+
+    capacity_anode/-cathode = n_i F / M_i, capacity = F / (M_A / n_A + M_K / n_K) (Masse beider
+    Reaktanden pro Mol Elektronen), jeweils in mAh/g; specific_energy = capacity * E⁰_cell in Wh/kg.
+    Die Namensspalten sind als Indizes in `elements` gespeichert und werden erst bei der Ausgabe aufgelöst.
+    """
+    def __init__(self, elements: tuple[str, ...], columns: dict[str, np.ndarray]) -> None:
+        self.elements = elements
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["E0_cell"])
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        if column in ("anode", "cathode"):
+            return np.array(self.elements, dtype=object)[self.columns[column]]
+        return self.columns[column]
+
+    def _take(self, rows) -> "SpecificEnergyTable":
+        return SpecificEnergyTable(self.elements, {column: values[rows] for column, values in self.columns.items()})
+
+    @staticmethod
+    def _check_column(by: str) -> None:
+        if by not in SPECIFIC_ENERGY_COLUMNS or by in ("anode", "cathode"):
+            raise ValueError(f"Unbekanntes Sortierkriterium '{by}'.")
+
+    def sort(self, by: str = "specific_energy", descending: bool = True) -> "SpecificEnergyTable":
+        """Nach einer Spalte sortierte Kopie (NaN am Ende)."""
+        self._check_column(by)
+        values = self.columns[by]
+        order = np.argsort(-values if descending else values)
+        return self._take(order)
+
+    def filter(self, min_voltage: float | None = None, max_voltage: float | None = None,
+               min_capacity: float | None = None, min_energy: float | None = None,
+               anodes: Iterable[str] | None = None, cathodes: Iterable[str] | None = None) -> "SpecificEnergyTable":
+        """Gefilterte Kopie (Reihenfolge bleibt erhalten); alle Kriterien werden kombiniert."""
+        mask = np.ones(len(self), dtype=bool)
+        for column, low, high in (("E0_cell", min_voltage, max_voltage), ("capacity", min_capacity, None),
+                                  ("specific_energy", min_energy, None)):
+            if low is not None:
+                mask &= self.columns[column] >= low
+            if high is not None:
+                mask &= self.columns[column] <= high
+        for column, selected in (("anode", anodes), ("cathode", cathodes)):
+            if selected is not None:
+                wanted = set(selected)
+                indices = [index for index, element in enumerate(self.elements) if element in wanted]
+                mask &= np.isin(self.columns[column], indices)
+        return self._take(mask)
+
+    def top(self, k: int = 10, by: str = "specific_energy") -> "SpecificEnergyTable":
+        """Die k besten Zeilen; vorausgewählt per `np.argpartition`, nur diese werden sortiert."""
+        self._check_column(by)
+        k = max(0, min(k, len(self)))
+        if k == 0:
+            return self._take(slice(0, 0))
+        values = np.nan_to_num(self.columns[by], nan=-np.inf)
+        candidates = np.argpartition(values, -k)[-k:]
+        return self._take(candidates[np.argsort(values[candidates], kind="stable")[::-1]])
+
+    def to_records(self) -> list[dict]:
+        names = {column: self[column].tolist() for column in ("anode", "cathode")}
+        values = {column: self.columns[column].tolist() for column in SPECIFIC_ENERGY_COLUMNS[2:]}
+        return [{**{column: names[column][row] for column in names},
+                 **{column: values[column][row] for column in values}} for row in range(len(self))]
+
+    def to_dataframe(self):
+        """Tabelle als pandas-DataFrame (pandas wird erst hier importiert)."""
+        import pandas as pd
+        return pd.DataFrame({column: self[column] for column in SPECIFIC_ENERGY_COLUMNS})
+
+
+def compute_specific_energy(series: ElectrochemicalSeries, molar_masses: Mapping[str, float],
+                            temperature: float | None = None, include_negative: bool = False) -> SpecificEnergyTable:
+    """
+    Theoretische spezifische Kapazität und Energie aller Paare, deren Elemente eine molare Masse haben,
+    absteigend nach spezifischer Energie sortiert. Eine Auswertung über n Spezies kostet n Dict-Zugriffe
+    und ansonsten nur Array-Operationen über die n² Paare.
+
+    :param molar_masses: Element der Spannungsreihe -> molare Masse in g/mol
+                         (z. B. aus `molar_masses_from_materials`)
+    :param temperature: Optional Temperatur in K für E⁰(T) (wie `compute_cell_matrix`)
+    :param include_negative: Auch Paare mit E⁰_cell <= 0 (elektrolytische Zellen) aufnehmen
+    """
+    matrix = compute_cell_matrix(series, temperature)
+    electrons = series.columns.n.astype(np.float64)
+    # Molare Masse je Element (alle Halbreaktionen eines Elements teilen sie)
+    mass = np.array([molar_masses.get(element, np.nan) for element in series.columns.elements], dtype=np.float64)
+    mass[~(mass > 0)] = np.nan  # fehlende oder ungültige Massen
+
+    mass_per_electron = mass / electrons  # g pro Mol Elektronen
+    capacity_species = F * _MAH_PER_COULOMB / mass_per_electron
+    usable = np.isfinite(mass_per_electron)
+    mask = usable[:, np.newaxis] & usable[np.newaxis, :]
+    np.fill_diagonal(mask, False)
+    if not include_negative:
+        mask &= matrix.E0_cell > 0
+    anode, cathode = np.nonzero(mask)
+
+    # Erst nur die Energie berechnen und sortieren, dann alle Spalten direkt in Rangfolge aufbauen
+    capacity = F * _MAH_PER_COULOMB / (mass_per_electron[anode] + mass_per_electron[cathode])
+    energy = capacity * matrix.E0_cell[anode, cathode]
+    order = np.argsort(-energy)
+    anode, cathode = anode[order], cathode[order]
+    return SpecificEnergyTable(matrix.elements, {
+        "anode": anode,
+        "cathode": cathode,
+        "E0_cell": matrix.E0_cell[anode, cathode],
+        "n": matrix.n_overall[anode, cathode],
+        "capacity_anode": capacity_species[anode],
+        "capacity_cathode": capacity_species[cathode],
+        "capacity": capacity[order],
+        "specific_energy": energy[order],
+    })
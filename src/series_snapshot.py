@@ -0,0 +1,150 @@
+# series_snapshot.py
+"""
+Versioniertes Binärformat für die Spannungsreihe, das per `np.memmap` ohne Parsen geladen wird.
+
+Aufbau der Datei (alle Abschnitte auf 64 Byte ausgerichtet):
+    MAGIC (8 Byte) | Header-Länge (uint32, little endian) | Header (JSON)
+    Datensätze  (strukturiertes Array, eine Zeile pro Halbreaktion; Strings als Index in die Stringtabelle)
+    Offsets     (int64, string_count + 1 Einträge)
+    Stringdaten (UTF-8, hintereinander)
+
+Versionen: 1 = E0 und n; 2 = zusätzlich dE0_dT und d2E0_dT2. Dateien der Version 1 werden weiterhin
+gelesen, ihre Temperaturkoeffizienten gelten als 0 (E⁰ temperaturunabhängig).
+"""
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b"ECSERIES"
+SNAPSHOT_VERSION = 2
+SUPPORTED_VERSIONS = (1, 2)
+# Ab Version 2 gespeicherte Felder; in älteren Dateien als 0 ergänzt
+_TEMPERATURE_FIELDS = ("dE0_dT", "d2E0_dT2")
+_ALIGNMENT = 64
+
+STRING_FIELDS = ("element", "reaction", "ion_formula", "color")
+RECORD_DTYPE = np.dtype([
+    ("element", "<i4"),
+    ("reaction", "<i4"),
+    ("ion_formula", "<i4"),
+    ("color", "<i4"),
+    ("E0", "<f8"),
+    ("n", "<i4"),
+    ("dE0_dT", "<f8"),
+    ("d2E0_dT2", "<f8"),
+])
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+class SeriesSnapshot:
+    """Speicherabgebildeter Snapshot: `records` ist ein read-only memmap, Strings werden bei Bedarf dekodiert."""
+    def __init__(self, path: str, header: dict, records: np.ndarray, string_offsets: np.ndarray, string_blob: np.ndarray) -> None:
+        self.path = path
+        self.header = header
+        self.records = records
+        self._string_offsets = string_offsets
+        self._string_blob = string_blob
+        self._strings: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def string(self, index: int) -> str:
+        text = self._strings.get(index)
+        if text is None:
+            start, stop = self._string_offsets[index], self._string_offsets[index + 1]
+            text = self._string_blob[start:stop].tobytes().decode("utf-8")
+            self._strings[index] = text
+        return text
+
+    def string_column(self, field: str) -> list[str]:
+        """Alle Werte einer String-Spalte (z. B. "element") in Zeilenreihenfolge."""
+        return [self.string(index) for index in self.records[field].tolist()]
+
+    def row(self, index: int) -> dict:
+        """Baut einen Eintrag im Schema von `ElectrochemicalSeries.series`."""
+        record = self.records[index]
+        entry = {field: self.string(int(record[field])) for field in STRING_FIELDS}
+        for field in self.records.dtype.names:
+            if field not in STRING_FIELDS:
+                value = record[field]
+                entry[field] = int(value) if np.issubdtype(value.dtype, np.integer) else float(value)
+        for field in _TEMPERATURE_FIELDS:
+            entry.setdefault(field, 0.0)
+        return entry
+
+
+def write_series_snapshot(entries: list[dict], path: str) -> None:
+    """Schreibt Einträge im Schema der Spannungsreihe als Binär-Snapshot."""
+    strings: dict[str, int] = {}
+
+    def intern(text) -> int:
+        text = "" if text is None else str(text)
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+
+    records = np.zeros(len(entries), dtype=RECORD_DTYPE)
+    for field in RECORD_DTYPE.names:
+        if field in STRING_FIELDS:
+            records[field] = [intern(entry.get(field)) for entry in entries]
+        else:
+            records[field] = [entry.get(field, 0) or 0 for entry in entries]
+
+    encoded = [text.encode("utf-8") for text in strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+    np.cumsum([len(blob) for blob in encoded], out=string_offsets[1:])
+    string_blob = b"".join(encoded)
+
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "count": len(records),
+        "record_dtype": [[name, RECORD_DTYPE[name].str] for name in RECORD_DTYPE.names],
+        "string_count": len(encoded),
+    }
+    # Offsets hängen von der Header-Länge ab; Platz für die Zahlen großzügig reservieren
+    header_bytes = json.dumps(header).encode("utf-8")
+    records_offset = _align(len(MAGIC) + 4 + len(header_bytes) + 128)
+    offsets_offset = _align(records_offset + records.nbytes)
+    blob_offset = _align(offsets_offset + string_offsets.nbytes)
+    header.update(records_offset=records_offset, string_offsets_offset=offsets_offset,
+                  string_blob_offset=blob_offset, string_blob_size=len(string_blob))
+    header_bytes = json.dumps(header).encode("utf-8")
+    if len(MAGIC) + 4 + len(header_bytes) > records_offset:
+        raise RuntimeError("Header des Snapshots ist zu groß.")
+
+    with open(path, "wb") as handle:
+        handle.write(MAGIC)
+        handle.write(struct.pack("<I", len(header_bytes)))
+        handle.write(header_bytes)
+        for offset, payload in ((records_offset, records.tobytes()),
+                                (offsets_offset, string_offsets.tobytes()),
+                                (blob_offset, string_blob)):
+            handle.write(b"\0" * (offset - handle.tell()))
+            handle.write(payload)
+
+
+def load_series_snapshot(path: str) -> SeriesSnapshot:
+    """Öffnet einen Snapshot per memmap; es werden keine Datensätze kopiert oder geparst."""
+    with open(path, "rb") as handle:
+        if handle.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"'{path}' ist kein Spannungsreihen-Snapshot.")
+        (header_length,) = struct.unpack("<I", handle.read(4))
+        header = json.loads(handle.read(header_length))
+    if header.get("version") not in SUPPORTED_VERSIONS:
+        raise ValueError(f"Snapshot-Version {header.get('version')} wird nicht unterstützt "
+                         f"(erwartet: {', '.join(map(str, SUPPORTED_VERSIONS))}).")
+
+    dtype = np.dtype([(name, code) for name, code in header["record_dtype"]])
+    count = header["count"]
+    records = np.memmap(path, dtype=dtype, mode="r", offset=header["records_offset"], shape=(count,)) if count else np.zeros(0, dtype=dtype)
+    string_offsets = np.memmap(path, dtype="<i8", mode="r", offset=header["string_offsets_offset"],
+                               shape=(header["string_count"] + 1,))
+    blob_size = header["string_blob_size"]
+    string_blob = (np.memmap(path, dtype=np.uint8, mode="r", offset=header["string_blob_offset"], shape=(blob_size,))
+                   if blob_size else np.zeros(0, dtype=np.uint8))
+    return SeriesSnapshot(path, header, records, string_offsets, string_blob)
@@ -1,37 +1,71 @@
 # simulation.py
 import math
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import numpy as np
+    from activity import ActivityModel, IonTerms
 # Nimm an, dass utils.py im selben Ordner liegt oder im PYTHONPATH ist
 from utils import ElectrochemicalSeries
+from reactions import HalfReaction, compile_reaction
+from temperature import E0TemperatureTable, get_e0_table
+import instrumentation
 
 R = 8.314  # universelle Gaskonstante in J/(mol·K)
 F = 96485  # Faraday-Konstante in C/mol
 
-class ElectrochemicalElement:
-    """Adapter-Klasse für elektrochemische Elementdaten."""
+class _Frozen:
+    """Macht Instanzen nach `_freeze()` unveränderlich, damit sie gefahrlos geteilt (gecacht) werden können."""
+    _frozen = False
+
+    def _freeze(self) -> None:
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name, value) -> None:
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} ist unveränderlich (Attribut '{name}').")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name) -> None:
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} ist unveränderlich (Attribut '{name}').")
+        object.__delattr__(self, name)
+
+
+class ElectrochemicalElement(_Frozen):
+    """Adapter-Klasse für elektrochemische Elementdaten (nach der Konstruktion unveränderlich)."""
     def __init__(self, element_data: dict) -> None:
         self.element = element_data.get("element", "N/A")
         self.reaction = element_data.get("reaction", "N/A")
         self.potential = element_data.get("E0", 0.0)  # Standard-Reduktionspotential in V
+        self.dE0_dT = element_data.get("dE0_dT", 0.0) or 0.0      # Temperaturkoeffizient in V/K
+        self.d2E0_dT2 = element_data.get("d2E0_dT2", 0.0) or 0.0  # Zweite Ableitung in V/K²
         self.electrons = element_data.get("n", 0)     # Anzahl der übertragenen Elektronen
         # Nutze die explizite Ionenformel aus den Daten
         self.ion_formula = element_data.get("ion_formula", "?") # Angepasste Variable
+        # Reaktionsgleichung einmal kompilieren (gecacht pro Reaktionsstring)
+        try:
+            self.half_reaction: HalfReaction | None = compile_reaction(self.reaction)
+        except ValueError:
+            self.half_reaction = None
+        if self.half_reaction is not None and self.half_reaction.electrons == 0 and self.electrons:
+            # Reaktionsstring ohne explizite Elektronen: Anzahl aus den Daten übernehmen
+            self.half_reaction = HalfReaction(self.reaction, self.half_reaction.oxidized,
+                                              self.half_reaction.reduced, self.electrons)
+        self._freeze()
+
+    @property
+    def ion_coefficient(self) -> int | float:
+        """Stöchiometrischer Koeffizient des Ions in der (einfachen) Halbreaktion, z. B. 2 für 2H+ + 2e- -> H2."""
+        return self.half_reaction.ion_coefficient if self.half_reaction is not None else 1
 
     def get_oxidation_reaction(self) -> str:
         """Gibt die umgekehrte Reaktion (Oxidation) als String zurück."""
-        # Diese Methode könnte vereinfacht werden, wenn die Struktur immer gleich ist
-        # oder man könnte eine robustere Parsing-Methode verwenden.
-        # Annahme: Format ist "Ion + ne- -> Element" oder "Koeff*Ion + ne- -> Element/Molekül"
-        parts = self.reaction.split('->')
-        if len(parts) == 2:
-            reactants_side = parts[0].strip()
-            product_side = parts[1].strip()
-
-            # Versuche, Elektronen zu entfernen (robuster als einfacher replace)
-            electron_term = f"{self.electrons}e-"
-            reactants_cleaned = reactants_side.replace(f" + {electron_term}", "").replace(f"{electron_term} + ", "").strip()
-
-            # Die Oxidationsreaktion ist Produkt -> ursprüngliche Reaktanten (ohne e-) + e-
-            return f"{product_side} -> {reactants_cleaned} + {self.electrons}e-"
+        # Vorberechnet beim Kompilieren der Halbreaktion, z. B. "Zn -> Zn2+ + 2e-"
+        if self.half_reaction is not None:
+            return self.half_reaction.oxidation
         return "Umkehrung fehlgeschlagen"
 
     def __repr__(self) -> str:
@@ -39,12 +73,36 @@ class ElectrochemicalElement:
                 f"potential={self.potential}, electrons={self.electrons}, ion_formula='{self.ion_formula}')") # Angepasst
 
 
-class BatterySimulation:
+class NernstBatchResult(NamedTuple):
+    """Ergebnis-Arrays von `BatterySimulation.get_nernst_voltage_batch` (gleiche Form wie die Eingaben)."""
+    reaction_quotient: "np.ndarray"  # Q
+    nernst_voltage: "np.ndarray"     # E_Nernst in V
+    delta_G: "np.ndarray"            # ΔG = -n * F * E_Nernst in J/mol
+    valid: "np.ndarray"              # bool-Maske; ungültige Punkte sind in den anderen Arrays NaN
+    log_reaction_quotient: "np.ndarray"  # ln Q (stabil auch dort, wo Q selbst über-/unterläuft)
+
+
+class InverseSolution(NamedTuple):
+    """Ergebnis-Arrays von `BatterySimulation.solve_concentrations` (gleiche Form wie die Eingaben)."""
+    log_reaction_quotient: "np.ndarray"  # benötigtes ln Q (mit Aktivitätsmodell: ln Q der Aktivitäten)
+    conc_anode: "np.ndarray"             # c_Anode in mol/L
+    conc_cathode: "np.ndarray"           # c_Kathode in mol/L
+    log_ratio: "np.ndarray"              # ln(c_Anode / c_Kathode)
+    feasible: "np.ndarray"               # bool-Maske: Lösung existiert und liegt innerhalb der Grenzen
+
+
+class BatterySimulation(_Frozen):
     """
     Simuliert eine elektrochemische Zelle und berechnet relevante Größen.
     Berücksichtigt Stöchiometrie für die Q-Berechnung.
+    Instanzen sind nach der Konstruktion unveränderlich und können wiederverwendet werden (siehe SimulationCache).
     """
-    def __init__(self, cathode_element_data: dict, anode_element_data: dict) -> None:
+    def __init__(self, cathode_element_data: dict, anode_element_data: dict,
+                 activity_model: "ActivityModel | None" = None) -> None:
+        """
+        :param activity_model: Optionales Aktivitätsmodell (siehe activity.py); dann gehen Aktivitäten
+                               statt Konzentrationen in Q ein. Ohne Modell: ideale Lösung wie bisher.
+        """
         self.cathode = ElectrochemicalElement(cathode_element_data) # Reduktion (+)
         self.anode = ElectrochemicalElement(anode_element_data)     # Oxidation (-)
 
@@ -75,59 +133,340 @@ class BatterySimulation:
         # Berechne die Faktoren, mit denen die Halbreaktionen multipliziert werden müssen
         self.factor_cathode = self.n_overall // self.cathode.electrons
         self.factor_anode = self.n_overall // self.anode.electrons
+        # Exponenten der Ionen in Q (Faktor der Halbreaktion * Koeffizient des Ions)
+        self.factor_anode_ion = self.factor_anode * self.anode.ion_coefficient
+        self.factor_cathode_ion = self.factor_cathode * self.cathode.ion_coefficient
 
         # Überprüfe, ob Potentiale gültig sind
         if self.cathode.potential is None or self.anode.potential is None:
             raise ValueError("Potentiale für Kathode oder Anode nicht verfügbar.")
 
+        # E⁰_cell(T) über eine vorberechnete Tabelle (geteilt pro Koeffizientensatz); None = temperaturunabhängig
+        dE0_dT = self.cathode.dE0_dT - self.anode.dE0_dT
+        d2E0_dT2 = self.cathode.d2E0_dT2 - self.anode.d2E0_dT2
+        self._e0_table: E0TemperatureTable | None = (
+            get_e0_table(self.cathode.potential - self.anode.potential, dE0_dT, d2E0_dT2)
+            if dE0_dT or d2E0_dT2 else None)
+
+        # Ladungs- und Ionenstärke-Terme einmal pro Simulation bestimmen (intern pro Ionenformel gecacht)
+        self.activity_model = activity_model
+        self._anode_ion_terms = self._ion_terms(self.anode) if activity_model is not None else None
+        self._cathode_ion_terms = self._ion_terms(self.cathode) if activity_model is not None else None
+        self._freeze()
+
+    def _ion_terms(self, element: ElectrochemicalElement) -> "IonTerms":
+        """Ionen-Terme aus der Ionenformel; ersatzweise aus der Ladung des Ions der kompilierten Halbreaktion."""
+        try:
+            return self.activity_model.ion_terms(element.ion_formula)
+        except ValueError:
+            charge = element.half_reaction.ion_charge() if element.half_reaction is not None else None
+            if charge is None:
+                raise
+            return self.activity_model.charge_terms(charge)
+
     def get_stoichiometric_factors(self) -> tuple[int, int]:
         """
         Gibt die stöchiometrischen Faktoren für die Ionen in der Q-Berechnung zurück.
-        ACHTUNG: Dies geht davon aus, dass der Koeffizient des Ions in der Halbreaktion 1 ist.
-        Für Reaktionen wie 2H+ + 2e- -> H2 muss dies angepasst werden, falls H+ als Anode/Kathode genutzt wird.
-        Die aktuelle `ElectrochemicalSeries` hat einfache Ionen, daher passt es hier.
+        Berücksichtigt den Koeffizienten des Ions in der kompilierten Halbreaktion
+        (z. B. 2 für 2H+ + 2e- -> H2) multipliziert mit dem Faktor der Halbreaktion.
 
         :return: Tuple (factor_anode_ion, factor_cathode_ion)
                  factor_anode_ion: Stöchiometrischer Koeffizient des Ions, das an der Anode *entsteht*.
                  factor_cathode_ion: Stöchiometrischer Koeffizient des Ions, das an der Kathode *verbraucht* wird.
         """
-        # Hier nehmen wir an, dass pro Halbreaktion (wie in utils.py definiert)
-        # genau ein Ion mit dem Koeffizienten 1 beteiligt ist.
-        # Wenn komplexere Reaktionen (z.B. 2Ag+ + ...) hinzukämen, müsste man die Koeffizienten parsen.
-        anode_ion_stoich_factor = self.factor_anode # Multiplikator für die gesamte Halbreaktion
-        cathode_ion_stoich_factor = self.factor_cathode # Multiplikator für die gesamte Halbreaktion
-        return anode_ion_stoich_factor, cathode_ion_stoich_factor
+        return self.factor_anode_ion, self.factor_cathode_ion
 
-    def get_standard_cell_voltage(self) -> float:
-        """Berechnet die Standardzellspannung E⁰_cell = E⁰(Kathode) - E⁰(Anode)."""
-        return self.cathode.potential - self.anode.potential
+    def get_standard_cell_voltage(self, temperature: float | None = None) -> float:
+        """
+        Berechnet die Standardzellspannung E⁰_cell = E⁰(Kathode) - E⁰(Anode).
+        Ohne Temperatur gilt der tabellierte Wert bei 25 °C; mit Temperatur (K) wird E⁰_cell(T)
+        aus den Temperaturkoeffizienten per Tabellen-Interpolation bestimmt (siehe temperature.py).
+        """
+        if temperature is None or self._e0_table is None:
+            return self.cathode.potential - self.anode.potential
+        return self._e0_table(temperature)
+
+    def get_standard_cell_voltage_batch(self, temperature) -> "np.ndarray | float":
+        """Array-Variante von `get_standard_cell_voltage(temperature)`; ohne Koeffizienten ein Skalar."""
+        if self._e0_table is None:
+            return self.cathode.potential - self.anode.potential
+        return self._e0_table.lookup_batch(temperature)
+
+    def get_log_reaction_quotient(self, conc_anode: float, conc_cathode: float, temperature: float = 298.15) -> float:
+        """
+        Berechnet ln(Q) = f_A * ln(c_Anode) - f_K * ln(c_Kathode) direkt im Log-Raum.
+        Dadurch kann Q selbst bei extremen Konzentrationen und großen Faktoren nicht über-/unterlaufen.
+        Mit Aktivitätsmodell wird ln(a) = ln(c) + ln(γ) verwendet; nur dafür ist `temperature` relevant.
+        """
+        if conc_anode <= 0 or conc_cathode <= 0:
+            raise ValueError("Konzentrationen müssen > 0 sein.")
+        log_anode = math.log(conc_anode)
+        log_cathode = math.log(conc_cathode)
+        if self.activity_model is not None:
+            log_anode += self.activity_model.log_gamma(self._anode_ion_terms, conc_anode, temperature)
+            log_cathode += self.activity_model.log_gamma(self._cathode_ion_terms, conc_cathode, temperature)
+        return self.factor_anode_ion * log_anode - self.factor_cathode_ion * log_cathode
+
+    def get_nernst_voltage_from_log_q(self, log_reaction_quotient: float, temperature: float = 298.15) -> float:
+        """Nernst-Gleichung mit ln(Q) als Eingabe: E = E⁰(T) - (RT / nF) * ln(Q)."""
+        if temperature <= 0:
+             raise ValueError("Temperatur muss positiv sein (in Kelvin).")
+        E0_cell = self.get_standard_cell_voltage(temperature)
+        # Verwende n_overall (kgV der Elektronen)
+        return E0_cell - (R * temperature / (self.n_overall * F)) * log_reaction_quotient
 
     def get_nernst_voltage(self, reaction_quotient: float, temperature: float = 298.15) -> float:
-        """Berechnet die Zellspannung mittels Nernst-Gleichung: E = E⁰ - (RT / nF) * ln(Q)."""
-        if self.n_overall <= 0: # F ist positiv
-             raise ValueError("Gesamt-Elektronenanzahl (n) muss positiv sein.")
+        """Berechnet die Zellspannung mittels Nernst-Gleichung: E = E⁰(T) - (RT / nF) * ln(Q)."""
         if reaction_quotient <= 0:
              # In der Realität kann Q sehr klein, aber > 0 sein.
              # Ein Logarithmus von 0 oder negativ ist mathematisch undefiniert.
              raise ValueError("Reaktionsquotient (Q) muss positiv sein.")
+        return self.get_nernst_voltage_from_log_q(math.log(reaction_quotient), temperature)
+
+    def get_delta_G(self, reaction_quotient: float, temperature: float = 298.15) -> float:
+        """Berechnet die Gibbs-Energie unter Nicht-Standardbedingungen ΔG = -n * F * E_Nernst."""
+        return -self.n_overall * F * self.get_nernst_voltage(reaction_quotient, temperature)
+
+    def get_log_reaction_quotient_batch(self, conc_anode, conc_cathode, temperature=298.15) -> "np.ndarray":
+        """
+        Array-Variante von `get_log_reaction_quotient`. Nicht-positive Konzentrationen
+        ergeben NaN statt einer Exception.
+        """
+        import numpy as np # Lazy, damit der Skalarpfad (z. B. cli.py) ohne NumPy-Import startet
+        c_anode, c_cathode = np.broadcast_arrays(
+            np.asarray(conc_anode, dtype=np.float64),
+            np.asarray(conc_cathode, dtype=np.float64),
+        )
+        with np.errstate(all="ignore"):
+            log_anode = np.log(c_anode)
+            log_cathode = np.log(c_cathode)
+            if self.activity_model is not None:
+                from activity import debye_huckel_constants_batch
+                constants = debye_huckel_constants_batch(temperature) # einmal für beide Halbzellen
+                log_anode += self.activity_model.log_gamma_batch(self._anode_ion_terms, c_anode, constants=constants)
+                log_cathode += self.activity_model.log_gamma_batch(self._cathode_ion_terms, c_cathode, constants=constants)
+            log_q = self.factor_anode_ion * log_anode - self.factor_cathode_ion * log_cathode
+        return np.where((c_anode > 0) & (c_cathode > 0), log_q, np.nan)
+
+    def get_nernst_voltage_batch(self, conc_anode, conc_cathode, temperature=298.15) -> NernstBatchResult:
+        """
+        Vektorisierte Variante von Q, `get_nernst_voltage` und `get_delta_G` für viele Punkte.
+
+        Akzeptiert NumPy-Arrays, Listen oder beliebige Buffer (inkl. Skalare), die gegeneinander
+        gebroadcastet werden. Statt pro Punkt eine Exception zu werfen, werden ungültige Punkte
+        (c <= 0, T <= 0) in `valid` als False markiert und in den Ergebnis-Arrays mit NaN belegt.
+
+        Gerechnet wird wie im Skalarpfad im Log-Raum (ln Q = f_A ln c_A - f_K ln c_K, dann
+        E⁰ - (RT / nF) * ln Q) mit derselben Reihenfolge der Operationen, auch in der Aktivitätskorrektur
+        (`log_gamma` und `log_gamma_batch` sind bitgleich). Unterschiede liegen daher höchstens in der
+        letzten Stelle der von NumPy und `math` verwendeten log-Routinen.
+        Q selbst wird nur zur Ausgabe aus ln Q gebildet und darf dabei auf 0 bzw. inf laufen.
+
+        :param conc_anode: Konzentration(en) des Anoden-Ions in mol/L
+        :param conc_cathode: Konzentration(en) des Kathoden-Ions in mol/L
+        :param temperature: Temperatur(en) in Kelvin
+        :return: NernstBatchResult mit Q, E_Nernst, ΔG, Gültigkeitsmaske und ln Q
+        """
+        import numpy as np
+        c_anode, c_cathode, temp = np.broadcast_arrays(
+            np.asarray(conc_anode, dtype=np.float64),
+            np.asarray(conc_cathode, dtype=np.float64),
+            np.asarray(temperature, dtype=np.float64),
+        )
+        # Ungebroadcastete Temperatur weiterreichen: skalare T nutzen im Aktivitätsmodell gecachte Konstanten
+        log_q = self.get_log_reaction_quotient_batch(c_anode, c_cathode, temperature)
+        valid = (temp > 0) & np.isfinite(log_q)
+
+        with np.errstate(all="ignore"):
+            E0_cell = self.get_standard_cell_voltage_batch(temp)
+            nernst_term = (R * temp / (self.n_overall * F)) * log_q
+            e_nernst = np.where(valid, E0_cell - nernst_term, np.nan)
+            log_q = np.where(valid, log_q, np.nan)
+            q = np.exp(log_q)
+            delta_G = -self.n_overall * F * e_nernst
+
+        return NernstBatchResult(q, e_nernst, delta_G, valid, log_q)
+
+    def get_nernst_uncertainty(self, conc_anode: float, conc_cathode: float, temperature: float = 298.15,
+                               sigma_E0: float = 0.01, rel_sigma_conc: float = 0.05, sigma_temperature: float = 0.5,
+                               n_samples: int = 1_000_000, batch_size: int = 100_000, seed: int | None = None,
+                               quantiles: tuple[float, ...] = (0.025, 0.5, 0.975), bins: int = 8192):
+        """
+        Monte-Carlo-Fortpflanzung der Unsicherheiten von E⁰, Konzentrationen und Temperatur auf E_Nernst und ΔG.
+
+        Gezogen wird blockweise (je `batch_size` Stichproben) mit NumPy:
+            E⁰(Anode), E⁰(Kathode) ~ N(E⁰, sigma_E0)
+            c ~ c * exp(N(0, rel_sigma_conc))  (log-normal, Median = c, immer > 0)
+            T ~ N(T, sigma_temperature); Stichproben mit T <= 0 werden verworfen
+        Mittelwert/Standardabweichung und Quantile werden gestreamt (siehe uncertainty.py),
+        die Stichprobenzahl ist daher nicht durch den Speicher begrenzt. ΔG = -nF * E ist linear
+        in E; seine Kennzahlen werden exakt aus denen von E abgeleitet.
+
+        Jede Eingangsgröße hat einen eigenen Zufallsstrom (SeedSequence.spawn), sodass das Ergebnis
+        bei gleichem `seed` reproduzierbar und unabhängig von `batch_size` ist: die Quantile exakt (der
+        Histogrammbereich folgt aus den ersten Stichproben, nicht aus dem ersten Block), Mittelwert und
+        Standardabweichung bis auf Rundung.
+
+        :return: UncertaintyResult
+        """
+        import numpy as np
+        from activity import debye_huckel_constants_batch
+        from uncertainty import StreamingMoments, StreamingQuantiles, UncertaintyResult
+
+        if conc_anode <= 0 or conc_cathode <= 0:
+            raise ValueError("Konzentrationen müssen > 0 sein.")
         if temperature <= 0:
-             raise ValueError("Temperatur muss positiv sein (in Kelvin).")
+            raise ValueError("Temperatur muss positiv sein (in Kelvin).")
+        if min(sigma_E0, rel_sigma_conc, sigma_temperature) < 0:
+            raise ValueError("Standardabweichungen dürfen nicht negativ sein.")
+        if n_samples <= 0 or batch_size <= 0:
+            raise ValueError("n_samples und batch_size müssen > 0 sein.")
 
-        E0_cell = self.get_standard_cell_voltage()
-        try:
-             # Verwende n_overall (kgV der Elektronen)
-             nernst_term = (R * temperature / (self.n_overall * F)) * math.log(reaction_quotient)
-        except (OverflowError, ValueError) as e:
-             # ValueError kann bei math.log(sehr kleiner Zahl) auftreten oder math.log(großer Zahl) -> Overflow
-             raise ValueError(f"Fehler bei Logarithmus-Berechnung für Q={reaction_quotient}: {e}")
+        streams = [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(5)]
+        rng_e0_anode, rng_e0_cathode, rng_conc_anode, rng_conc_cathode, rng_temperature = streams
+        log_c_anode, log_c_cathode = math.log(conc_anode), math.log(conc_cathode)
+        nF = self.n_overall * F
+
+        moments = StreamingMoments()
+        quantile_stream = StreamingQuantiles(bins=bins)
+        remaining = n_samples
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            remaining -= size
+            E0_cell = ((self.cathode.potential + sigma_E0 * rng_e0_cathode.standard_normal(size))
+                       - (self.anode.potential + sigma_E0 * rng_e0_anode.standard_normal(size)))
+            log_anode = log_c_anode + rel_sigma_conc * rng_conc_anode.standard_normal(size)
+            log_cathode = log_c_cathode + rel_sigma_conc * rng_conc_cathode.standard_normal(size)
+            temp = temperature + sigma_temperature * rng_temperature.standard_normal(size)
+            positive = temp > 0
+            if not positive.all():
+                # Vor E⁰(T) und den Debye-Hückel-Konstanten verwerfen (dort wären T <= 0 ungültig)
+                E0_cell, log_anode, log_cathode, temp = (values[positive] for values in
+                                                         (E0_cell, log_anode, log_cathode, temp))
+            if self._e0_table is not None:
+                E0_cell += self._e0_table.lookup_batch(temp) - self._e0_table.E0 # E⁰(T)-Verschiebung
+            if self.activity_model is not None:
+                constants = debye_huckel_constants_batch(temp)
+                log_anode += self.activity_model.log_gamma_batch(self._anode_ion_terms, np.exp(log_anode), constants=constants)
+                log_cathode += self.activity_model.log_gamma_batch(self._cathode_ion_terms, np.exp(log_cathode), constants=constants)
+            log_q = self.factor_anode_ion * log_anode - self.factor_cathode_ion * log_cathode
+            e_nernst = E0_cell - (R * temp / nF) * log_q
+            moments.update(e_nernst)
+            quantile_stream.update(e_nernst)
+
+        quantiles_E = {q: quantile_stream.quantile(q) for q in quantiles}
+        return UncertaintyResult(
+            n_samples=moments.count,
+            mean_E=moments.mean,
+            std_E=moments.std,
+            quantiles_E=quantiles_E,
+            mean_delta_G=-nF * moments.mean,
+            std_delta_G=nF * moments.std,
+            # ΔG fällt mit E: q-Quantil von ΔG = -nF * (1-q)-Quantil von E
+            quantiles_delta_G={q: -nF * quantile_stream.quantile(1.0 - q) for q in quantiles},
+        )
+
+    def solve_concentrations(self, target_voltage, temperature=298.15, conc_anode=None, conc_cathode=None,
+                             bounds: tuple[float, float] = (1e-6, 10.0)) -> InverseSolution:
+        """
+        Umkehrung der Nernst-Gleichung: welche Konzentration ergibt die Zielspannung?
+
+        Aus E = E⁰(T) - (RT / nF) * ln Q folgt ln Q = (E⁰(T) - E) * nF / (RT); mit
+        ln Q = f_A ln c_A - f_K ln c_K wird die freie Konzentration im Log-Raum bestimmt.
+        Genau eine Konzentration wird vorgegeben (`conc_anode` oder `conc_cathode`); ohne Angabe
+        gilt c_Kathode = 1 mol/L. Alle Eingaben dürfen Arrays sein und werden gebroadcastet.
+
+        Ohne Aktivitätsmodell ist die Lösung geschlossen; mit Modell wird ln c + ln γ(c) = ln a
+        vektorisiert per Bisektion innerhalb von `bounds` gelöst.
+
+        :param target_voltage: Zielspannung(en) in V
+        :param temperature: Temperatur(en) in K
+        :param bounds: Physikalisch sinnvoller Bereich (c_min, c_max) der gesuchten Konzentration in mol/L
+        :return: InverseSolution; `feasible` ist False, wenn die Lösung außerhalb von `bounds` liegt
+                 oder die Eingaben ungültig sind (T <= 0, vorgegebene c <= 0, nicht endliche Werte)
+        """
+        import numpy as np
+
+        if conc_anode is not None and conc_cathode is not None:
+            raise ValueError("Nur eine Konzentration vorgeben (conc_anode oder conc_cathode).")
+        c_min, c_max = bounds
+        if not 0 < c_min < c_max:
+            raise ValueError("Ungültige Grenzen: 0 < c_min < c_max erforderlich.")
+        solve_anode = conc_anode is None
+        fixed = conc_cathode if solve_anode else conc_anode
+        if fixed is None:
+            fixed = 1.0
 
-        return E0_cell - nernst_term
+        target, temp, fixed = np.broadcast_arrays(
+            np.asarray(target_voltage, dtype=np.float64),
+            np.asarray(temperature, dtype=np.float64),
+            np.asarray(fixed, dtype=np.float64),
+        )
+        valid = (temp > 0) & np.isfinite(target) & (fixed > 0)
 
-    def get_delta_G0(self) -> float:
-        """Berechnet die Standard-Gibbs-Energie ΔG⁰ = -n * F * E⁰_cell."""
+        with np.errstate(all="ignore"):
+            E0_cell = self.get_standard_cell_voltage_batch(temp)
+            log_q = (E0_cell - target) * (self.n_overall * F) / (R * temp)
+            log_fixed = np.log(fixed)
+            constants = None
+            if self.activity_model is not None:
+                from activity import debye_huckel_constants_batch
+                constants = debye_huckel_constants_batch(temp)
+                fixed_terms = self._cathode_ion_terms if solve_anode else self._anode_ion_terms
+                log_fixed_activity = log_fixed + self.activity_model.log_gamma_batch(fixed_terms, fixed, constants=constants)
+            else:
+                log_fixed_activity = log_fixed
+
+            # Benötigte (log-)Aktivität der freien Spezies
+            if solve_anode:
+                log_activity = (log_q + self.factor_cathode_ion * log_fixed_activity) / self.factor_anode_ion
+            else:
+                log_activity = (self.factor_anode_ion * log_fixed_activity - log_q) / self.factor_cathode_ion
+
+            log_lower, log_upper = math.log(c_min), math.log(c_max)
+            if self.activity_model is None:
+                log_solved = log_activity
+            else:
+                terms = self._anode_ion_terms if solve_anode else self._cathode_ion_terms
+                log_solved = self._solve_log_concentration(log_activity, terms, constants, log_lower, log_upper)
+            log_solved = np.where(valid, log_solved, np.nan)
+            solved = np.exp(log_solved)
+
+        feasible = valid & np.isfinite(log_solved) & (log_solved >= log_lower) & (log_solved <= log_upper)
+        log_q = np.where(valid, log_q, np.nan)
+        fixed = np.where(valid, fixed, np.nan)
+        log_fixed = np.where(valid, log_fixed, np.nan)
+        if solve_anode:
+            return InverseSolution(log_q, solved, fixed, log_solved - log_fixed, feasible)
+        return InverseSolution(log_q, fixed, solved, log_fixed - log_solved, feasible)
+
+    def _solve_log_concentration(self, log_activity, terms, constants, log_lower: float, log_upper: float,
+                                 iterations: int = 60) -> "np.ndarray":
+        """Löst ln c + ln γ(c) = ln a per vektorisierter Bisektion in [log_lower, log_upper]; sonst NaN."""
+        import numpy as np
+
+        def residual(log_c):
+            return log_c + self.activity_model.log_gamma_batch(terms, np.exp(log_c), constants=constants) - log_activity
+
+        lower = np.full(log_activity.shape, log_lower)
+        upper = np.full(log_activity.shape, log_upper)
+        f_lower = residual(lower)
+        f_upper = residual(upper)
+        bracketed = (np.sign(f_lower) * np.sign(f_upper) <= 0)
+        for _ in range(iterations): # Intervallbreite danach < 1e-16 * (log_upper - log_lower)
+            middle = 0.5 * (lower + upper)
+            f_middle = residual(middle)
+            left = np.sign(f_middle) == np.sign(f_lower)
+            lower = np.where(left, middle, lower)
+            f_lower = np.where(left, f_middle, f_lower)
+            upper = np.where(left, upper, middle)
+        return np.where(bracketed, 0.5 * (lower + upper), np.nan)
+
+    def get_delta_G0(self, temperature: float | None = None) -> float:
+        """Berechnet die Standard-Gibbs-Energie ΔG⁰ = -n * F * E⁰_cell (optional bei Temperatur T in K)."""
         if self.n_overall <= 0:
              raise ValueError("Gesamt-Elektronenanzahl (n) muss positiv sein.")
-        E0_cell = self.get_standard_cell_voltage()
+        E0_cell = self.get_standard_cell_voltage(temperature)
         # Verwende n_overall (kgV der Elektronen)
         return -self.n_overall * F * E0_cell
 
@@ -139,4 +478,73 @@ class BatterySimulation:
     def get_anode_reaction(self) -> str:
         """Gibt die (ggf. multiplizierte) Reaktionsgleichung der Anode (Oxidation) zurück."""
         # return f"{self.factor_anode} * ({self.anode.get_oxidation_reaction()})" # Optionale Anzeige mit Faktor
-        return self.anode.get_oxidation_reaction() # Einfache Anzeige
\ No newline at end of file
+        return self.anode.get_oxidation_reaction() # Einfache Anzeige
+
+
+# Zeitmessung der Rechenmethoden (nur aktiv, wenn die Instrumentierung eingeschaltet ist)
+instrumentation.instrument_methods(BatterySimulation, (
+    "__init__", "get_standard_cell_voltage", "get_standard_cell_voltage_batch", "get_log_reaction_quotient", "get_nernst_voltage_from_log_q",
+    "get_nernst_voltage", "get_delta_G", "get_log_reaction_quotient_batch", "get_nernst_voltage_batch",
+    "get_nernst_uncertainty", "solve_concentrations", "get_delta_G0",
+), prefix="simulation")
+
+
+class SimulationCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class SimulationCache:
+    """
+    Begrenzter LRU-Cache für `BatterySimulation`-Instanzen pro Elektrodenpaar (Anode, Kathode).
+
+    Da die Simulationen unveränderlich sind, hängt nur die Konstruktion vom Paar ab; Konzentration
+    und Temperatur werden erst beim Rechnen übergeben. Wurde der Eintrag eines Elements in der
+    Spannungsreihe ersetzt (z. B. nach `add_entries`), wird die Simulation neu gebaut.
+    Thread-sicher (GUI-Worker und Tk-Thread dürfen gleichzeitig zugreifen).
+    """
+    def __init__(self, series: ElectrochemicalSeries, maxsize: int = 128,
+                 activity_model: "ActivityModel | None" = None) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize muss > 0 sein.")
+        self.series = series
+        self.maxsize = maxsize
+        self.activity_model = activity_model # gilt für alle Simulationen dieses Caches
+        self._entries: OrderedDict[tuple[str, str], tuple[dict, dict, BatterySimulation]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, anode: str, cathode: str) -> BatterySimulation:
+        """Gibt die (gecachte) Simulation für das Paar zurück; unbekannte Elemente -> ValueError."""
+        anode_data = self.series.get_element_data(anode)
+        cathode_data = self.series.get_element_data(cathode)
+        key = (anode, cathode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is anode_data and entry[1] is cathode_data:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[2]
+            self._misses += 1
+        # Konstruktion außerhalb des Locks; bei gleichzeitigen Misses gewinnt der letzte Eintrag
+        sim = BatterySimulation(cathode_element_data=cathode_data, anode_element_data=anode_data,
+                                activity_model=self.activity_model)
+        with self._lock:
+            self._entries[key] = (anode_data, cathode_data, sim)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return sim
+
+    def cache_info(self) -> SimulationCacheInfo:
+        """Treffer/Fehlzugriffe und Füllstand (analog zu functools.lru_cache)."""
+        with self._lock:
+            return SimulationCacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
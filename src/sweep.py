@@ -0,0 +1,215 @@
+# sweep.py
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from activity import ActivityModel
+from simulation import F, BatterySimulation
+from utils import ElectrochemicalSeries
+
+SWEEP_COLUMNS = ("pair_index", "temperature", "conc_anode", "conc_cathode",
+                 "log_reaction_quotient", "nernst_voltage", "delta_G", "valid")
+_MANIFEST_NAME = "manifest.json"
+
+
+def _chunk_path(output_dir: str, chunk_index: int) -> str:
+    return os.path.join(output_dir, f"chunk_{chunk_index:06d}.npz")
+
+
+def _run_chunk(task: dict) -> int:
+    """
+    Worker: berechnet einen Block des Gitters für ein Elektrodenpaar und schreibt ihn als NPZ.
+    Wird im Prozesspool ausgeführt und muss daher auf Modulebene liegen.
+    """
+    sim = BatterySimulation(cathode_element_data=task["cathode_data"], anode_element_data=task["anode_data"],
+                            activity_model=task["activity_model"])
+    grid_shape = (len(task["temperatures"]), len(task["conc_anode"]), len(task["conc_cathode"]))
+    flat_index = np.arange(task["start"], task["stop"])
+    t_idx, a_idx, c_idx = np.unravel_index(flat_index, grid_shape)
+
+    temperature = task["temperatures"][t_idx]
+    conc_anode = task["conc_anode"][a_idx]
+    conc_cathode = task["conc_cathode"][c_idx]
+    result = sim.get_nernst_voltage_batch(conc_anode, conc_cathode, temperature)
+
+    # Erst vollständig in eine temporäre Datei schreiben, dann atomar umbenennen,
+    # damit ein abgebrochener Lauf keine halben Blöcke hinterlässt
+    tmp_path = task["path"] + ".tmp"
+    with open(tmp_path, "wb") as handle:
+        np.savez(handle,
+                 pair_index=np.full(len(flat_index), task["pair_index"], dtype=np.int32),
+                 temperature=temperature, conc_anode=conc_anode, conc_cathode=conc_cathode,
+                 log_reaction_quotient=result.log_reaction_quotient,
+                 nernst_voltage=result.nernst_voltage, delta_G=result.delta_G, valid=result.valid)
+    os.replace(tmp_path, task["path"])
+    return task["chunk_index"]
+
+
+class ParameterSweep:
+    """
+    Parameter-Sweep über Temperatur × c_Anode × c_Kathode für mehrere Elektrodenpaare.
+
+    Das Gitter wird in Blöcke von höchstens `chunk_size` Punkten (je Paar) zerlegt, die auf einen
+    Prozesspool verteilt werden. Jeder Block wird nach Fertigstellung als eigene NPZ-Datei in
+    `output_dir` abgelegt; bereits vorhandene Blöcke werden bei einem erneuten Lauf übersprungen.
+    """
+    def __init__(self, series: ElectrochemicalSeries, pairs: list[tuple[str, str]], temperatures,
+                 conc_anode, conc_cathode, output_dir: str, chunk_size: int = 100_000,
+                 activity_model: ActivityModel | None = None) -> None:
+        """
+        :param pairs: Liste von (Anode, Kathode)-Elementnamen
+        :param temperatures: Temperaturen in Kelvin (1D)
+        :param conc_anode: Konzentrationen des Anoden-Ions in mol/L (1D)
+        :param conc_cathode: Konzentrationen des Kathoden-Ions in mol/L (1D)
+        :param activity_model: Optionales Aktivitätsmodell (siehe activity.py)
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size muss > 0 sein.")
+        self.pairs = [(anode, cathode) for anode, cathode in pairs]
+        self._pair_data = [(series.get_element_data(anode), series.get_element_data(cathode))
+                           for anode, cathode in self.pairs]
+        # Eindeutige Bezeichnungen der Halbreaktionen für `export_to_store`
+        self._pair_labels = [(series.get_element_label(anode), series.get_element_label(cathode))
+                             for anode, cathode in self.pairs]
+        self.temperatures = np.ascontiguousarray(temperatures, dtype=np.float64).ravel()
+        self.conc_anode = np.ascontiguousarray(conc_anode, dtype=np.float64).ravel()
+        self.conc_cathode = np.ascontiguousarray(conc_cathode, dtype=np.float64).ravel()
+        self.output_dir = output_dir
+        self.chunk_size = chunk_size
+        self.activity_model = activity_model
+        self.points_per_pair = len(self.temperatures) * len(self.conc_anode) * len(self.conc_cathode)
+
+    @property
+    def chunks_per_pair(self) -> int:
+        return -(-self.points_per_pair // self.chunk_size)
+
+    @property
+    def total_chunks(self) -> int:
+        return len(self.pairs) * self.chunks_per_pair
+
+    def fingerprint(self) -> str:
+        """Hash über Paare, Gitter und Blockgröße; verhindert das Fortsetzen eines anderen Sweeps."""
+        digest = hashlib.sha256()
+        identity = [self.pairs, self._pair_data, self.chunk_size]
+        if self.activity_model is not None: # Ohne Modell bleibt der Fingerprint bestehender Sweeps gleich
+            identity.append(repr(self.activity_model))
+        digest.update(json.dumps(identity, sort_keys=True).encode("utf-8"))
+        for values in (self.temperatures, self.conc_anode, self.conc_cathode):
+            digest.update(values.tobytes())
+        return digest.hexdigest()
+
+    def _tasks(self) -> list[dict]:
+        tasks = []
+        for pair_index, (anode_data, cathode_data) in enumerate(self._pair_data):
+            for local_index in range(self.chunks_per_pair):
+                chunk_index = pair_index * self.chunks_per_pair + local_index
+                start = local_index * self.chunk_size
+                tasks.append({
+                    "chunk_index": chunk_index, "pair_index": pair_index,
+                    "anode_data": anode_data, "cathode_data": cathode_data,
+                    "temperatures": self.temperatures, "conc_anode": self.conc_anode,
+                    "conc_cathode": self.conc_cathode, "activity_model": self.activity_model,
+                    "start": start, "stop": min(start + self.chunk_size, self.points_per_pair),
+                    "path": _chunk_path(self.output_dir, chunk_index),
+                })
+        return tasks
+
+    def _write_manifest(self) -> None:
+        manifest_path = os.path.join(self.output_dir, _MANIFEST_NAME)
+        manifest = {"fingerprint": self.fingerprint(), "pairs": self.pairs,
+                    "total_chunks": self.total_chunks, "columns": list(SWEEP_COLUMNS)}
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as handle:
+                existing = json.load(handle)
+            if existing.get("fingerprint") != manifest["fingerprint"]:
+                raise ValueError(f"'{self.output_dir}' enthält bereits Ergebnisse eines anderen Sweeps.")
+            return
+        with open(manifest_path, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle, indent=2)
+
+    def run(self, max_workers: int | None = None,
+            progress: Callable[[int, int], None] | None = None) -> int:
+        """
+        Führt alle noch fehlenden Blöcke aus (Fortsetzen nach Abbruch) und gibt die Anzahl
+        der in diesem Lauf berechneten Blöcke zurück.
+
+        :param max_workers: Anzahl der Prozesse (None = Anzahl CPU-Kerne)
+        :param progress: Callback (fertige Blöcke, Gesamtzahl), wird im Hauptprozess aufgerufen
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._write_manifest()
+
+        pending = [task for task in self._tasks() if not os.path.exists(task["path"])]
+        done = self.total_chunks - len(pending)
+        if progress is not None:
+            progress(done, self.total_chunks)
+        if not pending:
+            return 0
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_run_chunk, task) for task in pending]
+            for future in as_completed(futures):
+                future.result()  # Fehler im Worker hier weiterreichen
+                done += 1
+                if progress is not None:
+                    progress(done, self.total_chunks)
+        return len(pending)
+
+    def is_complete(self) -> bool:
+        return all(os.path.exists(_chunk_path(self.output_dir, i)) for i in range(self.total_chunks))
+
+    def merge(self, path: str | None = None) -> dict[str, np.ndarray]:
+        """
+        Führt alle Blöcke in fester Reihenfolge (Paar, dann Gitterindex) zusammen, unabhängig
+        davon, in welcher Reihenfolge die Worker fertig wurden. Optional als NPZ speichern.
+        """
+        if not self.is_complete():
+            raise ValueError("Sweep ist unvollständig; zuerst run() ausführen.")
+        parts = {column: [] for column in SWEEP_COLUMNS}
+        for chunk_index in range(self.total_chunks):
+            with np.load(_chunk_path(self.output_dir, chunk_index)) as chunk:
+                for column in SWEEP_COLUMNS:
+                    parts[column].append(chunk[column])
+        merged = {column: np.concatenate(values) for column, values in parts.items()}
+        if path is not None:
+            np.savez(path, **merged)
+        return merged
+
+    def export_to_store(self, store, valid_only: bool = True) -> int:
+        """
+        Hängt die Ergebnisse aller Blöcke (Reihenfolge wie `merge`) an einen `ResultStore` an,
+        ohne den ganzen Sweep im Speicher zusammenzuführen. Gibt die Anzahl der Zeilen zurück.
+
+        :param valid_only: Ungültige Punkte (NaN) nicht übernehmen
+        """
+        if not self.is_complete():
+            raise ValueError("Sweep ist unvollständig; zuerst run() ausführen.")
+        simulations = [BatterySimulation(cathode_element_data=cathode_data, anode_element_data=anode_data)
+                       for anode_data, cathode_data in self._pair_data]
+        rows = 0
+        for chunk_index in range(self.total_chunks):
+            pair_index = chunk_index // self.chunks_per_pair
+            anode, cathode = self._pair_labels[pair_index]
+            sim = simulations[pair_index]
+            with np.load(_chunk_path(self.output_dir, chunk_index)) as chunk:
+                keep = chunk["valid"] if valid_only else slice(None)
+                columns = {column: chunk[column][keep] for column in
+                           ("temperature", "conc_anode", "conc_cathode", "log_reaction_quotient", "nernst_voltage")}
+            # E⁰ und ΔG⁰ bei der Temperatur jeder Zeile (wie nernst_voltage)
+            E0_cell = sim.get_standard_cell_voltage_batch(columns["temperature"])
+            delta_G0 = -sim.n_overall * F * np.asarray(E0_cell)
+            store.append_batch(anode, cathode, columns["conc_anode"], columns["conc_cathode"],
+                               columns["temperature"], columns["log_reaction_quotient"], E0_cell,
+                               columns["nernst_voltage"], delta_G0)
+            rows += len(columns["temperature"])
+        store.flush()
+        return rows
+
+
+def print_progress(done: int, total: int) -> None:
+    """Einfacher Fortschritts-Callback für die Konsole."""
+    print(f"\rSweep: {done}/{total} Blöcke ({100 * done / max(total, 1):.0f} %)", end="" if done < total else "\n", flush=True)
@@ -0,0 +1,111 @@
+# temperature.py
+"""
+Temperaturabhängige Standardpotentiale E⁰(T).
+
+Modell (Taylor-Entwicklung um 25 °C, Koeffizienten aus dem Schema der Spannungsreihe):
+    E⁰(T) = E⁰ + dE0_dT * (T - 298.15) + 0.5 * d2E0_dT2 * (T - 298.15)²
+
+Ausgewertet wird über eine einmal vorberechnete Tabelle auf einem gleichmäßigen Temperaturgitter
+(Standard 200–500 K in 0.5-K-Schritten) mit linearer Interpolation: der Index ergibt sich direkt aus
+(T - T_min) / Schritt, ohne Suche. Der Interpolationsfehler ist höchstens |d2E0_dT2| * Schritt² / 8
+(bei rein linearen Koeffizienten null bis auf Rundung). Außerhalb des Gitters wird das Polynom
+direkt ausgewertet. Das Gitter enthält 298.15 K exakt.
+"""
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+T_REF = 298.15   # Bezugstemperatur der tabellierten E⁰-Werte in K
+T_MIN = 200.0
+T_MAX = 500.0
+T_STEP = 0.5
+
+
+def _grid_range(t_min: float, t_max: float, step: float) -> tuple[int, int]:
+    """Erster und letzter Stützpunkt k (T = T_REF + k * step); das Gitter ist an T_REF ausgerichtet."""
+    return math.ceil((t_min - T_REF) / step), math.floor((t_max - T_REF) / step)
+
+
+class E0TemperatureTable:
+    """Vorberechnete E⁰(T)-Tabelle für einen Koeffizientensatz (Halbzelle oder ganze Zelle)."""
+    __slots__ = ("E0", "dE0_dT", "d2E0_dT2", "t_start", "step", "values", "_array")
+
+    def __init__(self, E0: float, dE0_dT: float = 0.0, d2E0_dT2: float = 0.0,
+                 t_min: float = T_MIN, t_max: float = T_MAX, step: float = T_STEP) -> None:
+        if step <= 0 or t_max <= t_min:
+            raise ValueError("Ungültiges Temperaturgitter (step > 0 und t_max > t_min erforderlich).")
+        self.E0 = E0
+        self.dE0_dT = dE0_dT
+        self.d2E0_dT2 = d2E0_dT2
+        self.step = step
+        first, last = _grid_range(t_min, t_max, step)
+        self.t_start = T_REF + first * step
+        self.values = [self.polynomial(T_REF + k * step) for k in range(first, last + 1)]
+        self._array = None
+
+    def polynomial(self, temperature: float) -> float:
+        """Direkte Auswertung des Polynoms (ohne Tabelle)."""
+        delta = temperature - T_REF
+        return self.E0 + delta * (self.dE0_dT + 0.5 * self.d2E0_dT2 * delta)
+
+    def __call__(self, temperature: float) -> float:
+        """E⁰ bei `temperature` (K) per Tabellen-Interpolation."""
+        if temperature == T_REF:
+            return self.E0
+        position = (temperature - self.t_start) / self.step
+        if not 0 <= position < len(self.values) - 1:
+            return self.polynomial(temperature)
+        index = int(position)
+        lower = self.values[index]
+        return lower + (position - index) * (self.values[index + 1] - lower)
+
+    def lookup_batch(self, temperature) -> "np.ndarray":
+        """Array-Variante von `__call__` (gleiche Form wie `temperature`)."""
+        import numpy as np
+        if self._array is None:
+            self._array = np.array(self.values, dtype=np.float64)
+        temperature = np.asarray(temperature, dtype=np.float64)
+        position = (temperature - self.t_start) / self.step
+        inside = (position >= 0) & (position < len(self.values) - 1)
+        index = np.floor(np.where(inside, position, 0.0)).astype(np.intp)
+        lower = self._array[index]
+        result = lower + (position - index) * (self._array[index + 1] - lower)
+        if not inside.all():
+            with np.errstate(invalid="ignore"):
+                delta = temperature - T_REF
+                result = np.where(inside, result, self.E0 + delta * (self.dE0_dT + 0.5 * self.d2E0_dT2 * delta))
+        return result
+
+
+@lru_cache(maxsize=1024)
+def get_e0_table(E0: float, dE0_dT: float = 0.0, d2E0_dT2: float = 0.0) -> E0TemperatureTable:
+    """Gemeinsam genutzte Tabelle pro Koeffizientensatz (Standardgitter)."""
+    return E0TemperatureTable(E0, dE0_dT, d2E0_dT2)
+
+
+def e0_at_temperature(E0, dE0_dT, d2E0_dT2, temperature):
+    """E⁰(T) direkt aus den Koeffizienten (Skalare oder Arrays, z. B. alle Spezies bei einer Temperatur)."""
+    delta = temperature - T_REF
+    return E0 + delta * (dE0_dT + 0.5 * d2E0_dT2 * delta)
+
+
+def e0_table_lookup(E0, dE0_dT, d2E0_dT2, temperature: float):
+    """
+    E⁰(T) vieler Koeffizientensätze (Arrays) bei einer Temperatur, bitgleich zu
+    `get_e0_table(E0, dE0_dT, d2E0_dT2)(temperature)` für jeden einzelnen Satz: alle Tabellen des
+    Standardgitters teilen Position und Stützstellen, nur deren Werte hängen von den Koeffizienten ab.
+    So rechnen z. B. `screening.compute_cell_matrix` und `BatterySimulation` mit derselben E⁰(T).
+    """
+    if temperature == T_REF:
+        return E0
+    first, last = _grid_range(T_MIN, T_MAX, T_STEP)
+    position = (temperature - (T_REF + first * T_STEP)) / T_STEP
+    if not 0 <= position < last - first:
+        return e0_at_temperature(E0, dE0_dT, d2E0_dT2, temperature)
+    index = int(position)
+    lower = e0_at_temperature(E0, dE0_dT, d2E0_dT2, T_REF + (first + index) * T_STEP)
+    upper = e0_at_temperature(E0, dE0_dT, d2E0_dT2, T_REF + (first + index + 1) * T_STEP)
+    return lower + (position - index) * (upper - lower)
@@ -0,0 +1,143 @@
+# uncertainty.py
+"""
+Streaming-Statistik für die Monte-Carlo-Unsicherheitsanalyse (`BatterySimulation.get_nernst_uncertainty`).
+
+Die Stichproben werden blockweise erzeugt und sofort verdichtet; kein Block bleibt im Speicher:
+    - Mittelwert/Standardabweichung über blockweise Momente, zusammengeführt nach Chan et al.
+      (paarweise Variante des Welford-Verfahrens, numerisch stabil)
+    - Quantile über ein feines Histogramm, dessen Bereich aus den ersten `pilot_size` Werten (Pilot)
+      abgeleitet wird, unabhängig davon, wie sie auf Blöcke verteilt sind; Werte außerhalb landen in
+      Unter-/Überlauf-Zählern, Min/Max werden exakt mitgeführt
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+
+class StreamingMoments:
+    """Anzahl, Mittelwert und Summe der quadrierten Abweichungen (M2), blockweise aktualisiert."""
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        count = values.size
+        if not count:
+            return
+        mean = float(values.mean())
+        m2 = float(np.square(values - mean).sum())
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    @property
+    def std(self) -> float:
+        """Stichproben-Standardabweichung (ddof=1)."""
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+
+class StreamingQuantiles:
+    """
+    Quantilschätzung über ein Histogramm mit festem Bereich.
+
+    Bis `pilot_size` Werte vorliegen, werden die Blöcke gepuffert; der Bereich wird dann aus genau den
+    ersten `pilot_size` Werten bestimmt (Mittelwert ± `span_std` Standardabweichungen, mindestens der
+    beobachtete Min/Max-Bereich). Dieselbe Wertefolge ergibt so unabhängig von der Blockgröße dasselbe
+    Histogramm. Der Fehler eines Quantils ist höchstens eine Bin-Breite, solange es nicht in den
+    Unter-/Überlauf fällt (dann wird auf Min/Max begrenzt).
+    """
+    def __init__(self, bins: int = 8192, span_std: float = 12.0, pilot_size: int = 10_000) -> None:
+        if bins < 2:
+            raise ValueError("bins muss >= 2 sein.")
+        if pilot_size < 2:
+            raise ValueError("pilot_size muss >= 2 sein.")
+        self.bins = bins
+        self.span_std = span_std
+        self.pilot_size = pilot_size
+        self.edges: np.ndarray | None = None
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._pilot: list[np.ndarray] = []
+        self._pilot_count = 0
+
+    def _init_range(self, pilot: np.ndarray) -> None:
+        mean, std = float(pilot.mean()), float(pilot.std())
+        low = min(float(pilot.min()), mean - self.span_std * std)
+        high = max(float(pilot.max()), mean + self.span_std * std)
+        if not high > low: # Konstante Werte: Bereich künstlich öffnen
+            pad = max(abs(low) * 1e-12, 1e-300)
+            low, high = low - pad, high + pad
+        self.edges = np.linspace(low, high, self.bins + 1)
+
+    def _finish_pilot(self) -> None:
+        """Legt den Bereich aus den gepufferten Werten fest und sortiert sie ins Histogramm ein."""
+        pilot = np.concatenate(self._pilot)
+        self._pilot = []
+        self._init_range(pilot[:self.pilot_size])
+        self._add(pilot)
+
+    def update(self, values: np.ndarray) -> None:
+        if not values.size:
+            return
+        if self.edges is not None:
+            self._add(values)
+            return
+        self._pilot.append(np.array(values, dtype=np.float64)) # Kopie: der Aufrufer darf den Block wiederverwenden
+        self._pilot_count += values.size
+        if self._pilot_count >= self.pilot_size:
+            self._finish_pilot()
+
+    def _add(self, values: np.ndarray) -> None:
+        low, high = self.edges[0], self.edges[-1]
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.count += values.size
+        # Bin-Index direkt berechnen (schneller als np.histogram bei festen, gleichmäßigen Kanten)
+        scaled = (values - low) * (self.bins / (high - low))
+        index = np.floor(scaled).astype(np.int64)
+        below = index < 0
+        above = index >= self.bins
+        self.underflow += int(below.sum())
+        self.overflow += int(above.sum())
+        inside = index[~(below | above)]
+        self.counts += np.bincount(inside, minlength=self.bins)
+
+    def quantile(self, q: float) -> float:
+        """Linear innerhalb des Bins interpoliertes q-Quantil (0 <= q <= 1)."""
+        if self._pilot: # Weniger als pilot_size Werte insgesamt: Bereich aus allen bestimmen
+            self._finish_pilot()
+        if not self.count:
+            return float("nan")
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Quantil muss zwischen 0 und 1 liegen.")
+        rank = q * self.count
+        if rank <= self.underflow:
+            return self.min
+        if rank >= self.count - self.overflow:
+            return self.max
+        cumulative = self.underflow + np.cumsum(self.counts)
+        bin_index = int(np.searchsorted(cumulative, rank, side="left"))
+        before = cumulative[bin_index - 1] if bin_index > 0 else self.underflow
+        in_bin = self.counts[bin_index]
+        fraction = (rank - before) / in_bin if in_bin else 0.0
+        width = self.edges[1] - self.edges[0]
+        value = self.edges[bin_index] + fraction * width
+        return float(min(max(value, self.min), self.max))
+
+
+class UncertaintyResult(NamedTuple):
+    """Ergebnis von `BatterySimulation.get_nernst_uncertainty`."""
+    n_samples: int               # Anzahl gültiger Stichproben
+    mean_E: float                # Mittelwert E_Nernst in V
+    std_E: float                 # Standardabweichung E_Nernst in V
+    quantiles_E: dict            # {q: E_Nernst-Quantil in V}
+    mean_delta_G: float          # Mittelwert ΔG in J/mol
+    std_delta_G: float           # Standardabweichung ΔG in J/mol
+    quantiles_delta_G: dict      # {q: ΔG-Quantil in J/mol}
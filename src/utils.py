@@ -1,38 +1,237 @@
 
 import json
+import os
+from collections import Counter
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class SeriesColumns(NamedTuple):
+    """Spaltenansicht (array-basiert) der Spannungsreihe; Zeile i gehört zu `elements[i]`."""
+    elements: tuple[str, ...]
+    E0: "np.ndarray"  # Standard-Reduktionspotentiale in V (float64)
+    n: "np.ndarray"   # Anzahl der übertragenen Elektronen (int64)
+    dE0_dT: "np.ndarray"    # Temperaturkoeffizient in V/K (0, falls nicht angegeben)
+    d2E0_dT2: "np.ndarray"  # Zweite Ableitung in V/K² (0, falls nicht angegeben)
+    labels: tuple[str, ...]  # Eindeutige Bezeichnung je Zeile (siehe `get_element_names`)
+
+
+# Umgebungsvariable mit dem Pfad eines Binär-Snapshots (siehe series_snapshot.py)
+SNAPSHOT_ENV_VAR = "SPANNUNGSREIHE_SNAPSHOT"
+
+
+class _SnapshotRows(Sequence):
+    """Lazy-Sicht auf die Zeilen eines Snapshots; Dicts werden erst beim Zugriff gebaut und gemerkt."""
+    def __init__(self, snapshot) -> None:
+        self._snapshot = snapshot
+        self._rows: dict[int, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        row = self._rows.get(index)
+        if row is None:
+            row = self._rows[index] = self._snapshot.row(index)
+        return row
+
 
 class ElectrochemicalSeries:
-    def __init__(self):
+    def __init__(self, entries: list[dict] | None = None):
+        """
+        :param entries: Optionale Liste von Einträgen im Schema der Spannungsreihe
+                        (element, reaction, E0, n, ion_formula, color; optional dE0_dT in V/K
+                        und d2E0_dT2 in V/K²). Ohne Angabe wird die eingebaute Standardtabelle verwendet.
+        """
+        if entries is not None:
+            self.series = list(entries)
+            self._build_index()
+            return
+
         # Farben hinzugefügt (Standardnamen oder Hex-Codes)
         self.series = [
-             # Element, Reaktion, E0, n, Ionenformel, Farbe
-             { "element": "Li", "reaction": "Li+ + e- -> Li", "E0": -3.04, "n": 1, "ion_formula": "Li+", "color": "#C0C0C0" }, # Silver
-             { "element": "K", "reaction": "K+ + e- -> K", "E0": -2.93, "n": 1, "ion_formula": "K+", "color": "#C0C0C0" },  # Silver
-             { "element": "Ca", "reaction": "Ca2+ + 2e- -> Ca", "E0": -2.87, "n": 2, "ion_formula": "Ca²⁺", "color": "#C0C0C0" },# Silver
-             { "element": "Na", "reaction": "Na+ + e- -> Na", "E0": -2.71, "n": 1, "ion_formula": "Na+", "color": "#C0C0C0" }, # Silver
-             { "element": "Mg", "reaction": "Mg2+ + 2e- -> Mg", "E0": -2.37, "n": 2, "ion_formula": "Mg²⁺", "color": "#C0C0C0" },# Silver
-             { "element": "Al", "reaction": "Al3+ + 3e- -> Al", "E0": -1.66, "n": 3, "ion_formula": "Al³⁺", "color": "#C0C0C0" },# Silver
-             { "element": "Zn", "reaction": "Zn2+ + 2e- -> Zn", "E0": -0.76, "n": 2, "ion_formula": "Zn²⁺", "color": "#A9A9A9" }, # DarkGray (typisch Zink)
-             { "element": "Fe", "reaction": "Fe2+ + 2e- -> Fe", "E0": -0.44, "n": 2, "ion_formula": "Fe²⁺", "color": "#808080" }, # Gray
-             { "element": "Ni", "reaction": "Ni2+ + 2e- -> Ni", "E0": -0.25, "n": 2, "ion_formula": "Ni²⁺", "color": "#C0C0C0" },# Silver
-             { "element": "Sn", "reaction": "Sn2+ + 2e- -> Sn", "E0": -0.14, "n": 2, "ion_formula": "Sn²⁺", "color": "#C0C0C0" },# Silver
-             { "element": "Pb", "reaction": "Pb2+ + 2e- -> Pb", "E0": -0.13, "n": 2, "ion_formula": "Pb²⁺", "color": "#696969" }, # DimGray (typisch Blei)
+             # Element, Reaktion, E0, dE0/dT, n, Ionenformel, Farbe
+             # dE0_dT: isothermer Temperaturkoeffizient in V/K (nach Bratsch 1989); fehlt er, gilt 0
+             { "element": "Li", "reaction": "Li+ + e- -> Li", "E0": -3.04, "dE0_dT": -0.514e-3, "n": 1, "ion_formula": "Li+", "color": "#C0C0C0" }, # Silver
+             { "element": "K", "reaction": "K+ + e- -> K", "E0": -2.93, "dE0_dT": -1.074e-3, "n": 1, "ion_formula": "K+", "color": "#C0C0C0" },  # Silver
+             { "element": "Ca", "reaction": "Ca2+ + 2e- -> Ca", "E0": -2.87, "dE0_dT": -0.186e-3, "n": 2, "ion_formula": "Ca²⁺", "color": "#C0C0C0" },# Silver
+             { "element": "Na", "reaction": "Na+ + e- -> Na", "E0": -2.71, "dE0_dT": -0.772e-3, "n": 1, "ion_formula": "Na+", "color": "#C0C0C0" }, # Silver
+             { "element": "Mg", "reaction": "Mg2+ + 2e- -> Mg", "E0": -2.37, "dE0_dT": 0.103e-3, "n": 2, "ion_formula": "Mg²⁺", "color": "#C0C0C0" },# Silver
+             { "element": "Al", "reaction": "Al3+ + 3e- -> Al", "E0": -1.66, "dE0_dT": 0.533e-3, "n": 3, "ion_formula": "Al³⁺", "color": "#C0C0C0" },# Silver
+             { "element": "Zn", "reaction": "Zn2+ + 2e- -> Zn", "E0": -0.76, "dE0_dT": 0.119e-3, "n": 2, "ion_formula": "Zn²⁺", "color": "#A9A9A9" }, # DarkGray (typisch Zink)
+             { "element": "Fe", "reaction": "Fe2+ + 2e- -> Fe", "E0": -0.44, "dE0_dT": 0.052e-3, "n": 2, "ion_formula": "Fe²⁺", "color": "#808080" }, # Gray
+             { "element": "Ni", "reaction": "Ni2+ + 2e- -> Ni", "E0": -0.25, "dE0_dT": 0.060e-3, "n": 2, "ion_formula": "Ni²⁺", "color": "#C0C0C0" },# Silver
+             { "element": "Sn", "reaction": "Sn2+ + 2e- -> Sn", "E0": -0.14, "dE0_dT": -0.282e-3, "n": 2, "ion_formula": "Sn²⁺", "color": "#C0C0C0" },# Silver
+             { "element": "Pb", "reaction": "Pb2+ + 2e- -> Pb", "E0": -0.13, "dE0_dT": -0.397e-3, "n": 2, "ion_formula": "Pb²⁺", "color": "#696969" }, # DimGray (typisch Blei)
              # H bekommt Pt-Farbe, da oft Pt-Elektrode verwendet wird
-             { "element": "H", "reaction": "2H+ + 2e- -> H2", "E0": 0.00, "n": 2, "ion_formula": "H+", "color": "#E5E4E2" }, # Platinum color
-             { "element": "Cu", "reaction": "Cu2+ + 2e- -> Cu", "E0": 0.34, "n": 2, "ion_formula": "Cu²⁺", "color": "#B87333" }, # Copper
-             { "element": "Ag", "reaction": "Ag+ + e- -> Ag", "E0": 0.80, "n": 1, "ion_formula": "Ag+", "color": "silver" },   # Silver (Name)
+             { "element": "H", "reaction": "2H+ + 2e- -> H2", "E0": 0.00, "dE0_dT": 0.0, "n": 2, "ion_formula": "H+", "color": "#E5E4E2" }, # Platinum color
+             { "element": "Cu", "reaction": "Cu2+ + 2e- -> Cu", "E0": 0.34, "dE0_dT": 0.011e-3, "n": 2, "ion_formula": "Cu²⁺", "color": "#B87333" }, # Copper
+             { "element": "Ag", "reaction": "Ag+ + e- -> Ag", "E0": 0.80, "dE0_dT": -0.989e-3, "n": 1, "ion_formula": "Ag+", "color": "silver" },   # Silver (Name)
              { "element": "Pt", "reaction": "Pt2+ + 2e- -> Pt", "E0": 1.20, "n": 2, "ion_formula": "Pt²⁺", "color": "#E5E4E2" }, # Platinum
              { "element": "Au", "reaction": "Au3+ + 3e- -> Au", "E0": 1.50, "n": 3, "ion_formula": "Au³⁺", "color": "gold" }     # Gold (Name)
         ]
+        self._build_index()
+
+    @classmethod
+    def from_snapshot(cls, path: str) -> "ElectrochemicalSeries":
+        """
+        Lädt die Spannungsreihe aus einem Binär-Snapshot per memmap (siehe series_snapshot.py).
+        E0/n werden direkt aus der abgebildeten Datei gelesen; Einträge als Dicts erst bei Zugriff gebaut.
+        """
+        import numpy as np
+        from series_snapshot import load_series_snapshot
+
+        snapshot = load_series_snapshot(path)
+        series = cls.__new__(cls)
+        series.series = _SnapshotRows(snapshot)
+        elements = snapshot.string_column("element")
+        series._build_index(elements, snapshot.string_column("reaction"), snapshot.records["E0"])
+        records = snapshot.records
+        # Snapshots der Version 1 ohne Temperaturkoeffizienten: 0 (E⁰ temperaturunabhängig)
+        zeros = np.zeros(len(records))
+        series._columns = SeriesColumns(
+            tuple(elements), records["E0"], records["n"].astype(np.int64),
+            records["dE0_dT"] if "dE0_dT" in records.dtype.names else zeros,
+            records["d2E0_dT2"] if "d2E0_dT2" in records.dtype.names else zeros,
+            tuple(series._labels),
+        )
+        return series
+
+    def save_snapshot(self, path: str) -> None:
+        """Schreibt die aktuelle Spannungsreihe als Binär-Snapshot."""
+        from series_snapshot import write_series_snapshot
+        write_series_snapshot(list(self.series), path)
+
+    def _build_index(self, elements=None, reactions=None, e0=None) -> None:
+        """
+        Baut Hash-Indizes (Element, Reaktion) und die E0-sortierte Reihenfolge auf und verwirft
+        die Spaltenansicht. Muss nach jeder Änderung an `self.series` aufgerufen werden.
+        Optional können die Spalten direkt übergeben werden (z. B. aus einem Snapshot).
+        """
+        if elements is None:
+            elements = [elem["element"] for elem in self.series]
+            reactions = [elem["reaction"] for elem in self.series]
+            e0 = [elem["E0"] for elem in self.series]
+        elif not isinstance(e0, list):
+            e0 = e0.tolist()
+
+        # Eindeutige Bezeichnungen: das Element selbst, bei mehreren Halbreaktionen "Fe (Fe3+ + e- -> Fe2+)"
+        counts = Counter(elements)
+        labels = [element if counts[element] == 1 else f"{element} ({reaction})"
+                  for element, reaction in zip(elements, reactions)]
+        seen: Counter = Counter()
+        for row, label in enumerate(labels):
+            seen[label] += 1
+            if seen[label] > 1:  # Doppelt erfasste Halbreaktion
+                labels[row] = f"{label} #{seen[label]}"
+        self._labels = labels
+
+        self._element_index: dict[str, int] = {}
+        self._reaction_index: dict[str, int] = {}
+        for row, (element, reaction, label) in enumerate(zip(elements, reactions, labels)):
+            self._element_index[label] = row
+            self._reaction_index.setdefault(reaction, row)
+        for row, element in enumerate(elements):
+            # Der reine Elementname verweist (wie bisher) auf die erste Halbreaktion des Elements
+            self._element_index.setdefault(element, row)
+
+        # Stabile Sortierung, damit gleiche E0-Werte ihre Tabellenreihenfolge behalten
+        self._sorted_row_list = sorted(range(len(e0)), key=e0.__getitem__)
+        self._sorted_names = [labels[row] for row in self._sorted_row_list]
+        # Spaltenansicht wird erst bei Bedarf gebaut (NumPy-Import nur für Batch-Code)
+        self._columns: SeriesColumns | None = None
+        self._sorted_rows = None
+
+    def add_entries(self, entries: list[dict]) -> None:
+        """Hängt weitere Einträge (z. B. aus der gescrapten Tabelle) an und aktualisiert die Indizes."""
+        if not isinstance(self.series, list):
+            self.series = list(self.series) # Snapshot-Sicht ist read-only
+        self.series.extend(entries)
+        self._build_index()
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    @property
+    def columns(self) -> SeriesColumns:
+        """Spaltenansicht von E0 und n für Batch-Berechnungen (ohne Dict-Zugriffe)."""
+        if self._columns is None:
+            import numpy as np
+            count = len(self.series)
+            e0 = np.fromiter((elem["E0"] for elem in self.series), dtype=np.float64, count=count)
+            n = np.fromiter((elem["n"] for elem in self.series), dtype=np.int64, count=count)
+            de0_dt = np.fromiter((elem.get("dE0_dT", 0.0) for elem in self.series), dtype=np.float64, count=count)
+            d2e0_dt2 = np.fromiter((elem.get("d2E0_dT2", 0.0) for elem in self.series), dtype=np.float64, count=count)
+            self._columns = SeriesColumns(tuple(elem["element"] for elem in self.series), e0, n, de0_dt, d2e0_dt2,
+                                          tuple(self._labels))
+        return self._columns
+
+    def get_E0_at(self, temperature: float) -> "np.ndarray":
+        """E⁰(T) aller Einträge (Zeilenreihenfolge wie `columns`) bei einer Temperatur in K (Tabellen wie in temperature.py)."""
+        from temperature import e0_table_lookup
+        columns = self.columns
+        return e0_table_lookup(columns.E0, columns.dE0_dT, columns.d2E0_dT2, temperature)
+
+    @property
+    def sorted_rows(self) -> "np.ndarray":
+        """Zeilenindizes der Einträge, aufsteigend nach E0 sortiert."""
+        if self._sorted_rows is None:
+            import numpy as np
+            self._sorted_rows = np.array(self._sorted_row_list, dtype=np.intp)
+        return self._sorted_rows
 
     def get_element_names(self):
-        """Gibt eine Liste der verfügbaren Elementnamen zurück."""
-        # Sortiere nach dem Standardpotential (E0) aufsteigend
-        return sorted([elem['element'] for elem in self.series], key=lambda name: self.get_element_data(name)['E0'])
+        """
+        Gibt eine Liste der verfügbaren Elementnamen zurück (eindeutig, ein Eintrag pro Halbreaktion).
+        Hat ein Element mehrere Halbreaktionen, wird die Reaktion angehängt, z. B. "Fe (Fe2+ + 2e- -> Fe)".
+        """
+        # Sortiert nach dem Standardpotential (E0) aufsteigend, vorberechnet in _build_index
+        return list(self._sorted_names)
+
+    def get_element_index(self, element_name: str) -> int:
+        """
+        Gibt den Zeilenindex eines Elements (für `columns`) zurück. Akzeptiert die Bezeichnungen aus
+        `get_element_names`; der reine Elementname steht für die erste Halbreaktion des Elements.
+        """
+        try:
+            return self._element_index[element_name]
+        except KeyError:
+            raise ValueError(f"Element '{element_name}' nicht in der Spannungsreihe gefunden!") from None
+
+    def get_element_label(self, element_name: str) -> str:
+        """
+        Eindeutige Bezeichnung (wie in `get_element_names`) für einen Namen, z. B. "Fe" ->
+        "Fe (Fe2+ + 2e- -> Fe)", wenn Fe mehrere Halbreaktionen hat. Für gespeicherte Ergebnisse.
+        """
+        return self._labels[self.get_element_index(element_name)]
 
     def get_element_data(self, element_name: str) -> dict:
         """Sucht die elektrochemischen Daten eines Elements."""
-        for elem in self.series:
-            if elem["element"] == element_name:
-                return elem
-        raise ValueError(f"Element '{element_name}' nicht in der Spannungsreihe gefunden!")
\ No newline at end of file
+        return self.series[self.get_element_index(element_name)]
+
+    def get_reaction_data(self, reaction: str) -> dict:
+        """Sucht die elektrochemischen Daten einer Halbreaktion anhand des Reaktionsstrings."""
+        try:
+            return self.series[self._reaction_index[reaction]]
+        except KeyError:
+            raise ValueError(f"Reaktion '{reaction}' nicht in der Spannungsreihe gefunden!") from None
+
+
+def load_default_series() -> ElectrochemicalSeries:
+    """
+    Gibt die Spannungsreihe für GUI/CLI zurück: aus dem Snapshot in $SPANNUNGSREIHE_SNAPSHOT,
+    falls gesetzt, sonst die eingebaute Standardtabelle.
+    """
+    snapshot_path = os.environ.get(SNAPSHOT_ENV_VAR)
+    if snapshot_path:
+        return ElectrochemicalSeries.from_snapshot(snapshot_path)
+    return ElectrochemicalSeries()
@@ -0,0 +1,96 @@
+# worker.py
+import queue
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class ComputationWorker:
+    """
+    Führt Berechnungen der GUI in einem Hintergrund-Thread aus und liefert die Ergebnisse
+    über `after()` zurück in den Tk-Mainloop.
+
+    - Wiederholte Anfragen mit demselben Schlüssel (z. B. <FocusOut> direkt nach <Return>)
+      werden zusammengefasst, solange keine andere Anfrage dazwischen lag.
+    - Eine neue Anfrage macht ältere veraltet: noch nicht gestartete werden abgebrochen,
+      Ergebnisse bereits laufender werden verworfen.
+    - Callbacks laufen ausschließlich im Tk-Thread; der Worker-Thread greift nie auf Tk zu.
+    """
+    def __init__(self, root, poll_interval_ms: int = 15) -> None:
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="battery-worker")
+        self._results: queue.Queue = queue.Queue()
+        self._generation = 0
+        self._last_key: Hashable | None = None
+        self._current_future: Future | None = None
+        self._outstanding = 0 # Eingereichte Anfragen, deren Ergebnis noch nicht abgeholt wurde
+        self._poll_id = None
+
+    def submit(self, key: Hashable, func: Callable[[], object],
+               on_result: Callable[[object], None], on_error: Callable[[Exception], None]) -> bool:
+        """
+        Plant `func` im Hintergrund ein. Gibt False zurück, wenn die Anfrage mit der zuletzt
+        eingereichten identisch ist und daher nicht erneut berechnet wird.
+        """
+        if key == self._last_key:
+            return False
+        self._last_key = key
+        self._generation += 1
+        generation = self._generation
+
+        if self._current_future is not None:
+            self._current_future.cancel() # Wirkt nur, falls noch nicht gestartet
+
+        future = self._executor.submit(func)
+        self._outstanding += 1
+        future.add_done_callback(lambda f: self._results.put((generation, f, on_result, on_error)))
+        self._current_future = future
+        self._schedule_poll()
+        return True
+
+    def cancel(self) -> None:
+        """
+        Verwirft die laufende bzw. wartende Anfrage (z. B. nach dem Zurücksetzen der Ausgaben):
+        ein noch nicht gestarteter Auftrag wird abgebrochen, ein spätes Ergebnis nicht mehr ausgeliefert.
+        """
+        self._generation += 1
+        self._last_key = None
+        if self._current_future is not None:
+            self._current_future.cancel() # Wirkt nur, falls noch nicht gestartet
+            self._current_future = None
+
+    def is_busy(self) -> bool:
+        return self._current_future is not None and not self._current_future.done()
+
+    def _schedule_poll(self) -> None:
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_interval_ms, self._poll)
+
+    def _poll(self) -> None:
+        """Läuft im Tk-Thread: übergibt fertige, aktuelle Ergebnisse an ihre Callbacks."""
+        self._poll_id = None
+        while True:
+            try:
+                generation, future, on_result, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            if generation != self._generation or future.cancelled():
+                continue # Veraltete Anfrage
+            error = future.exception()
+            if error is not None:
+                self._last_key = None # Fehlerfall nicht zwischenspeichern
+                on_error(error)
+            else:
+                on_result(future.result())
+        if self._outstanding > 0:
+            self._schedule_poll()
+
+    def shutdown(self) -> None:
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
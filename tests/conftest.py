@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Die Module verwenden flache Importe (z. B. "from simulation import ..."), wie beim Start aus src/
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for directory in ("src", os.path.join("data", "processed")):
+    path = os.path.join(ROOT, directory)
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,81 @@
+import math
+
+import numpy as np
+import pytest
+
+from activity import MODELS, ActivityModel, parse_ion_charge
+from simulation import BatterySimulation
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+PAIRS = [("Zn", "Cu"), ("Li", "Ag"), ("Al", "Au"), ("H", "Cu"), ("Cu", "Zn")]
+CONCENTRATIONS = [1e-6, 1e-3, 0.1, 1.0, 3.0]
+TEMPERATURES = [250.0, 298.15, 310.0, 350.0]
+
+
+@pytest.mark.parametrize("model", MODELS)
+@pytest.mark.parametrize("anode, cathode", PAIRS)
+def test_batch_matches_scalar_with_activity_model(anode, cathode, model):
+    sim = BatterySimulation(cathode_element_data=SERIES.get_element_data(cathode),
+                            anode_element_data=SERIES.get_element_data(anode),
+                            activity_model=ActivityModel(model))
+    c_a, c_k, temp = np.meshgrid(CONCENTRATIONS, CONCENTRATIONS, TEMPERATURES, indexing="ij")
+    # Skalare und Array-Temperaturen (gecachte bzw. vektorisierte Debye-Hückel-Konstanten)
+    for temperature in (temp, 310.0):
+        result = sim.get_nernst_voltage_batch(c_a, c_k, temperature)
+        temperature = np.broadcast_to(temperature, c_a.shape)
+        assert result.valid.all()
+        log_q = np.vectorize(sim.get_log_reaction_quotient)(c_a, c_k, temperature)
+        voltage = np.vectorize(sim.get_nernst_voltage_from_log_q)(log_q, temperature)
+        # Bitgleich, wo np.log und math.log gleich runden; sonst nur deren letzte Stelle
+        exact = (np.log(c_a) == np.vectorize(math.log)(c_a)) & (np.log(c_k) == np.vectorize(math.log)(c_k))
+        assert exact.any()
+        np.testing.assert_array_equal(result.log_reaction_quotient[exact], log_q[exact])
+        np.testing.assert_array_equal(result.nernst_voltage[exact], voltage[exact])
+        np.testing.assert_allclose(result.nernst_voltage, voltage, rtol=1e-14, atol=0)
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_log_gamma_batch_is_bitwise_equal_to_scalar(model):
+    activity = ActivityModel(model)
+    terms = activity.ion_terms("Cu²⁺")
+    concentration = np.geomspace(1e-6, 3.0, 200)
+    temperature = np.linspace(260.0, 360.0, 200)
+    expected = [activity.log_gamma(terms, c, t) for c, t in zip(concentration, temperature)]
+    np.testing.assert_array_equal(activity.log_gamma_batch(terms, concentration, temperature), expected)
+
+
+@pytest.mark.parametrize("formula, charge", [
+    ("Cu²⁺", 2), ("Li+", 1), ("Fe^3+", 3), ("Cl⁻", -1),
+    ("NO₃⁻", -1), ("SO₄²⁻", -2), ("MnO₄-", -1), ("PO₄³⁻", -3), ("NH₄+", 1), ("Cr₂O₇ 2-", -2),
+])
+def test_parse_ion_charge(formula, charge):
+    assert parse_ion_charge(formula) == charge
+
+
+@pytest.mark.parametrize("formula", ["NO3-", "SO4-2", "Fe3+", "Cu", "SO42-"])
+def test_ambiguous_ion_formulas_are_rejected(formula):
+    # Ziffer vor dem Vorzeichen: Index oder Ladung? Wird wie in der Pipeline nicht geraten
+    with pytest.raises(ValueError):
+        parse_ion_charge(formula)
+
+
+def test_charge_falls_back_to_the_half_reaction_balance():
+    cathode = {"element": "Fe", "reaction": "Fe3+ + 3e- -> Fe", "E0": -0.04, "n": 3, "ion_formula": "Fe3+"}
+    anode = SERIES.get_element_data("Zn")
+    sim = BatterySimulation(cathode, anode, activity_model=ActivityModel("davies"))
+    assert sim._cathode_ion_terms.charge == 3
+    # Weder Formel noch Bilanz eindeutig (mehrere Spezies): keine geratene Ladung
+    nitrate = {"element": "N", "reaction": "NO3- + 4H+ + 3e- -> NO + 2H2O", "E0": 0.96, "n": 3, "ion_formula": "NO3-"}
+    with pytest.raises(ValueError):
+        BatterySimulation(nitrate, anode, activity_model=ActivityModel("davies"))
+
+
+def test_activity_model_lowers_activity():
+    model = ActivityModel("davies")
+    terms = model.ion_terms("Cu²⁺")
+    assert model.log_gamma(terms, 0.01) < 0
+    np.testing.assert_array_equal(model.log_gamma_batch(terms, np.array([0.001, 0.01, 0.1])),
+                                  [model.log_gamma(terms, c) for c in (0.001, 0.01, 0.1)])
+    with pytest.raises(ValueError):
+        ActivityModel("unknown")
@@ -0,0 +1,215 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote
+
+import pytest
+
+import chemical_data
+from chemical_data import PubChemClient, get_battery_material_data
+from material_cache import MaterialCache
+
+# Ersatz-Datenbank: Name -> CID und CID -> Eigenschaften (Massen wie bei PUG-REST teils als String)
+CIDS = {"Lithium": 3028194, "Zinc": 23994, "Copper": 23978, "Flaky": 1, "Busy": 2}
+PROPERTIES = {
+    3028194: {"MolecularFormula": "Li", "MolecularWeight": "6.94"},
+    23994: {"MolecularFormula": "Zn", "MolecularWeight": "65.4"},
+    23978: {"MolecularFormula": "Cu", "MolecularWeight": 63.5},
+    1: {"MolecularFormula": "X", "MolecularWeight": "1.0"},
+    2: {"MolecularFormula": "Y", "MolecularWeight": "2.0"},
+}
+
+
+class StandInPubChem:
+    """Lokaler HTTP-Server, der die benötigten PUG-REST-Endpunkte nachbildet."""
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str]] = []
+        self.post_bodies: list[list[int]] = []
+        # Pfad -> Liste von (Status, Header) für die ersten Anfragen auf diesen Pfad
+        self.failures: dict[str, list[tuple[int, dict]]] = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload=None, headers=None):
+                body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+                self.send_response(status)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _injected_failure(self) -> bool:
+                pending = server.failures.get(self.path)
+                if pending:
+                    status, headers = pending.pop(0)
+                    self._send(status, {"Fault": "injected"}, headers)
+                    return True
+                return False
+
+            def do_GET(self):
+                server.requests.append(("GET", self.path))
+                if self._injected_failure():
+                    return
+                parts = self.path.strip("/").split("/")
+                # compound/name/<name>/cids/JSON
+                if len(parts) == 5 and parts[:2] == ["compound", "name"] and parts[3] == "cids":
+                    cid = CIDS.get(unquote(parts[2]))
+                    if cid is None:
+                        self._send(404, {"Fault": {"Code": "PUGREST.NotFound"}})
+                    else:
+                        self._send(200, {"IdentifierList": {"CID": [cid]}})
+                    return
+                self._send(400, {"Fault": "bad request"})
+
+            def do_POST(self):
+                server.requests.append(("POST", self.path))
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode("utf-8"))
+                if self._injected_failure():
+                    return
+                cids = [int(cid) for cid in form["cid"][0].split(",")]
+                server.post_bodies.append(cids)
+                rows = [{"CID": cid, **PROPERTIES[cid]} for cid in cids if cid in PROPERTIES]
+                if not rows:
+                    self._send(404, {"Fault": {"Code": "PUGREST.NotFound"}})
+                else:
+                    self._send(200, {"PropertyTable": {"Properties": rows}})
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+
+@pytest.fixture
+def server():
+    with StandInPubChem() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Zeichnet die Wartezeiten des Backoffs auf, statt tatsächlich zu schlafen."""
+    recorded = []
+    monkeypatch.setattr(chemical_data.time, "sleep", recorded.append)
+    return recorded
+
+
+def make_client(server, **kwargs) -> PubChemClient:
+    return PubChemClient(base_url=server.url, max_workers=3, backoff=0.5, timeout=5, **kwargs)
+
+
+def test_batched_post_returns_properties(server):
+    with make_client(server, batch_size=2) as client:
+        by_cid = client.get_properties([3028194, 23994, 23978, 23994], ["molecular_formula", "molecular_weight"])
+    assert by_cid[3028194] == {"molecular_formula": "Li", "molecular_weight": 6.94}
+    assert by_cid[23994]["molecular_weight"] == 65.4
+    assert by_cid[23978]["molecular_weight"] == 63.5
+    # Doppelte CIDs werden entfernt, drei CIDs ergeben bei batch_size=2 zwei POST-Requests
+    assert sorted(len(body) for body in server.post_bodies) == [1, 2]
+    assert sorted(cid for body in server.post_bodies for cid in body) == [23978, 23994, 3028194]
+
+
+def test_not_found_is_handled(server):
+    with make_client(server) as client:
+        assert client.get_cid("Unobtainium") is None
+        # Eine CID ohne Datensatz liefert 404 auf den POST und damit keine Zeile
+        assert client.get_properties([999]) == {}
+        materials = client.fetch_materials(["Zinc", "Unobtainium"])
+    assert materials["Unobtainium"] == {}
+    assert materials["Zinc"]["molecular_weight"] == 65.4
+
+
+def test_retry_after_is_honored(server, sleeps):
+    server.failures["/compound/name/Flaky/cids/JSON"] = [(429, {"Retry-After": "2"})]
+    with make_client(server) as client:
+        assert client.get_cid("Flaky") == 1
+    assert sleeps == [2]
+    assert server.requests.count(("GET", "/compound/name/Flaky/cids/JSON")) == 2
+
+
+def test_server_errors_back_off_exponentially(server, sleeps):
+    server.failures["/compound/name/Busy/cids/JSON"] = [(503, {}), (503, {}), (503, {})]
+    with make_client(server) as client:
+        assert client.get_cid("Busy") == 2
+    assert len(sleeps) == 3
+    # backoff * 2^Versuch * (1 + Zufall in [0, 1))
+    for attempt, delay in enumerate(sleeps):
+        assert 0.5 * 2 ** attempt <= delay < 0.5 * 2 ** (attempt + 1)
+
+
+def test_retries_give_up_after_max_retries(server, sleeps):
+    import requests
+    server.failures["/compound/name/Busy/cids/JSON"] = [(503, {})] * 3
+    with make_client(server, max_retries=2) as client:
+        with pytest.raises(requests.HTTPError):
+            client.get_cid("Busy")
+    assert len(sleeps) == 2
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_get_battery_material_data(server, sleeps, use_cache):
+    server.failures["/compound/name/Flaky/cids/JSON"] = [(429, {"Retry-After": "1"})]
+    names = ["Lithium", "Zinc", "Unobtainium", "Flaky"]
+    cache = MaterialCache(":memory:") if use_cache else None
+    try:
+        with make_client(server) as client:
+            df = get_battery_material_data(names, client=client, cache=cache)
+        # Nicht gefundene Materialien ergeben eine leere Zeile (NaN), die Reihenfolge bleibt erhalten
+        assert df["name"].isna().tolist() == [False, False, True, False]
+        weights = dict(zip(df["name"], df["molecular_weight"]))
+        assert weights["Lithium"] == 6.94
+        assert weights["Flaky"] == 1.0
+        assert sleeps == [1]
+
+        if use_cache:
+            # Zweiter Lauf kommt vollständig aus dem Cache (auch "nicht gefunden"), ohne Requests
+            request_count = len(server.requests)
+            with make_client(server) as client:
+                again = get_battery_material_data(names, client=client, cache=cache)
+            assert len(server.requests) == request_count
+            assert list(again["molecular_weight"][:2]) == [6.94, 65.4]
+            offline = get_battery_material_data(["Zinc"], cache=cache, offline=True)
+            assert offline["molecular_weight"][0] == 65.4
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def test_not_found_entries_expire_after_negative_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("material_cache.time.time", lambda: now[0])
+    with MaterialCache(":memory:", negative_ttl=60) as cache:
+        cache.put_many({"Zinc": {"molecular_weight": 65.4}, "Unobtainium": {}})
+        assert cache.get_many(["Zinc", "Unobtainium"]) == {"Zinc": {"molecular_weight": 65.4}, "Unobtainium": {}}
+        now[0] += 61
+        # Der Treffer bleibt (ttl=None), der Negativ-Eintrag ist abgelaufen und wird beim Purge gelöscht
+        assert cache.get_many(["Zinc", "Unobtainium"]) == {"Zinc": {"molecular_weight": 65.4}}
+        cache.purge()
+        assert len(cache) == 1
+
+
+def test_failed_property_batch_is_not_cached(server, sleeps):
+    path = "/compound/cid/property/" + ",".join(chemical_data.PUG_PROPERTY_NAMES[prop]
+                                                for prop in chemical_data.MATERIAL_PROPERTIES) + "/JSON"
+    server.failures[path] = [(404, {})]
+    with MaterialCache(":memory:") as cache, make_client(server) as client:
+        df = get_battery_material_data(["Zinc", "Unobtainium"], client=client, cache=cache)
+        assert len(df) == 2 and "molecular_weight" not in df
+        # Nur das echte "nicht gefunden" (404 auf den Namen) wird gecacht
+        assert cache.get_many(["Zinc", "Unobtainium"]) == {"Unobtainium": {}}
+        again = get_battery_material_data(["Zinc"], client=client, cache=cache)
+    assert again["molecular_weight"][0] == 65.4
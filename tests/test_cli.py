@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from cli import CellCalculator, main, read_jobs
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return CellCalculator()
+
+
+def test_malformed_lines_only_fail_their_own_job(tmp_path, capsys):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text('{"anode": "Zn", "cathode": "Cu"}\n{bad\n\n[1, 2]\n{"anode": "Zn", "cathode": "Cu", "c_anode": 0.1}\n',
+                    encoding="utf-8")
+    assert main([str(path)]) == 1
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(results) == 4
+    assert results[0]["E_nernst"] == pytest.approx(1.10)
+    assert "JSON" in results[1]["error"]
+    assert "Objekt" in results[2]["error"]
+    assert results[3]["c_anode"] == 0.1 and "error" not in results[3]
+
+
+def test_csv_jobs(calculator):
+    rows = list(read_jobs(["anode,cathode,c_anode\n", "Zn,Cu,\"0,1\"\n", "Zn,Unobtainium,1\n"]))
+    first, second = (calculator.calculate(row) for row in rows)
+    assert first["c_anode"] == 0.1 and first["E_nernst"] > 1.10
+    assert "nicht in der Spannungsreihe" in second["error"]
+
+
+@pytest.mark.parametrize("job", ['"Zn"', "42", "null", '{"anode": ["Zn"], "cathode": "Cu"}', '{"anode": "Zn"}'])
+def test_invalid_jobs_report_errors(calculator, job):
+    assert "error" in calculator.calculate(job)
+
+
+def test_non_finite_inputs_are_job_errors(tmp_path, capsys):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text('{"anode": "Zn", "cathode": "Cu", "c_anode": "nan"}\n'
+                    '{"anode": "Zn", "cathode": "Cu", "temperature": 1e400}\n'
+                    '{"anode": "Zn", "cathode": "Cu", "c_cathode": NaN}\n'
+                    '{"anode": "Zn", "cathode": "Cu", "c_anode": "-Infinity"}\n'
+                    '{"anode": "Zn", "cathode": "Cu", "temperature": 1e308}\n'
+                    '{"anode": "Zn", "cathode": "Cu"}\n', encoding="utf-8")
+    assert main([str(path)]) == 1
+    # Jede Zeile ist gültiges JSON (kein NaN/Infinity)
+    results = [json.loads(line, parse_constant=pytest.fail) for line in capsys.readouterr().out.splitlines()]
+    assert ["error" in result for result in results] == [True] * 5 + [False]
+    assert results[1]["temperature"] == "inf" and "endliche" in results[1]["error"]
+    assert "nicht endlich" in results[4]["error"]  # ΔG = -nF·E läuft bei 1e308 K über
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from discharge import DISCHARGE_COLUMNS, DischargeChunk, DischargeSimulator, write_discharge_csv
+from simulation import F, BatterySimulation
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+
+
+def zinc_copper() -> BatterySimulation:
+    return BatterySimulation(cathode_element_data=SERIES.get_element_data("Cu"),
+                             anode_element_data=SERIES.get_element_data("Zn"))
+
+
+def concatenate(chunks, chunk_type):
+    chunks = list(chunks)
+    return chunk_type(*(np.concatenate(values) for values in zip(*chunks)))
+
+
+def test_discharge_conserves_charge_and_stops_at_depletion():
+    sim = zinc_copper()
+    simulator = DischargeSimulator(sim, volume_anode=0.01, volume_cathode=0.01, conc_anode=0.1,
+                                   conc_cathode=0.1, internal_resistance=0.1)
+    curve = concatenate(simulator.run(current=1.0, t_end=1e6, min_concentration=1e-6, chunk_size=64), DischargeChunk)
+    assert np.all(np.diff(curve.time) > 0)
+    assert np.all(np.diff(curve.voltage) <= 1e-12)  # Entladung: Spannung fällt monoton
+    # Faraday: 1 A über t Sekunden verbraucht t / (2F) mol Cu²⁺
+    np.testing.assert_allclose(curve.conc_cathode, 0.1 - curve.charge / (2 * F * 0.01), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(curve.conc_anode, 0.1 + curve.charge / (2 * F * 0.01), rtol=1e-9)
+    assert curve.conc_cathode[-1] == pytest.approx(1e-6, rel=1e-6)
+    assert curve.voltage[0] == pytest.approx(simulator.open_circuit_voltage(0.1, 0.1) - 0.1)
+
+
+def test_discharge_csv(tmp_path):
+    simulator = DischargeSimulator(zinc_copper(), 1.0, 1.0, 1.0, 1.0)
+    path = tmp_path / "curve.csv"
+    rows = write_discharge_csv(simulator.run(current=0.5, t_end=100.0, chunk_size=3), str(path))
+    lines = path.read_text().splitlines()
+    assert lines[0].split(",") == list(DISCHARGE_COLUMNS)
+    assert len(lines) == rows + 1
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from equilibrium import compute_equilibrium_matrix, solve_equilibrium
+from simulation import F, R, BatterySimulation
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+
+
+def zinc_copper() -> BatterySimulation:
+    return BatterySimulation(cathode_element_data=SERIES.get_element_data("Cu"),
+                             anode_element_data=SERIES.get_element_data("Zn"))
+
+
+def test_zinc_copper_equilibrium():
+    sim = zinc_copper()
+    log_K = sim.n_overall * F * sim.get_standard_cell_voltage() / (R * 298.15)
+    result = solve_equilibrium(log_K, sim.factor_anode_ion, sim.factor_cathode_ion,
+                               conc_anode=0.1, conc_cathode=0.5, volume_anode=2.0, volume_cathode=1.0)
+    assert result.valid
+    # K ~ 1e37: das Kupfer-Ion wird praktisch vollständig verbraucht (0.5 mol), Zink nimmt um 0.25 mol/L zu
+    assert result.extent == pytest.approx(0.5)
+    assert result.conc_anode == pytest.approx(0.1 + 0.5 / 2.0)
+    assert 0 < result.conc_cathode < 1e-36
+    # Im Gleichgewicht ist die Zellspannung null
+    voltage = sim.get_nernst_voltage_from_log_q(float(result.log_conc_anode - result.log_conc_cathode))
+    assert voltage == pytest.approx(0.0, abs=1e-12)
+
+
+def test_reverse_reaction_and_mass_balance():
+    # Kleines K (ln K = 2) mit viel Produkt: die Reaktion läuft rückwärts
+    result = solve_equilibrium(2.0, 1, 1, conc_anode=1.0, conc_cathode=0.01, volume_anode=1.0, volume_cathode=3.0)
+    assert result.extent < 0
+    assert float(result.log_conc_anode - result.log_conc_cathode) == pytest.approx(2.0, abs=1e-10)
+    # Stoffmenge des Ions bleibt erhalten: ΔN_A = -ΔN_K
+    assert (result.conc_anode - 1.0) * 1.0 == pytest.approx(-(result.conc_cathode - 0.01) * 3.0)
+
+
+def test_invalid_inputs_are_masked():
+    result = solve_equilibrium([10.0, np.nan, 10.0, 10.0], 1, 1, [1.0, 1.0, -1.0, 0.0], [1.0, 1.0, 1.0, 0.0])
+    assert result.valid.tolist() == [True, False, False, False]
+    assert np.isnan(result.conc_anode[1:]).all()
+    assert np.isnan(result.extent[1:]).all()
+
+
+def test_matrix_matches_single_pair():
+    matrix = compute_equilibrium_matrix(SERIES, conc_anode=0.1, conc_cathode=0.5, volume_anode=2.0)
+    pair = matrix.get_pair("Zn", "Cu")
+    sim = zinc_copper()
+    log_K = sim.n_overall * F * sim.get_standard_cell_voltage() / (R * 298.15)
+    single = solve_equilibrium(log_K, sim.factor_anode_ion, sim.factor_cathode_ion, 0.1, 0.5, 2.0, 1.0)
+    assert pair["valid"]
+    assert pair["log_K"] == pytest.approx(log_K)
+    assert pair["conc_anode"] == pytest.approx(float(single.conc_anode))
+    assert pair["log_conc_cathode"] == pytest.approx(float(single.log_conc_cathode))
+    assert not matrix.get_pair("Zn", "Zn")["valid"]
+    with pytest.raises(ValueError):
+        matrix.get_pair("Zn", "Unobtainium")
+    with pytest.raises(ValueError):
+        compute_equilibrium_matrix(SERIES, temperature=0.0)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from discharge import DischargeSimulator
+from pack import BatteryPack, PackChunk
+from simulation import F, BatterySimulation
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+
+
+def zinc_copper() -> BatterySimulation:
+    return BatterySimulation(cathode_element_data=SERIES.get_element_data("Cu"),
+                             anode_element_data=SERIES.get_element_data("Zn"))
+
+
+def concatenate(chunks, chunk_type):
+    chunks = list(chunks)
+    return chunk_type(*(np.concatenate(values) for values in zip(*chunks)))
+
+
+def test_single_cell_pack_matches_discharge_simulator():
+    sim = zinc_copper()
+    pack = BatteryPack(sim, 1, 1, conc_anode=0.2, conc_cathode=0.8, internal_resistance=0.05)
+    single = DischargeSimulator(sim, 1.0, 1.0, 0.2, 0.8, internal_resistance=0.05)
+    state = pack.evaluate(current=2.0)
+    assert state.open_circuit_voltage == pytest.approx(single.open_circuit_voltage(0.2, 0.8))
+    assert state.voltage == pytest.approx(single.open_circuit_voltage(0.2, 0.8) - 2.0 * 0.05)
+
+    curve = concatenate(pack.run(current=2.0, dt=10.0, t_end=1000.0), PackChunk)
+    assert curve.time[-1] == 1000.0
+    assert curve.charge[-1] == pytest.approx(2000.0)
+    assert pack.conc_cathode[0, 0] == pytest.approx(0.8 - 2000.0 / (2 * F))
+    assert curve.voltage[-1] == pytest.approx(single.open_circuit_voltage(pack.conc_anode[0, 0],
+                                                                          pack.conc_cathode[0, 0]) - 0.1)
+
+
+def test_series_parallel_pack_splits_current():
+    sim = zinc_copper()
+    pack = BatteryPack(sim, 3, 2, internal_resistance=[[0.01, 0.03]])
+    state = pack.evaluate(current=4.0)
+    # Gleiche Zellspannung: Strom teilt sich umgekehrt proportional zum Innenwiderstand (3:1)
+    np.testing.assert_allclose(state.cell_current, [[3.0, 1.0]] * 3)
+    group_resistance = 1 / (1 / 0.01 + 1 / 0.03)
+    assert state.voltage == pytest.approx(3 * (sim.get_standard_cell_voltage() - 4.0 * group_resistance))
+    # Leerlauf: keine Ausgleichsströme bei identischen Zellen
+    np.testing.assert_allclose(pack.evaluate().cell_current, 0.0, atol=1e-12)
+
+
+def test_pack_with_variation_and_validation():
+    sim = zinc_copper()
+    pack = BatteryPack.with_variation(sim, 4, 3, rel_sigma_conc=0.1, rel_sigma_resistance=0.1, seed=1)
+    assert pack.n_cells == 12
+    state = pack.evaluate(load_resistance=1.0)
+    # Jede Parallelgruppe führt den vollen Packstrom
+    np.testing.assert_allclose(state.cell_current.sum(axis=1), state.current)
+    assert state.voltage == pytest.approx(state.current * 1.0)
+    with pytest.raises(ValueError):
+        BatteryPack(sim, 2, 2, internal_resistance=0.0)
+    with pytest.raises(ValueError):
+        BatteryPack(sim, 2, 1, conc_anode=[1.0, 1.0, 1.0])
+    with pytest.raises(ValueError):
+        pack.set_temperature(-1.0)
@@ -0,0 +1,37 @@
+import pytest
+
+from reactions import compile_reaction, split_charge
+
+
+@pytest.mark.parametrize("reaction, ion, coefficient, electrons", [
+    ("Cu2+ + 2e- -> Cu", "Cu2+", 1, 2),
+    ("2H+ + 2e- -> H2", "H+", 2, 2),
+    ("Au3+ + 3e- → Au", "Au3+", 1, 3),
+])
+def test_compile_reaction(reaction, ion, coefficient, electrons):
+    compiled = compile_reaction(reaction)
+    assert (compiled.ion_species, compiled.ion_coefficient, compiled.electrons) == (ion, coefficient, electrons)
+
+
+def test_oxidation_and_invalid_reactions():
+    assert compile_reaction("2H+ + 2e- -> H2").oxidation == "H2 -> 2H+ + 2e-"
+    assert compile_reaction("Zn2+ + 2e- -> Zn") is compile_reaction("Zn2+ + 2e- -> Zn")  # gecacht
+    with pytest.raises(ValueError):
+        compile_reaction("Zn2+ + 2e-")
+
+
+@pytest.mark.parametrize("reaction, charge", [
+    ("Cu2+ + 2e- -> Cu", 2),           # Ladung aus der Bilanz
+    ("Cu²⁺ + 2e- -> Cu", 2),           # explizit
+    ("2H+ + 2e- -> H2", 1),
+    ("Fe3+ + e- -> Fe2+", None),       # Produkt ebenfalls mehrdeutig
+    ("MnO4- + 8H+ + 5e- -> Mn2+ + 4H2O", None),
+])
+def test_ion_charge(reaction, charge):
+    assert compile_reaction(reaction).ion_charge() == charge
+
+
+def test_split_charge_of_polyatomic_ions():
+    assert split_charge("SO₄²⁻") == ("SO₄", -2)
+    assert split_charge("NH₄+") == ("NH₄", 1)
+    assert split_charge("NO3-") is None
@@ -0,0 +1,107 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from result_store import RESULT_COLUMNS, ResultStore
+
+
+def fill_store(store: ResultStore) -> None:
+    store.append("Zn", "Cu", 0.1, 1.0, 298.15, -2.3, 1.10, 1.13, -212267.0, timestamp=1.0)
+    temperatures = np.linspace(280.0, 320.0, 5)
+    store.append_batch("Li", "Ag", 1.0, 1.0, temperatures, 0.0, 3.84, np.full(5, 3.84), -370502.0, timestamp=2.0)
+    store.append_batch(["Fe", "Zn"], "Cu", [0.5, 0.2], 1.0, 350.0, [-0.7, -1.6], [0.78, 1.10],
+                       [0.79, 1.12], [-150516.0, -212267.0], timestamp=3.0)
+
+
+def test_result_store_round_trip(tmp_path):
+    with ResultStore(str(tmp_path / "store")) as store:
+        fill_store(store)
+        assert len(store) == 8
+        assert store.query()["anode"].size == 0  # noch gepuffert
+    # close() schreibt den Puffer als ein Segment
+
+    reopened = ResultStore(str(tmp_path / "store"))
+    assert [segment.rows for segment in reopened.segments] == [8]
+    everything = reopened.query()
+    assert set(everything) == set(RESULT_COLUMNS)
+    # Einzelzeilen und Blöcke behalten ihre Einfügereihenfolge
+    assert everything["anode"].tolist() == ["Zn"] + ["Li"] * 5 + ["Fe", "Zn"]
+    assert everything["cathode"].tolist() == ["Cu"] + ["Ag"] * 5 + ["Cu", "Cu"]
+    np.testing.assert_array_equal(everything["temperature"][1:6], np.linspace(280.0, 320.0, 5))
+    assert everything["timestamp"].tolist() == [1.0] + [2.0] * 5 + [3.0, 3.0]
+
+    zinc = reopened.query(columns=("conc_anode", "temperature"), anode="Zn")
+    assert zinc["conc_anode"].tolist() == [0.1, 0.2]
+    warm = reopened.query(columns=("anode", "nernst_voltage"), temperature=(300.0, None))
+    assert warm["anode"].tolist() == ["Li", "Li", "Li", "Fe", "Zn"]
+    assert reopened.query(anode="Unobtainium")["anode"].size == 0
+    with pytest.raises(ValueError):
+        reopened.query(columns=("voltage",))
+
+
+def test_result_store_skips_segments_by_index(tmp_path):
+    store = ResultStore(str(tmp_path / "store"), segment_size=3)
+    fill_store(store)
+    store.flush()
+    assert [segment.rows for segment in store.segments] == [3, 3, 2]
+    first, second, third = store.segments
+    bounds = {"temperature": (340.0, None)}
+    assert not store._may_match(first, bounds) and not store._may_match(second, bounds)
+    assert store._may_match(third, bounds)
+    # Übersprungene Segmente werden nicht geöffnet: Löschen ihrer Dateien ändert das Ergebnis nicht
+    for segment in (first, second):
+        for column in RESULT_COLUMNS:
+            os.remove(os.path.join(segment.path, f"{column}.npy"))
+    hot = store.query(columns=("anode",), **bounds)
+    assert hot["anode"].tolist() == ["Fe", "Zn"]
+
+
+def test_two_writers_share_a_directory(tmp_path):
+    path = str(tmp_path / "store")
+    gui, cli = ResultStore(path), ResultStore(path)
+    reader = ResultStore(path)
+    gui.append("Zn", "Cu", 0.1, 1.0, 298.15, -2.3, 1.10, 1.13, -212267.0, timestamp=1.0)
+    cli.append("Li", "Ag", 1.0, 1.0, 298.15, 0.0, 3.84, 3.84, -370502.0, timestamp=2.0)
+    cli.append("Zn", "Ag", 1.0, 1.0, 298.15, 0.0, 1.56, 1.56, -301033.0, timestamp=3.0)
+    cli.flush()
+    gui.flush()  # eigene Codes (Zn=0, Cu=1) müssen auf die bereits gespeicherten abgebildet werden
+    gui.append("Li", "Cu", 1.0, 1.0, 298.15, 0.0, 3.38, 3.38, -326119.0, timestamp=4.0)
+    gui.close()
+
+    # Der Leser lädt neue Segmente und Namen selbst nach
+    rows = reader.query(columns=("anode", "cathode", "timestamp"))
+    order = np.argsort(rows["timestamp"])
+    assert rows["anode"][order].tolist() == ["Zn", "Li", "Zn", "Li"]
+    assert rows["cathode"][order].tolist() == ["Cu", "Ag", "Ag", "Cu"]
+    assert len(reader.segments) == 3
+    assert sorted(reader.names) == ["Ag", "Cu", "Li", "Zn"]
+    assert reader.query(anode="Li", cathode="Cu")["timestamp"].tolist() == [4.0]
+
+
+def test_concurrent_flushes_do_not_collide(tmp_path):
+    path = str(tmp_path / "store")
+    errors = []
+
+    def writer(index: int) -> None:
+        try:
+            store = ResultStore(path)
+            for round_index in range(20):
+                store.append(f"A{index}", f"K{round_index % 3}", 1.0, 1.0, 298.15, 0.0, 1.0, 1.0, 0.0,
+                             timestamp=index * 100 + round_index)
+                store.flush()
+        except Exception as error:  # noqa: BLE001 - im Hauptthread prüfen
+            errors.append(error)
+
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+    rows = ResultStore(path).query(columns=("anode", "cathode", "timestamp"))
+    assert len(rows["timestamp"]) == 80
+    expected = [(f"A{int(t) // 100}", f"K{int(t) % 100 % 3}") for t in rows["timestamp"]]
+    assert list(zip(rows["anode"].tolist(), rows["cathode"].tolist())) == expected
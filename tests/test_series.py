@@ -0,0 +1,62 @@
+import pytest
+
+from equilibrium import compute_equilibrium_matrix
+from screening import compute_cell_matrix, compute_specific_energy
+from simulation import SimulationCache
+from utils import ElectrochemicalSeries
+
+IRON = [
+    {"element": "Fe", "reaction": "Fe2+ + 2e- -> Fe", "E0": -0.44, "n": 2, "ion_formula": "Fe²⁺", "color": "#808080"},
+    {"element": "Fe", "reaction": "Fe3+ + e- -> Fe2+", "E0": 0.77, "n": 1, "ion_formula": "Fe³⁺", "color": "#808080"},
+    {"element": "Zn", "reaction": "Zn2+ + 2e- -> Zn", "E0": -0.76, "n": 2, "ion_formula": "Zn²⁺", "color": "#A9A9A9"},
+]
+
+
+def test_element_names_are_unique_per_half_reaction():
+    series = ElectrochemicalSeries(IRON)
+    names = series.get_element_names()
+    assert names == ["Zn", "Fe (Fe2+ + 2e- -> Fe)", "Fe (Fe3+ + e- -> Fe2+)"]
+    assert series.get_element_data(names[2])["E0"] == 0.77
+    # Der reine Elementname bleibt gültig und meint die erste Halbreaktion
+    assert series.get_element_data("Fe")["E0"] == -0.44
+    with pytest.raises(ValueError):
+        series.get_element_data("Cu")
+
+
+def test_duplicate_half_reactions_get_a_counter():
+    series = ElectrochemicalSeries(IRON + IRON[:1])
+    assert len(set(series.get_element_names())) == 4
+    assert "Fe (Fe2+ + 2e- -> Fe) #2" in series.get_element_names()
+
+
+def test_labels_reach_screening_and_equilibrium(tmp_path):
+    series = ElectrochemicalSeries(IRON)
+    matrix = compute_cell_matrix(series)
+    assert len(set(matrix.elements)) == 3
+    ferric = "Fe (Fe3+ + e- -> Fe2+)"
+    assert compute_equilibrium_matrix(series).get_pair("Zn", ferric)["valid"]
+    assert SimulationCache(series).get("Zn", ferric).get_standard_cell_voltage() == pytest.approx(1.53)
+
+    # Molare Massen gelten je Element für alle seine Halbreaktionen
+    table = compute_specific_energy(series, {"Fe": 55.845, "Zn": 65.38})
+    assert set(table["cathode"].tolist()) == {"Fe (Fe2+ + 2e- -> Fe)", ferric}
+
+    path = str(tmp_path / "series.bin")
+    series.save_snapshot(path)
+    assert ElectrochemicalSeries.from_snapshot(path).get_element_names() == series.get_element_names()
+
+
+def test_specific_energy_filter_and_top():
+    series = ElectrochemicalSeries(IRON)
+    table = compute_specific_energy(series, {"Fe": 55.845, "Zn": 65.38}, include_negative=True)
+    ferric = "Fe (Fe3+ + e- -> Fe2+)"
+    # Ein Generator darf nur einmal durchlaufen werden und muss trotzdem für alle Elemente gelten
+    filtered = table.filter(cathodes=(name for name in ["Fe (Fe2+ + 2e- -> Fe)", ferric]))
+    assert set(filtered["cathode"].tolist()) == {"Fe (Fe2+ + 2e- -> Fe)", ferric}
+    assert len(filtered) == len(table.filter(cathodes=["Fe (Fe2+ + 2e- -> Fe)", ferric]))
+    assert table.top(1, by="capacity")["capacity"][0] == table.sort("capacity")["capacity"][0]
+    for by in ("anode", "unknown"):
+        with pytest.raises(ValueError):
+            table.top(3, by=by)
+        with pytest.raises(ValueError):
+            table.sort(by)
@@ -0,0 +1,47 @@
+import pytest
+
+from activity import parse_ion_charge
+from series_pipeline import normalize_row, split_charge
+
+
+def scraped(oxidized: str, reduced: str, potential: str = "+0,34", element: str = "X") -> dict:
+    return {"Element": element, "oxidierte Form": oxidized, "Pfeil": "⇌",
+            "reduzierte Form": reduced, "E° (V)": potential}
+
+
+@pytest.mark.parametrize("species, expected", [
+    ("Cu²⁺", ("Cu", 2)),
+    ("MnO₄⁻", ("MnO₄", -1)),
+    ("SO₄²⁻", ("SO₄", -2)),
+    ("Fe^3+", ("Fe", 3)),
+    ("Fe^{3+}", ("Fe", 3)),
+    ("Fe 3+", ("Fe", 3)),
+    ("Li+", ("Li", 1)),
+    ("Cl-", ("Cl", -1)),
+    ("H₂O", ("H₂O", 0)),
+    ("NO3-", None),   # Index oder Ladung?
+    ("Cu2+", None),
+])
+def test_split_charge_only_accepts_explicit_notation(species, expected):
+    assert split_charge(species) == expected
+
+
+def test_normalize_row_with_superscripts():
+    entry = normalize_row(scraped("MnO₄⁻ + 8 H⁺ + 5 e⁻", "Mn²⁺ + 4 H₂O", "+1,51", "Mn"))
+    assert entry["n"] == 5
+    assert entry["E0"] == 1.51
+    assert entry["ion_formula"] == "MnO₄-"
+    assert parse_ion_charge(entry["ion_formula"]) == -1
+
+
+def test_normalize_row_derives_electrons_from_charges():
+    entry = normalize_row(scraped("Fe^3+", "Fe^2+", "+0,77", "Fe"))
+    assert entry["n"] == 1
+    assert entry["ion_formula"] == "Fe³⁺"
+    assert entry["reaction"] == "Fe^3+ + 1e- -> Fe^2+"
+
+
+def test_ambiguous_rows_are_skipped():
+    assert normalize_row(scraped("NO3- + 2 e-", "NO2-")) is None
+    assert normalize_row(scraped("Cu2+", "Cu")) is None
+    assert normalize_row(scraped("Cu²⁺ + 2 e−", "Cu", "+0,34", "Cu"))["ion_formula"] == "Cu²⁺"
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from series_snapshot import load_series_snapshot, write_series_snapshot
+from simulation import BatterySimulation
+from utils import ElectrochemicalSeries
+
+
+def test_snapshot_round_trip(tmp_path):
+    series = ElectrochemicalSeries()
+    path = str(tmp_path / "series.bin")
+    series.save_snapshot(path)
+    loaded = ElectrochemicalSeries.from_snapshot(path)
+
+    assert len(loaded) == len(series)
+    assert loaded.get_element_names() == series.get_element_names()
+    for original, row in zip(series.series, loaded.series):
+        assert row["element"] == original["element"]
+        assert row["reaction"] == original["reaction"]
+        assert row["ion_formula"] == original["ion_formula"]
+        assert row["E0"] == original["E0"]
+        assert row["n"] == original["n"]
+        assert row["dE0_dT"] == original.get("dE0_dT", 0.0)
+    for field in ("E0", "n", "dE0_dT", "d2E0_dT2"):
+        np.testing.assert_array_equal(getattr(loaded.columns, field), getattr(series.columns, field))
+
+    # Simulationen aus dem Snapshot rechnen identisch, auch mit Temperaturkoeffizienten
+    original = BatterySimulation(series.get_element_data("Cu"), series.get_element_data("Zn"))
+    restored = BatterySimulation(loaded.get_element_data("Cu"), loaded.get_element_data("Zn"))
+    assert restored.get_standard_cell_voltage(330.0) == original.get_standard_cell_voltage(330.0)
+
+
+def test_snapshot_rejects_foreign_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"NOTASNAP" + bytes(64))
+    with pytest.raises(ValueError):
+        load_series_snapshot(str(path))
+
+
+def test_snapshot_of_empty_series(tmp_path):
+    path = str(tmp_path / "empty.bin")
+    write_series_snapshot([], path)
+    assert len(load_series_snapshot(path)) == 0
+
+
+def test_version_1_snapshot_reads_zero_temperature_coefficients(tmp_path, monkeypatch):
+    import series_snapshot
+    legacy_dtype = np.dtype([(name, series_snapshot.RECORD_DTYPE[name]) for name in
+                             ("element", "reaction", "ion_formula", "color", "E0", "n")])
+    monkeypatch.setattr(series_snapshot, "RECORD_DTYPE", legacy_dtype)
+    monkeypatch.setattr(series_snapshot, "SNAPSHOT_VERSION", 1)
+    path = str(tmp_path / "v1.bin")
+    ElectrochemicalSeries().save_snapshot(path)
+    monkeypatch.undo()
+
+    assert load_series_snapshot(path).header["version"] == 1
+    loaded = ElectrochemicalSeries.from_snapshot(path)
+    assert loaded.get_element_data("Zn")["dE0_dT"] == 0.0
+    assert not loaded.columns.dE0_dT.any()
+    sim = BatterySimulation(loaded.get_element_data("Cu"), loaded.get_element_data("Zn"))
+    assert sim.get_standard_cell_voltage(330.0) == pytest.approx(1.10)
+
+
+def test_snapshot_rejects_unknown_versions(tmp_path, monkeypatch):
+    import series_snapshot
+    monkeypatch.setattr(series_snapshot, "SNAPSHOT_VERSION", 99)
+    path = str(tmp_path / "future.bin")
+    write_series_snapshot(ElectrochemicalSeries().series, path)
+    with pytest.raises(ValueError, match="Version 99"):
+        load_series_snapshot(path)
@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+import pytest
+
+from simulation import F, BatterySimulation
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+PAIRS = [("Zn", "Cu"), ("Li", "Ag"), ("Al", "Au"), ("H", "Cu"), ("Cu", "Zn")]
+CONCENTRATIONS = [1e-6, 1e-3, 0.1, 1.0, 3.0]
+TEMPERATURES = [250.0, 298.15, 310.0, 350.0]
+
+
+def make_simulation(anode: str, cathode: str) -> BatterySimulation:
+    return BatterySimulation(cathode_element_data=SERIES.get_element_data(cathode),
+                             anode_element_data=SERIES.get_element_data(anode))
+
+
+def logs_agree(*concentrations) -> "np.ndarray":
+    """Maske der Punkte, an denen np.log und math.log identisch runden (nur dort ist Bitgleichheit möglich)."""
+    agree = True
+    for values in concentrations:
+        agree = agree & (np.log(values) == np.vectorize(math.log)(values))
+    return agree
+
+
+@pytest.mark.parametrize("anode, cathode", PAIRS)
+def test_batch_matches_scalar(anode, cathode):
+    sim = make_simulation(anode, cathode)
+    c_a, c_k, temp = np.meshgrid(CONCENTRATIONS, CONCENTRATIONS, TEMPERATURES, indexing="ij")
+    result = sim.get_nernst_voltage_batch(c_a, c_k, temp)
+    assert result.valid.all()
+    log_q = np.vectorize(sim.get_log_reaction_quotient)(c_a, c_k, temp)
+    voltage = np.vectorize(sim.get_nernst_voltage_from_log_q)(log_q, temp)
+    exact = logs_agree(c_a, c_k)
+    assert exact.any()
+    np.testing.assert_array_equal(result.log_reaction_quotient[exact], log_q[exact])
+    np.testing.assert_array_equal(result.nernst_voltage[exact], voltage[exact])
+    np.testing.assert_array_equal(result.delta_G[exact], -sim.n_overall * F * voltage[exact])
+    # Sonst unterscheiden sich nur die log-Routinen in der letzten Stelle
+    np.testing.assert_allclose(result.nernst_voltage, voltage, rtol=1e-14, atol=0)
+
+
+def test_batch_marks_invalid_points():
+    sim = make_simulation("Zn", "Cu")
+    conc_anode = np.array([1.0, 0.0, -1.0, 1.0, 1.0, 0.5])
+    conc_cathode = np.array([1.0, 1.0, 1.0, 0.0, 1.0, 0.5])
+    temperature = np.array([298.15, 298.15, 298.15, 298.15, 0.0, -10.0])
+    result = sim.get_nernst_voltage_batch(conc_anode, conc_cathode, temperature)
+    assert result.valid.tolist() == [True, False, False, False, False, False]
+    for values in (result.reaction_quotient, result.nernst_voltage, result.delta_G, result.log_reaction_quotient):
+        assert np.isnan(values[1:]).all()
+    assert result.nernst_voltage[0] == pytest.approx(sim.get_standard_cell_voltage())
+    # Der Skalarpfad wirft für dieselben Punkte eine Exception
+    with pytest.raises(ValueError):
+        sim.get_log_reaction_quotient(0.0, 1.0)
+    with pytest.raises(ValueError):
+        sim.get_nernst_voltage_from_log_q(0.0, 0.0)
+
+
+def test_extreme_concentrations_stay_finite_in_log_space():
+    sim = make_simulation("Al", "Au")  # n = 3, f_A = f_K = 1
+    log_q = sim.get_log_reaction_quotient(1e-300, 1e300)
+    assert log_q == pytest.approx(-600 * math.log(10))
+    assert math.isfinite(sim.get_nernst_voltage_from_log_q(log_q))
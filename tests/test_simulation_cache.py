@@ -0,0 +1,15 @@
+from simulation import SimulationCache
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+
+
+def test_simulation_cache_reuses_instances():
+    cache = SimulationCache(SERIES, maxsize=2)
+    sim = cache.get("Zn", "Cu")
+    assert cache.get("Zn", "Cu") is sim
+    cache.get("Li", "Ag")
+    cache.get("Fe", "Ag")  # verdrängt Zn/Cu
+    assert cache.get("Zn", "Cu") is not sim
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 4, 2)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from activity import ActivityModel
+from simulation import BatterySimulation
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+
+
+def make_simulation(anode: str, cathode: str, activity_model=None) -> BatterySimulation:
+    return BatterySimulation(cathode_element_data=SERIES.get_element_data(cathode),
+                             anode_element_data=SERIES.get_element_data(anode),
+                             activity_model=activity_model)
+
+
+@pytest.mark.parametrize("activity_model", [None, ActivityModel("extended_debye_huckel")],
+                         ids=["ideal", "extended_debye_huckel"])
+def test_solve_concentrations_round_trip(activity_model):
+    sim = make_simulation("Zn", "Cu", activity_model)
+    conc = np.array([1e-4, 1e-2, 0.3, 2.0])[:, np.newaxis]
+    temp = np.array([280.0, 298.15, 330.0])[np.newaxis, :]
+    target = sim.get_nernst_voltage_batch(conc, 0.5, temp).nernst_voltage
+
+    solved = sim.solve_concentrations(target, temp, conc_cathode=0.5)
+    assert solved.feasible.all()
+    np.testing.assert_allclose(solved.conc_anode, np.broadcast_to(conc, solved.conc_anode.shape), rtol=1e-9)
+    np.testing.assert_allclose(sim.get_nernst_voltage_batch(solved.conc_anode, 0.5, temp).nernst_voltage,
+                               target, rtol=0, atol=1e-12)
+
+    solved = sim.solve_concentrations(target, temp, conc_anode=conc)
+    np.testing.assert_allclose(solved.conc_cathode, 0.5, rtol=1e-9)
+
+
+def test_solve_concentrations_flags_infeasible_targets():
+    sim = make_simulation("Zn", "Cu")
+    solved = sim.solve_concentrations([1.10, 5.0, 1.10], temperature=[298.15, 298.15, -1.0])
+    assert solved.feasible.tolist() == [True, False, False]
+    assert np.isnan(solved.conc_anode[2])
+    with pytest.raises(ValueError):
+        sim.solve_concentrations(1.1, conc_anode=1.0, conc_cathode=1.0)
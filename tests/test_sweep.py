@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+import pytest
+
+from result_store import ResultStore
+from simulation import F, BatterySimulation
+from sweep import ParameterSweep
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+PAIRS = [("Zn", "Cu"), ("Li", "Ag")]
+TEMPERATURES = [280.0, 298.15, 320.0]
+CONC_ANODE = [0.0, 0.01, 1.0]  # 0 ergibt ungültige Punkte
+CONC_CATHODE = [0.1, 1.0]
+
+
+def make_sweep(output_dir: str, chunk_size: int = 5) -> ParameterSweep:
+    return ParameterSweep(SERIES, PAIRS, TEMPERATURES, CONC_ANODE, CONC_CATHODE, output_dir, chunk_size=chunk_size)
+
+
+def test_sweep_matches_batch_and_resumes(tmp_path):
+    output_dir = str(tmp_path / "sweep")
+    sweep = make_sweep(output_dir)
+    assert sweep.total_chunks == 2 * 4  # 18 Punkte je Paar in Blöcken zu 5
+    assert sweep.run(max_workers=2) == sweep.total_chunks
+    merged = sweep.merge()
+
+    for pair_index, (anode, cathode) in enumerate(PAIRS):
+        sim = BatterySimulation(SERIES.get_element_data(cathode), SERIES.get_element_data(anode))
+        temp, c_a, c_k = (grid.ravel() for grid in np.meshgrid(TEMPERATURES, CONC_ANODE, CONC_CATHODE, indexing="ij"))
+        expected = sim.get_nernst_voltage_batch(c_a, c_k, temp)
+        rows = merged["pair_index"] == pair_index
+        np.testing.assert_array_equal(merged["valid"][rows], expected.valid)
+        np.testing.assert_array_equal(merged["nernst_voltage"][rows], expected.nernst_voltage)
+
+    # Fortsetzen: nur der gelöschte Block wird neu berechnet
+    os.remove(os.path.join(output_dir, "chunk_000003.npz"))
+    assert not sweep.is_complete()
+    assert sweep.run(max_workers=1) == 1
+    np.testing.assert_array_equal(sweep.merge()["nernst_voltage"], merged["nernst_voltage"])
+
+    # Ein anderer Sweep darf das Verzeichnis nicht weiterverwenden
+    with pytest.raises(ValueError):
+        make_sweep(output_dir, chunk_size=7).run()
+
+
+def test_sweep_export_to_store(tmp_path):
+    sweep = make_sweep(str(tmp_path / "sweep"))
+    sweep.run(max_workers=1)
+    merged = sweep.merge()
+    with ResultStore(str(tmp_path / "store")) as store:
+        rows = sweep.export_to_store(store)
+        assert rows == int(merged["valid"].sum())
+        exported = store.query()
+    np.testing.assert_array_equal(exported["nernst_voltage"], merged["nernst_voltage"][merged["valid"]])
+    assert exported["anode"].tolist() == [PAIRS[i][0] for i in merged["pair_index"][merged["valid"]]]
+    assert (exported["conc_anode"] > 0).all()
+    # E⁰ und ΔG⁰ gelten bei der Temperatur der jeweiligen Zeile
+    for anode, cathode in PAIRS:
+        sim = BatterySimulation(SERIES.get_element_data(cathode), SERIES.get_element_data(anode))
+        rows = exported["anode"] == anode
+        expected = [sim.get_standard_cell_voltage(t) for t in exported["temperature"][rows]]
+        np.testing.assert_allclose(exported["E0_cell"][rows], expected, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(exported["delta_G0"][rows], -sim.n_overall * F * np.array(expected))
+    assert len(np.unique(exported["E0_cell"][exported["anode"] == "Zn"])) == len(TEMPERATURES)
+
+
+def test_incomplete_sweep_cannot_be_merged(tmp_path):
+    sweep = make_sweep(str(tmp_path / "sweep"))
+    with pytest.raises(ValueError):
+        sweep.merge()
+
+
+def test_export_stores_half_reaction_labels(tmp_path):
+    series = ElectrochemicalSeries([
+        {"element": "Fe", "reaction": "Fe2+ + 2e- -> Fe", "E0": -0.44, "n": 2, "ion_formula": "Fe²⁺"},
+        {"element": "Fe", "reaction": "Fe3+ + e- -> Fe2+", "E0": 0.77, "n": 1, "ion_formula": "Fe³⁺"},
+        {"element": "Zn", "reaction": "Zn2+ + 2e- -> Zn", "E0": -0.76, "n": 2, "ion_formula": "Zn²⁺"},
+    ])
+    pairs = [("Zn", "Fe"), ("Zn", "Fe (Fe3+ + e- -> Fe2+)")]
+    sweep = ParameterSweep(series, pairs, [298.15], [1.0], [1.0], str(tmp_path / "sweep"))
+    sweep.run(max_workers=1)
+    with ResultStore(str(tmp_path / "store")) as store:
+        sweep.export_to_store(store)
+        exported = store.query(columns=("cathode", "E0_cell"))
+    # Der reine Elementname wird als Bezeichnung seiner ersten Halbreaktion gespeichert
+    assert exported["cathode"].tolist() == ["Fe (Fe2+ + 2e- -> Fe)", "Fe (Fe3+ + e- -> Fe2+)"]
+    np.testing.assert_allclose(exported["E0_cell"], [0.32, 1.53])
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from screening import compute_cell_matrix
+from simulation import BatterySimulation
+from temperature import T_REF, get_e0_table
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+
+
+def test_temperature_table_matches_polynomial():
+    table = get_e0_table(1.10, -0.1e-3, 2e-6)
+    assert table(T_REF) == 1.10
+    temperatures = np.linspace(210.0, 490.0, 57)
+    exact = [table.polynomial(t) for t in temperatures]
+    # Lineare Interpolation eines Polynoms 2. Grades: Fehler <= d2E0_dT2 * step² / 8
+    np.testing.assert_allclose(table.lookup_batch(temperatures), exact, rtol=0, atol=1e-7)
+    # Außerhalb des Gitters wird das Polynom direkt ausgewertet
+    assert table(600.0) == pytest.approx(table.polynomial(600.0))
+    assert table.lookup_batch(np.array([600.0]))[0] == pytest.approx(table.polynomial(600.0))
+
+
+def test_standard_cell_voltage_follows_temperature_coefficients():
+    sim = BatterySimulation(SERIES.get_element_data("Cu"), SERIES.get_element_data("Zn"))
+    slope = SERIES.get_element_data("Cu")["dE0_dT"] - SERIES.get_element_data("Zn")["dE0_dT"]
+    assert sim.get_standard_cell_voltage() == pytest.approx(1.10)
+    assert sim.get_standard_cell_voltage(348.15) == pytest.approx(1.10 + 50 * slope)
+
+
+@pytest.mark.parametrize("temperature", [250.0, 298.15, 310.3, 372.0, 600.0])
+def test_cell_matrix_uses_the_simulation_tables(temperature):
+    # Eine Spezies mit zweiter Ableitung: dort unterscheiden sich Interpolation und Polynom
+    series = ElectrochemicalSeries(SERIES.series + [
+        {"element": "X", "reaction": "X2+ + 2e- -> X", "E0": 0.1, "dE0_dT": 0.4e-3, "d2E0_dT2": 3e-5,
+         "n": 2, "ion_formula": "X²⁺"}])
+    matrix = compute_cell_matrix(series, temperature)
+    names = series.columns.labels
+    for a, anode in enumerate(names):
+        for c, cathode in enumerate(names):
+            if a == c:
+                continue
+            sim = BatterySimulation(series.get_element_data(cathode), series.get_element_data(anode))
+            assert matrix.E0_cell[a, c] == sim.get_standard_cell_voltage(temperature)
+            assert matrix.delta_G0[a, c] == sim.get_delta_G0(temperature)
@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+import pytest
+
+from activity import ActivityModel
+from simulation import F, BatterySimulation
+from uncertainty import StreamingQuantiles
+from utils import ElectrochemicalSeries
+
+SERIES = ElectrochemicalSeries()
+
+
+def make_simulation(anode: str, cathode: str, activity_model=None) -> BatterySimulation:
+    return BatterySimulation(cathode_element_data=SERIES.get_element_data(cathode),
+                             anode_element_data=SERIES.get_element_data(anode),
+                             activity_model=activity_model)
+
+
+def test_uncertainty_is_reproducible_and_centered():
+    sim = make_simulation("Zn", "Cu")
+    kwargs = dict(n_samples=200_000, seed=42, sigma_E0=0.01, rel_sigma_conc=0.05, sigma_temperature=0.5)
+    first = sim.get_nernst_uncertainty(0.1, 1.0, batch_size=50_000, **kwargs)
+    second = sim.get_nernst_uncertainty(0.1, 1.0, batch_size=80_000, **kwargs)
+    expected = sim.get_nernst_voltage_from_log_q(sim.get_log_reaction_quotient(0.1, 1.0))
+
+    assert first.n_samples == 200_000
+    assert first.mean_E == pytest.approx(second.mean_E, abs=1e-12)
+    assert first.mean_E == pytest.approx(expected, abs=2e-4)
+    # Zwei unabhängige E⁰ mit sigma 0.01 dominieren: sigma_E ≈ sqrt(2) * 0.01
+    assert first.std_E == pytest.approx(math.sqrt(2) * 0.01, rel=0.05)
+    assert first.quantiles_E[0.025] < first.quantiles_E[0.5] < first.quantiles_E[0.975]
+    assert first.mean_delta_G == pytest.approx(-sim.n_overall * F * first.mean_E)
+
+
+@pytest.mark.filterwarnings("error")
+def test_uncertainty_discards_non_positive_temperatures_without_warnings():
+    # Mit sigma_T = T werden viele Stichproben <= 0 K gezogen; sie dürfen weder E⁰(T) noch A(T)/B(T) erreichen
+    sim = make_simulation("Zn", "Cu", ActivityModel("davies"))
+    with np.errstate(all="raise"):
+        result = sim.get_nernst_uncertainty(0.1, 1.0, temperature=5.0, sigma_temperature=5.0,
+                                            n_samples=20_000, batch_size=5_000, seed=1)
+    assert 0 < result.n_samples < 20_000
+    assert np.isfinite(result.mean_E) and np.isfinite(result.std_E)
+
+
+def test_quantiles_do_not_depend_on_batch_size():
+    # Der Histogrammbereich folgt aus den ersten Stichproben, nicht aus dem ersten Block
+    sim = make_simulation("Zn", "Cu")
+    results = [sim.get_nernst_uncertainty(0.1, 1.0, n_samples=12_000, batch_size=batch_size, seed=3)
+               for batch_size in (1, 777, 12_000)]
+    for result in results[1:]:
+        assert result.quantiles_E == results[0].quantiles_E
+        assert result.mean_E == pytest.approx(results[0].mean_E, abs=1e-12)
+    low, median, high = (results[0].quantiles_E[q] for q in (0.025, 0.5, 0.975))
+    assert low < median - 0.02 and high > median + 0.02  # sigma_E ≈ 0.014 V
+
+
+def test_streaming_quantiles_with_fewer_values_than_the_pilot():
+    values = np.random.default_rng(0).standard_normal(500)
+    stream = StreamingQuantiles(bins=4096)
+    for block in np.array_split(values, 50):
+        stream.update(block)
+    assert stream.count == 0  # noch im Pilotpuffer
+    assert stream.quantile(0.5) == pytest.approx(np.quantile(values, 0.5), abs=0.01)
+    assert stream.count == 500 and stream.underflow == stream.overflow == 0
@@ -0,0 +1,74 @@
+import threading
+
+from worker import ComputationWorker
+
+
+class FakeRoot:
+    """Ersetzt den Tk-Mainloop: `after`-Callbacks werden gesammelt und von Hand ausgeführt."""
+    def __init__(self) -> None:
+        self.callbacks = []
+
+    def after(self, delay_ms, callback):
+        self.callbacks.append(callback)
+        return len(self.callbacks)
+
+    def after_cancel(self, poll_id):
+        pass
+
+    def run_pending(self) -> None:
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+def wait_for(worker: ComputationWorker, root: FakeRoot) -> None:
+    while worker._outstanding:
+        worker._executor.submit(lambda: None).result()  # Worker-Thread hat alle Aufträge abgearbeitet
+        root.run_pending()
+
+
+def test_cancel_drops_late_result():
+    root = FakeRoot()
+    worker = ComputationWorker(root)
+    started, release = threading.Event(), threading.Event()
+    results = []
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "late"
+
+    worker.submit("first", slow, results.append, results.append)
+    queued = []
+    worker.submit("second", lambda: "queued", queued.append, queued.append)
+    started.wait(5)
+    worker.cancel()  # z. B. reset_outputs während "first" noch läuft
+    release.set()
+    wait_for(worker, root)
+    assert results == [] and queued == []
+    assert not worker.is_busy()
+
+    # Nach dem Abbruch wird derselbe Schlüssel wieder berechnet
+    assert worker.submit("first", lambda: "fresh", results.append, results.append)
+    wait_for(worker, root)
+    assert results == ["fresh"]
+    worker.shutdown()
+
+
+def test_duplicate_keys_are_coalesced_and_errors_reported():
+    root = FakeRoot()
+    worker = ComputationWorker(root)
+    results, errors = [], []
+    assert worker.submit("key", lambda: 1, results.append, errors.append)
+    assert not worker.submit("key", lambda: 2, results.append, errors.append)
+    wait_for(worker, root)
+    assert results == [1]
+
+    assert worker.submit("bad", lambda: 1 / 0, results.append, errors.append)
+    wait_for(worker, root)
+    assert isinstance(errors[0], ZeroDivisionError)
+    # Fehler werden nicht zwischengespeichert: derselbe Schlüssel darf erneut laufen
+    assert worker.submit("bad", lambda: 3, results.append, errors.append)
+    wait_for(worker, root)
+    assert results == [1, 3]
+    worker.shutdown()